@@ -0,0 +1,63 @@
+"""Minimal local SSL Labs API replacement serving the test fixtures."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from urllib.parse import urlsplit
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "test_data"
+API_CALLS = {
+    "analyze": "analyze",
+    "getEndpointData": "endpoint",
+    "getRootCertsRaw": "root_certs",
+    "getStatusCodes": "status_codes",
+    "info": "info",
+}
+
+
+class FixtureServer:
+    """HTTP/1.1 keep-alive server answering API calls with the fixtures and counting connections."""
+
+    def __init__(self) -> None:
+        """Initialize server."""
+        self.connections = 0
+        self.requests = 0
+        self._bodies = {call: (FIXTURES / f"{fixture}.json").read_bytes() for call, fixture in API_CALLS.items()}
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use instead of the SSL Labs API."""
+        assert self._server
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api/v3/"
+
+    async def __aenter__(self) -> FixtureServer:  # noqa: PYI034
+        """Start serving."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop serving."""
+        assert self._server
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while request := await reader.readuntil(b"\r\n\r\n"):
+                self.requests += 1
+                path = urlsplit(request.split(b" ", 2)[1].decode()).path
+                body = self._bodies.get(path.rsplit("/", 1)[-1], b"{}")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"X-Max-Assessments: 25\r\nX-Current-Assessments: 0\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(body), body),
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
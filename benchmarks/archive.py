@@ -0,0 +1,76 @@
+"""Compare the binary form of data classes with JSON on the fixtures of the unittests."""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import timeit
+import zlib
+from typing import Any
+
+from _server import FIXTURES
+from dacite import from_dict
+
+from ssllabs.archive import dump, load
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.data.host import HostData
+from ssllabs.data.info import InfoData
+from ssllabs.data.status_codes import StatusCodesData
+from ssllabs.decoder import decode
+
+DATA_CLASSES = {
+    "analyze": HostData,
+    "analyze_running": HostData,
+    "endpoint": EndpointData,
+    "info": InfoData,
+    "status_codes": StatusCodesData,
+}
+
+
+def _dump_json(instance: Any) -> bytes:
+    """Serialize a data class like an archive of JSON responses would."""
+    return json.dumps(dataclasses.asdict(instance), separators=(",", ":")).encode()
+
+
+def _read_all(value: Any) -> Any:
+    """Read every field, so lazy fields are decoded like load does right away."""
+    if dataclasses.is_dataclass(value):
+        for field in dataclasses.fields(value):
+            _read_all(getattr(value, field.name))
+    elif isinstance(value, list):
+        for item in value:
+            _read_all(item)
+    return value
+
+
+def main(number: int) -> None:
+    """Run benchmark."""
+    print(
+        f"{'fixture':16s} {'JSON':>7s} {'binary':>7s} {'JSON, zlib':>11s} {'binary, zlib':>13s}"
+        f" {'JSON write':>11s} {'dump':>11s} {'from_dict':>11s} {'decode':>11s} {'load':>11s}",
+    )
+    for fixture, data_class in DATA_CLASSES.items():
+        instance = decode(data_class, json.loads((FIXTURES / f"{fixture}.json").read_bytes()))
+        dataclasses.asdict(instance)
+        as_json = _dump_json(instance)
+        binary = dump(instance)
+        assert load(data_class, binary) == instance == _read_all(decode(data_class, json.loads(as_json)))
+
+        timings = [
+            timeit.timeit(lambda: _dump_json(instance), number=number),  # noqa: B023
+            timeit.timeit(lambda: dump(instance), number=number),  # noqa: B023
+            timeit.timeit(lambda: from_dict(data_class, json.loads(as_json)), number=number),  # noqa: B023
+            timeit.timeit(lambda: _read_all(decode(data_class, json.loads(as_json))), number=number),  # noqa: B023
+            timeit.timeit(lambda: load(data_class, binary), number=number),  # noqa: B023
+        ]
+        print(
+            f"{fixture:16s} {len(as_json):7d} {len(binary):7d} {len(zlib.compress(as_json)):11d}"
+            f" {len(zlib.compress(binary)):13d}" + "".join(f" {timing / number * 1000:8.3f} ms" for timing in timings),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200, help="number of written and read instances per fixture")
+    main(parser.parse_args().number)
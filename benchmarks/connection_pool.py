@@ -0,0 +1,39 @@
+"""Compare a client per request with the pooled client of Ssllabs."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from _server import FixtureServer
+
+from ssllabs import Ssllabs
+
+
+async def _run(ssllabs: Ssllabs, requests: int) -> float:
+    """Query the info endpoint sequentially and return the mean latency in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(requests):
+        await ssllabs.info()
+    return (time.perf_counter() - start) / requests * 1000
+
+
+async def main(requests: int) -> None:
+    """Run benchmark."""
+    async with FixtureServer() as server:
+        with patch("ssllabs.api._api.SSLLABS_URL", server.url):
+            latency = await _run(Ssllabs(), requests)
+            print(f"client per request: {server.connections:5d} connections, {latency:.3f} ms per request")
+
+            server.connections = 0
+            async with Ssllabs() as ssllabs:
+                latency = await _run(ssllabs, requests)
+            print(f"pooled client:      {server.connections:5d} connections, {latency:.3f} ms per request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500, help="number of sequential requests")
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,44 @@
+"""Compare dacite with the generated decoders on the endpoint fixture."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+from _server import FIXTURES
+from dacite import from_dict
+
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.decoder import decode, set_lazy_decoding
+
+
+def _decode_all(data: dict[str, Any]) -> EndpointData:
+    """Decode an endpoint and read the lazily decoded fields."""
+    endpoint = decode(EndpointData, data)
+    assert endpoint.details
+    _ = endpoint.details.certChains, endpoint.details.suites, endpoint.details.sims
+    return endpoint
+
+
+def main(number: int) -> None:
+    """Run benchmark."""
+    data = json.loads((FIXTURES / "endpoint.json").read_text())
+    assert decode(EndpointData, data) == from_dict(data_class=EndpointData, data=data)
+
+    dacite = timeit.timeit(lambda: from_dict(data_class=EndpointData, data=data), number=number) / number * 1000
+    generated = timeit.timeit(lambda: _decode_all(data), number=number) / number * 1000
+    set_lazy_decoding(enabled=True)
+    lazy = timeit.timeit(lambda: _decode_all(data), number=number) / number * 1000
+    grade_only = timeit.timeit(lambda: decode(EndpointData, data).grade, number=number) / number * 1000
+    print(f"dacite.from_dict:      {dacite:.3f} ms per response")
+    print(f"decode, all fields:    {generated:.3f} ms per response ({dacite / generated:.1f}x faster)")
+    print(f"lazy, all fields:      {lazy:.3f} ms per response ({dacite / lazy:.1f}x faster)")
+    print(f"lazy, grade only:      {grade_only:.3f} ms per response ({dacite / grade_only:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200, help="number of decoded responses")
+    main(parser.parse_args().number)
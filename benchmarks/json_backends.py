@@ -0,0 +1,41 @@
+"""Compare the installed JSON backends on the fixtures of the unittests."""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from functools import partial
+
+from _server import FIXTURES
+
+from ssllabs.json_backend import BACKENDS, loads, set_json_backend
+
+
+def _installed(backend: str) -> bool:
+    """Check, if a backend can be used."""
+    try:
+        set_json_backend(backend)
+    except ImportError:
+        print(f"{backend} is not installed")
+        return False
+    return True
+
+
+def main(number: int) -> None:
+    """Run benchmark."""
+    backends = [backend for backend in BACKENDS if _installed(backend)]
+
+    print(f"{'fixture':28s} {'size':>9s}" + "".join(f" {backend:>12s}" for backend in backends))
+    for path in sorted(FIXTURES.glob("*.json")):
+        content = path.read_bytes()
+        timings = []
+        for backend in backends:
+            set_json_backend(backend)
+            timings.append(timeit.timeit(partial(loads, content), number=number) / number * 1000)
+        print(f"{path.name:28s} {len(content):9d}" + "".join(f" {timing:9.3f} ms" for timing in timings))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1000, help="number of parsed documents per fixture and backend")
+    main(parser.parse_args().number)
@@ -0,0 +1,73 @@
+"""Compare the memory used by endpoints with slotted and plain data classes, lazily decoded details and an intern pool."""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import tracemalloc
+from functools import lru_cache
+from typing import Any, Callable
+
+from _server import FIXTURES
+
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.decoder import decode, set_lazy_decoding
+from ssllabs.intern import InternPool
+
+
+@lru_cache(maxsize=None)
+def _plain(data_class: type) -> type:
+    """Create a data class with a __dict__ per instance and the same fields."""
+    fields = [(field.name, field.type) for field in dataclasses.fields(data_class)]
+    return dataclasses.make_dataclass(data_class.__name__, fields)
+
+
+def _unslot(value: Any) -> Any:
+    """Copy a decoded object into plain data classes."""
+    if dataclasses.is_dataclass(value):
+        return _plain(type(value))(*(_unslot(getattr(value, field.name)) for field in dataclasses.fields(value)))
+    if isinstance(value, list):
+        return [_unslot(item) for item in value]
+    return value
+
+
+def _decode_all(raw: str, pool: InternPool | None = None) -> EndpointData:
+    """Decode an endpoint and all its lazily decoded fields."""
+    endpoint = decode(EndpointData, json.loads(raw), pool)
+    assert endpoint.details
+    _ = endpoint.details.certChains, endpoint.details.suites, endpoint.details.sims
+    return endpoint
+
+
+def _measure(build: Callable[[], Any], copies: int) -> float:
+    """Build copies of an endpoint and return the bytes held per endpoint."""
+    tracemalloc.start()
+    endpoints = [build() for _ in range(copies)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del endpoints
+    return size / copies
+
+
+def main(copies: int) -> None:
+    """Run benchmark."""
+    raw = (FIXTURES / "endpoint.json").read_text()
+    plain = _measure(lambda: _unslot(_decode_all(raw)), copies)
+    slotted = _measure(lambda: _decode_all(raw), copies)
+    print(f"plain data classes:   {plain:9.0f} bytes per endpoint")
+    print(f"slotted data classes: {slotted:9.0f} bytes per endpoint ({1 - slotted / plain:.0%} less)")
+
+    pool = InternPool()
+    interned = _measure(lambda: _decode_all(raw, pool), copies)
+    print(f"intern pool:          {interned:9.0f} bytes per endpoint ({1 - interned / slotted:.0%} less than slotted)")
+
+    set_lazy_decoding(enabled=True)
+    lazy = _measure(lambda: decode(EndpointData, json.loads(raw)), copies)
+    print(f"lazy, details unread: {lazy:9.0f} bytes per endpoint ({lazy / slotted - 1:.0%} more, raw JSON of the lazy fields)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=1000, help="number of endpoints to keep in memory")
+    main(parser.parse_args().copies)
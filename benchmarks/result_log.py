@@ -0,0 +1,68 @@
+"""Measure appending to a ResultLog and looking up the latest result of a host compared to scanning all results."""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import tempfile
+import time
+import timeit
+
+from _server import FIXTURES
+
+from ssllabs.archive import load
+from ssllabs.data.host import HostData
+from ssllabs.decoder import decode
+from ssllabs.result_log import MAGIC, RECORD, ResultLog
+
+
+def main(number: int, hosts: int) -> None:
+    """Run benchmark."""
+    result = decode(HostData, json.loads((FIXTURES / "analyze.json").read_bytes()))
+    results = [dataclasses.replace(result, host=f"host{i % hosts}.example", startTime=i) for i in range(number)]
+
+    with tempfile.TemporaryDirectory() as path:
+        with ResultLog(path, segment_size=4 * 1024 * 1024) as log:
+            start = time.perf_counter()
+            for item in results:
+                log.append(item)
+            appended = time.perf_counter() - start
+
+        start = time.perf_counter()
+        log = ResultLog(path, segment_size=4 * 1024 * 1024)
+        opened = time.perf_counter() - start
+        latest = timeit.timeit(lambda: log.latest("host0.example"), number=1000) / 1000
+        log.close()
+
+        def scan() -> HostData | None:
+            """Find the latest result by reading every segment without an index."""
+            found = None
+            for segment in sorted(log.path.glob("*.seg")):
+                data = segment.read_bytes()
+                offset = len(MAGIC)
+                while offset < len(data):
+                    length, host_length, _ = RECORD.unpack_from(data, offset)
+                    offset += RECORD.size + host_length
+                    item = load(HostData, data[offset : offset + length])
+                    offset += length
+                    if item.host == "host0.example" and (found is None or item.startTime > found.startTime):
+                        found = item
+            return found
+
+        scanned = timeit.timeit(scan, number=3) / 3
+        segments = len(list(log.path.glob("*.seg")))
+
+    print(f"{number} results of {hosts} hosts in {segments} segments")
+    print(f"append:              {appended / number * 1e6:9.1f} µs per result")
+    print(f"open:                {opened * 1000:9.1f} ms")
+    print(f"latest with index:   {latest * 1e6:9.1f} µs")
+    print(f"latest by scanning:  {scanned * 1e6:9.1f} µs ({scanned / latest:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000, help="number of stored results")
+    parser.add_argument("--hosts", type=int, default=1000, help="number of hosts")
+    args = parser.parse_args()
+    main(args.number, args.hosts)
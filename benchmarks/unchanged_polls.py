@@ -0,0 +1,34 @@
+"""Compare decoding every poll with skipping polls, whose response did not change."""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from functools import partial
+
+from _server import FIXTURES
+
+from ssllabs.data.host import HostData
+from ssllabs.decoder import decode
+from ssllabs.json_backend import loads
+from ssllabs.raw import body_digest
+
+
+def _decode(content: bytes) -> HostData:
+    """Parse and decode a poll like Analyze.get did for every response."""
+    return decode(HostData, loads(content))
+
+
+def main(number: int) -> None:
+    """Run benchmark."""
+    for fixture in ("analyze_running", "analyze"):
+        content = (FIXTURES / f"{fixture}.json").read_bytes()
+        decoded = timeit.timeit(partial(_decode, content), number=number) / number * 1_000_000
+        skipped = timeit.timeit(partial(body_digest, content), number=number) / number * 1_000_000
+        print(f"{fixture + '.json:':22} decode {decoded:7.1f} µs, digest {skipped:5.1f} µs ({decoded / skipped:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10000, help="number of polls")
+    main(parser.parse_args().number)
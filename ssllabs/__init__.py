@@ -2,7 +2,13 @@
 
 from importlib.metadata import PackageNotFoundError, version
 
-from .exceptions import EndpointError, SsllabsOverloadedError, SsllabsUnavailableError
+from .capacity import AssessmentCapacity
+from .exceptions import AssessmentError, DeadlineExceededError, EndpointError, SsllabsOverloadedError, SsllabsUnavailableError
+from .intern import InternPool
+from .poller import Poller
+from .polling import PollingPolicy
+from .retry import CircuitBreaker, RetryPolicy
+from .scheduler import AssessmentScheduler, Priority
 from .ssllabs import Ssllabs
 from .trust_store import TrustStore
 
@@ -16,7 +22,17 @@ except PackageNotFoundError:
 
 __all__ = [
     "Ssllabs",
+    "AssessmentCapacity",
+    "AssessmentError",
+    "AssessmentScheduler",
+    "CircuitBreaker",
+    "DeadlineExceededError",
     "EndpointError",
+    "InternPool",
+    "Poller",
+    "PollingPolicy",
+    "Priority",
+    "RetryPolicy",
     "SsllabsOverloadedError",
     "SsllabsUnavailableError",
     "TrustStore",
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from http import HTTPStatus
-from typing import Any, KeysView
+from typing import TYPE_CHECKING, Any, KeysView
 
-from httpx import AsyncClient, HTTPStatusError, NetworkError, Response, TimeoutException
+from httpx import (
+    AsyncClient,
+    ConnectError,
+    ConnectTimeout,
+    HTTPStatusError,
+    NetworkError,
+    PoolTimeout,
+    Response,
+    TimeoutException,
+)
 
 from ssllabs import SsllabsOverloadedError, SsllabsUnavailableError
+from ssllabs.retry import retry_after
+
+if TYPE_CHECKING:
+    from ssllabs.capacity import AssessmentCapacity
+    from ssllabs.intern import InternPool
+    from ssllabs.retry import RetryPolicy
+
+LOGGER = logging.getLogger(__name__)
 
 API_VERSION = 3
 SSLLABS_URL = f"https://api.ssllabs.com/api/v{API_VERSION}/"
@@ -15,25 +33,79 @@ SSLLABS_URL = f"https://api.ssllabs.com/api/v{API_VERSION}/"
 class _Api:
     """Base class to communicate with Qualys SSL Labs Assessment APIs."""
 
-    def __init__(self, client: AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        client: AsyncClient | None = None,
+        *,
+        capacity: AssessmentCapacity | None = None,
+        retry_policy: RetryPolicy | None = None,
+        intern_pool: InternPool | None = None,
+    ) -> None:
         self._client = client
+        self._capacity = capacity
+        self._retry_policy = retry_policy
+        self._intern_pool = intern_pool
 
     async def _call(self, api_endpoint: str, **kwargs: Any) -> Response:
-        """Invocate API."""
+        """Invocate API and retry, if the service is overloaded or unavailable."""
+        policy = self._retry_policy
+        if policy is None:
+            return await self._request(api_endpoint, **kwargs)
+
+        attempt = 0
+        while True:
+            await policy.acquire()
+            try:
+                r = await self._request(api_endpoint, **kwargs)
+            except (SsllabsOverloadedError, SsllabsUnavailableError) as ex:
+                delay = policy.failed(ex, attempt, retryable=self._retryable(ex, kwargs))
+                if delay is None:
+                    raise
+                LOGGER.info("Retrying %s in %.1f seconds: %s", api_endpoint, delay, ex)
+                attempt += 1
+                await asyncio.sleep(delay)
+            except HTTPStatusError:
+                # The service answered, it just rejected the request
+                policy.succeeded()
+                raise
+            except BaseException:
+                # Give the slot back, if the request was cancelled or failed otherwise
+                policy.aborted()
+                raise
+            else:
+                policy.succeeded()
+                return r
+
+    @staticmethod
+    def _retryable(error: Exception, kwargs: dict[str, Any]) -> bool:
+        """
+        Check, if a failed request may be repeated.
+
+        If the connection broke after the request was sent, SSL Labs might have started a new assessment already. Repeating
+        the request would restart it, so it is only repeated, if the request did not reach the service.
+        """
+        if kwargs.get("startNew") != "on" or not isinstance(error.__cause__, (NetworkError, TimeoutException)):
+            return True
+        return isinstance(error.__cause__, (ConnectError, ConnectTimeout, PoolTimeout))
+
+    async def _request(self, api_endpoint: str, **kwargs: Any) -> Response:
+        """Send a single request to the API."""
         try:
             if self._client:
                 r = await self._client.get(f"{SSLLABS_URL}{api_endpoint}", params=kwargs)
             else:
                 async with AsyncClient() as client:
                     r = await client.get(f"{SSLLABS_URL}{api_endpoint}", params=kwargs, timeout=30.0)
+            if self._capacity:
+                self._capacity.update_from_headers(r.headers)
             r.raise_for_status()
         except (NetworkError, TimeoutException) as ex:
             raise SsllabsUnavailableError from ex
         except HTTPStatusError as ex:
             if ex.response.status_code in (HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.SERVICE_UNAVAILABLE):
-                raise SsllabsUnavailableError from ex
+                raise SsllabsUnavailableError(retry_after(ex.response)) from ex
             if ex.response.status_code in (HTTPStatus.TOO_MANY_REQUESTS, 529):
-                raise SsllabsOverloadedError from ex
+                raise SsllabsOverloadedError(retry_after(ex.response)) from ex
             raise
         return r
 
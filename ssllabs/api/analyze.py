@@ -1,10 +1,13 @@
 """Invoke assessment and check progress."""
 
-from typing import Any
+from __future__ import annotations
 
-from dacite import from_dict
+from typing import Any
 
 from ssllabs.data.host import HostData
+from ssllabs.decoder import decode
+from ssllabs.json_backend import loads
+from ssllabs.raw import RawResponse, body_digest
 
 from ._api import _Api
 
@@ -13,9 +16,15 @@ class Analyze(_Api):
     """
     Invoke assessment and check progress.
 
+    While an assessment is in progress, consecutive polls often return identical responses. If the response did not change
+    since the last call, the previous result is returned without decoding the response again.
+
     See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#invoke-assessment-and-check-progress
     """
 
+    _last_digest: tuple[int, bytes] | None = None
+    _last_result: HostData | None = None
+
     async def get(self, host: str, **kwargs: Any) -> HostData:
         """
         Analyze host.
@@ -51,4 +60,24 @@ class Analyze(_Api):
         """
         self._verify_kwargs(kwargs.keys(), ["publish", "startNew", "fromCache", "maxAge", "all", "ignoreMismatch"])
         r = await self._call("analyze", host=host, **kwargs)
-        return from_dict(data_class=HostData, data=r.json())
+        digest = body_digest(r.content)
+        if self._last_result is not None and digest == self._last_digest:
+            return self._last_result
+        result = decode(HostData, loads(r.content), self._intern_pool)
+        self._last_digest, self._last_result = digest, result
+        return result
+
+    async def get_raw(self, host: str, **kwargs: Any) -> RawResponse:
+        """
+        Analyze host without decoding the response.
+
+        :param host: Hostname to analyze
+        :type host: str
+        :keyword kwargs: Same parameters as for get
+        :raises SsllabsUnavailableError: The SSL Labs service is not available.
+        :raises SsllabsOverloadedError: The SSL Labs service is overloaded. You should reduce your usage or wait a bit.
+        :raises HTTPStatusError: Something unexpected happened. Please file us a bug.
+        """
+        self._verify_kwargs(kwargs.keys(), ["publish", "startNew", "fromCache", "maxAge", "all", "ignoreMismatch"])
+        r = await self._call("analyze", host=host, **kwargs)
+        return RawResponse(r.content)
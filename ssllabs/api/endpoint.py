@@ -2,10 +2,13 @@
 
 from typing import Any
 
-from dacite import MissingValueError, from_dict
+from dacite import MissingValueError
 
 from ssllabs import EndpointError
 from ssllabs.data.endpoint import EndpointData
+from ssllabs.decoder import decode
+from ssllabs.json_backend import loads
+from ssllabs.raw import RawResponse
 
 from ._api import _Api
 
@@ -37,10 +40,31 @@ class Endpoint(_Api):
         """
         self._verify_kwargs(kwargs.keys(), ["fromCache"])
         r = await self._call("getEndpointData", host=host, s=s, **kwargs)
+        response = loads(r.content)
         try:
-            return from_dict(data_class=EndpointData, data=r.json())
+            return decode(EndpointData, response, self._intern_pool)
         except MissingValueError:
-            response = r.json()
             if "errors" in response:
                 raise EndpointError(response["errors"]) from None
             raise
+
+    async def get_raw(self, host: str, s: str, **kwargs: Any) -> RawResponse:
+        """
+        Retrieve detailed endpoint information without decoding the response.
+
+        :param host: Hostname to analyze
+        :type host: str
+        :param s: Endpoint IP address
+        :type s: str
+        :keyword kwargs: Same parameters as for get
+        :raises EndpointError: The endpoint API responded with an error.
+        :raises SsllabsUnavailableError: The SSL Labs service is not available.
+        :raises SsllabsOverloadedError: The SSL Labs service is overloaded. You should reduce your usage or wait a bit.
+        :raises HTTPStatusError: Something unexpected happened. Please file us a bug.
+        """
+        self._verify_kwargs(kwargs.keys(), ["fromCache"])
+        r = await self._call("getEndpointData", host=host, s=s, **kwargs)
+        response = RawResponse(r.content)
+        if b'"errors"' in response.content and "errors" in response.json():
+            raise EndpointError(response.json()["errors"])
+        return response
@@ -1,8 +1,8 @@
 """General information about the SSL Labs API."""
 
-from dacite import from_dict
-
 from ssllabs.data.info import InfoData
+from ssllabs.decoder import decode
+from ssllabs.json_backend import loads
 
 from ._api import _Api
 
@@ -24,4 +24,4 @@ class Info(_Api):
         :raises MissingValueError: Something unexpected happened. Please file us a bug.
         """
         r = await self._call("info")
-        return from_dict(data_class=InfoData, data=r.json())
+        return decode(InfoData, loads(r.content))
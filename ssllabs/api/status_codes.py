@@ -1,8 +1,8 @@
 """Retrieve known status codes."""
 
-from dacite import from_dict
-
 from ssllabs.data.status_codes import StatusCodesData
+from ssllabs.decoder import decode
+from ssllabs.json_backend import loads
 
 from ._api import _Api
 
@@ -24,4 +24,4 @@ class StatusCodes(_Api):
         :raises MissingValueError: Something unexpected happened. Please file us a bug.
         """
         r = await self._call("getStatusCodes")
-        return from_dict(data_class=StatusCodesData, data=r.json())
+        return decode(StatusCodesData, loads(r.content))
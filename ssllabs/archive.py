@@ -0,0 +1,216 @@
+"""Compact binary form of data classes for archiving results."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import marshal
+from typing import Any, Callable, List, TypeVar, get_args, get_origin, get_type_hints
+
+from dacite import MissingValueError
+
+from .data._dataclass import LazyField, Raw
+from .decoder import _unwrap_optional
+
+T = TypeVar("T")
+
+MAGIC = b"SSLHD"
+"""Start of dumped data classes, followed by the format version and the schema version"""
+
+FORMAT_VERSION = 1
+
+MARSHAL_VERSION = 4
+"""Version of the marshal format used for the values, which every supported Python version reads"""
+
+_HEADER_SIZE = len(MAGIC) + 1 + 8
+
+Encoder = Callable[[Any], Any]
+
+_ENCODERS: dict[tuple[type, bool], Encoder] = {}
+_LOADERS: dict[type, Callable[[Any], Any]] = {}
+_SCHEMAS: dict[type, bytes] = {}
+
+
+def dump(instance: Any) -> bytes:
+    """
+    Serialize a data class instance, e.g. a finished HostData, into a compact binary form.
+
+    Fields are stored by position instead of by name and nested data classes become tuples, so the result is considerably
+    smaller than JSON and loads without looking up any keys. Lazy fields, that were not read yet, are stored without decoding
+    them.
+
+    :param instance: Instance of one of the data classes in ssllabs.data
+    :raises MissingValueError: A raw value of a lazy field misses a value, that is not optional.
+    """
+    data_class = type(instance)
+    values = _encoder(data_class, raw=False)(instance)
+    return MAGIC + bytes((FORMAT_VERSION,)) + schema_version(data_class) + marshal.dumps(values, MARSHAL_VERSION)
+
+
+def load(data_class: type[T], data: bytes | bytearray | memoryview) -> T:
+    """
+    Create a data class instance from the output of dump.
+
+    Only load trusted data, as marshal is not secured against maliciously constructed data.
+
+    :param data_class: Data class, that was dumped
+    :param data: Binary form of the instance
+    :raises ValueError: The data was not dumped from this data class, by another format version or with another schema of it.
+    """
+    view = memoryview(data)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        msg = "Not a dumped data class."
+        raise ValueError(msg)
+    if view[len(MAGIC)] != FORMAT_VERSION:
+        msg = f"Unsupported format version {view[len(MAGIC)]}."
+        raise ValueError(msg)
+    if bytes(view[len(MAGIC) + 1 : _HEADER_SIZE]) != schema_version(data_class):
+        msg = f"The data was not dumped from the current schema of {data_class.__name__}."
+        raise ValueError(msg)
+    try:
+        values = marshal.loads(view[_HEADER_SIZE:])  # noqa: S302
+    except (EOFError, TypeError, ValueError) as ex:
+        msg = "Malformed dump."
+        raise ValueError(msg) from ex
+    try:
+        loader = _LOADERS[data_class]
+    except KeyError:
+        loader = _compile_loader(data_class)
+    return loader(values)
+
+
+def schema_version(data_class: type) -> bytes:
+    """
+    Get a digest of the names, types and order of the fields of a data class and all data classes nested in it.
+
+    Dumps only load into data classes with the same schema version. It changes with every release, that adds, removes or
+    reorders fields of the data classes.
+
+    :param data_class: Data class to get the schema version of
+    """
+    try:
+        return _SCHEMAS[data_class]
+    except KeyError:
+        version = _SCHEMAS[data_class] = hashlib.blake2b(_describe(data_class).encode(), digest_size=8).digest()
+        return version
+
+
+def _describe(hint: Any) -> str:
+    """Describe a type independently of how the running Python version represents type hints."""
+    optional, hint = _unwrap_optional(hint)
+    prefix = "?" if optional else ""
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        hints = get_type_hints(hint)
+        fields = ",".join(f"{field.name}:{_describe(hints[field.name])}" for field in dataclasses.fields(hint))
+        return f"{prefix}{hint.__name__}({fields})"
+    if get_origin(hint) in (list, List):
+        items = get_args(hint)
+        return f"{prefix}list[{_describe(items[0]) if items else ''}]"
+    return prefix + getattr(get_origin(hint) or hint, "__name__", "any")
+
+
+def _encoder(data_class: Any, *, raw: bool) -> Encoder:
+    """Get the function turning an instance or, if raw is set, a raw dictionary of a data class into a tuple."""
+    try:
+        return _ENCODERS[data_class, raw]
+    except KeyError:
+        return _compile_encoder(data_class, raw=raw)
+
+
+def _compile_encoder(data_class: Any, *, raw: bool) -> Encoder:
+    """
+    Generate a function turning a data class into a tuple of its field values in the order of the fields.
+
+    Encoders of raw dictionaries are used for lazy fields, that were not decoded yet.
+    """
+    namespace: dict[str, Any] = {"MissingValueError": MissingValueError, "Raw": Raw}
+    hints = get_type_hints(data_class)
+    values = []
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        variable = f"_{index}"
+        optional, hint = _unwrap_optional(hints[field.name])
+        descriptor = data_class.__dict__.get(field.name)
+        if raw:
+            value = f"get({field.name!r})" if optional else f"data[{field.name!r}]"
+            converter = _converter(hint, variable, namespace, raw=True)
+        elif isinstance(descriptor, LazyField):
+            # Read the slot directly to keep values, that were not decoded yet, raw
+            namespace[f"slot{variable}"] = descriptor.slot
+            converter = _converter(hint, variable, namespace, raw=False).format(variable)
+            raw_converter = _converter(hint, f"{variable}r", namespace, raw=True).format(f"{variable}.value")
+            values.append(
+                f"(None if ({variable} := slot{variable}.__get__(data)) is None "
+                f"else {raw_converter} if type({variable}) is Raw else {converter})",
+            )
+            continue
+        else:
+            value = f"data.{field.name}"
+            converter = _converter(hint, variable, namespace, raw=False)
+        if converter == "{}":
+            values.append(value)
+        elif optional:
+            values.append(f"(None if ({variable} := {value}) is None else {converter.format(variable)})")
+        else:
+            values.append(converter.format(value))
+    source = "def encode(data):\n"
+    if raw:
+        source += (
+            "    get = data.get\n"
+            "    try:\n"
+            f"        return ({', '.join(values)},)\n"
+            "    except KeyError as ex:\n"
+            "        raise MissingValueError(ex.args[0]) from None\n"
+        )
+    else:
+        source += f"    return ({', '.join(values)},)\n"
+    exec(source, namespace)  # noqa: S102
+    function: Encoder = namespace["encode"]
+    function.__qualname__ = f"encode_{data_class.__name__}"
+    _ENCODERS[data_class, raw] = function
+    return function
+
+
+def _compile_loader(data_class: Any) -> Callable[[Any], Any]:
+    """Generate a function creating a data class from a tuple of its field values."""
+    namespace: dict[str, Any] = {"cls": data_class}
+    hints = get_type_hints(data_class)
+    arguments = []
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        variable = f"_{index}"
+        optional, hint = _unwrap_optional(hints[field.name])
+        converter = _loader_converter(hint, variable, namespace)
+        if converter == "{}":
+            arguments.append(f"values[{index}]")
+        elif optional:
+            arguments.append(f"(None if ({variable} := values[{index}]) is None else {converter.format(variable)})")
+        else:
+            arguments.append(converter.format(f"values[{index}]"))
+    exec(f"def load(values):\n    return cls({', '.join(arguments)})\n", namespace)  # noqa: S102
+    function: Callable[[Any], Any] = namespace["load"]
+    function.__qualname__ = f"load_{data_class.__name__}"
+    _LOADERS[data_class] = function
+    return function
+
+
+def _converter(hint: Any, variable: str, namespace: dict[str, Any], *, raw: bool) -> str:
+    """Generate a format string encoding a value of the hinted type. Plain values are taken as they are."""
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        namespace[f"encode{variable}"] = _encoder(hint, raw=raw)
+        return f"encode{variable}({{}})"
+    if get_origin(hint) in (list, List) and get_args(hint):
+        item_converter = _converter(get_args(hint)[0], f"{variable}_", namespace, raw=raw)
+        if item_converter != "{}":
+            return f"[{item_converter.format('item')} for item in {{}}]"
+    return "{}"
+
+
+def _loader_converter(hint: Any, variable: str, namespace: dict[str, Any]) -> str:
+    """Generate a format string creating a value of the hinted type from its encoded form."""
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        namespace[f"load{variable}"] = _LOADERS.get(hint) or _compile_loader(hint)
+        return f"load{variable}({{}})"
+    if get_origin(hint) in (list, List) and get_args(hint):
+        item_converter = _loader_converter(get_args(hint)[0], f"{variable}_", namespace)
+        if item_converter != "{}":
+            return f"[{item_converter.format('item')} for item in {{}}]"
+    return "{}"
@@ -0,0 +1,185 @@
+"""Persistent cache of assessment results."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .data.host import HostData
+from .decoder import decode
+from .json_backend import loads
+from .raw import RawResponse
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from .intern import InternPool
+
+LOGGER = logging.getLogger(__name__)
+
+FINISHED = ("READY", "ERROR")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    host TEXT NOT NULL,
+    port INTEGER NOT NULL,
+    test_time INTEGER NOT NULL,
+    expiry_time INTEGER,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (host, port)
+);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+CREATE INDEX IF NOT EXISTS results_stored_at ON results (stored_at);
+"""
+
+
+class ResultCache:
+    """
+    Cache finished assessment results in a SQLite database.
+
+    A cached result is used as long as SSL Labs would deliver it from its own cache: it must not be expired and must not be
+    older than the maximum age the caller asks for. The database can be shared by multiple processes on the same machine.
+    """
+
+    def __init__(self, path: str | PathLike[str], max_entries: int = 10000, max_age: float | None = None) -> None:
+        """
+        Initialize result cache.
+
+        :param path: Path to the database file. It is created, if it does not exist.
+        :param max_entries: Maximum number of results to keep. The least recently used results are evicted first.
+        :param max_age: Maximum age of results to keep in hours. If omitted, results are only evicted by size.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+
+    def get(
+        self,
+        host: str,
+        port: int = 443,
+        max_age: int | None = None,
+        pool: InternPool | None = None,
+    ) -> HostData | None:
+        """
+        Get a cached result.
+
+        :param host: Assessed host
+        :param port: Assessed port
+        :param max_age: Maximum age of the result in hours
+        :param pool: Pool to share identical certificates, cipher suites and simulation clients with other results
+        :return: The cached result or None, if there is no usable result
+        """
+        data = self._get(host, port, max_age)
+        return None if data is None else decode(HostData, loads(data), pool)
+
+    def get_raw(self, host: str, port: int = 443, max_age: int | None = None) -> RawResponse | None:
+        """
+        Get a cached result without decoding it.
+
+        :param host: Assessed host
+        :param port: Assessed port
+        :param max_age: Maximum age of the result in hours
+        :return: The cached result or None, if there is no usable result
+        """
+        data = self._get(host, port, max_age)
+        return None if data is None else RawResponse(data.encode())
+
+    def put(self, host_object: HostData) -> None:
+        """
+        Cache a finished result and evict old results.
+
+        :param host_object: Result to cache
+        """
+        if host_object.status not in FINISHED:
+            return
+        self._put(
+            host_object.host,
+            host_object.port,
+            host_object.testTime or host_object.startTime,
+            host_object.cacheExpiryTime,
+            json.dumps(dataclasses.asdict(host_object), separators=(",", ":")),
+        )
+
+    def put_raw(self, response: RawResponse) -> None:
+        """
+        Cache a finished result, that was not decoded, and evict old results.
+
+        :param response: Result to cache
+        """
+        if response.status not in FINISHED:
+            return
+        data = response.json()
+        self._put(
+            data["host"],
+            data["port"],
+            data.get("testTime") or data["startTime"],
+            data.get("cacheExpiryTime"),
+            response.content.decode(),
+        )
+
+    def _get(self, host: str, port: int, max_age: int | None) -> str | None:
+        """Get the JSON of a usable result."""
+        now = time.time()
+        min_test_time = 0 if max_age is None else int((now - max_age * 3600) * 1000)
+        if self.max_age is not None:
+            min_test_time = max(min_test_time, int((now - self.max_age * 3600) * 1000))
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT data FROM results WHERE host = ? AND port = ? AND test_time >= ? "
+                "AND (expiry_time IS NULL OR expiry_time > ?)",
+                (host, port, min_test_time, int(now * 1000)),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE results SET accessed_at = ? WHERE host = ? AND port = ?", (now, host, port))
+        LOGGER.debug("Using cached result of %s:%i.", host, port)
+        return row[0]
+
+    def _put(self, host: str, port: int, test_time: int, expiry_time: int | None, data: str) -> None:  # noqa: PLR0913
+        """Store the JSON of a finished result and evict old results."""
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (host, port, test_time, expiry_time, now, now, data),
+            )
+            if self.max_age is not None:
+                connection.execute("DELETE FROM results WHERE stored_at < ?", (now - self.max_age * 3600,))
+            connection.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, host: str | None = None, port: int = 443) -> None:
+        """
+        Remove cached results.
+
+        :param host: Host to remove the result of. If omitted, all results are removed.
+        :param port: Port to remove the result of
+        """
+        with closing(self._connect()) as connection, connection:
+            if host is None:
+                connection.execute("DELETE FROM results")
+            else:
+                connection.execute("DELETE FROM results WHERE host = ? AND port = ?", (host, port))
+
+    def __len__(self) -> int:
+        """Get the number of cached results."""
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection. Connections are not shared, so the cache can be used from executor threads."""
+        return sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
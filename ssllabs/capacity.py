@@ -0,0 +1,109 @@
+"""Assessment capacity tracking."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    from .data.info import InfoData
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AssessmentCapacity:
+    """
+    Track how many assessments we are allowed to run and how many are running.
+
+    SSL Labs reports the maximum and the current number of assessments in the X-Max-Assessments and X-Current-Assessments
+    headers of every API response. The tracker is updated from these headers and from info calls, so the info endpoint only
+    needs to be queried again, if the tracked state is stale. A single tracker can be shared between multiple Ssllabs
+    instances.
+
+    See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#access-rate-and-rate-limiting
+    """
+
+    def __init__(self, max_age: float = 30.0) -> None:
+        """
+        Initialize capacity tracker.
+
+        :param max_age: Seconds after which the tracked state is considered stale
+        """
+        self.max_age = max_age
+        self.max_assessments: int | None = None
+        self.current_assessments: int = 0
+        self.new_assessment_cool_off: float = 0.0
+        """Cool off in seconds"""
+        self._updated: float | None = None
+        self._updates = 0
+
+    @property
+    def stale(self) -> bool:
+        """True, if the state has to be refreshed from the info endpoint."""
+        return self.max_assessments is None or self._updated is None or time.monotonic() - self._updated >= self.max_age
+
+    @property
+    def free_slots(self) -> int:
+        """Number of assessments that can be started right now."""
+        if self.max_assessments is None:
+            return 0
+        return max(self.max_assessments - self.current_assessments, 0)
+
+    @property
+    def updates(self) -> int:
+        """Number of times the state was updated with the real numbers."""
+        return self._updates
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Update the state from the headers of an API response.
+
+        :param headers: Response headers
+        """
+        max_assessments = headers.get("X-Max-Assessments")
+        current_assessments = headers.get("X-Current-Assessments")
+        if max_assessments is None and current_assessments is None:
+            return
+        try:
+            max_value = int(max_assessments) if max_assessments is not None else self.max_assessments
+            current_value = int(current_assessments) if current_assessments is not None else self.current_assessments
+        except ValueError:
+            LOGGER.debug("Ignoring malformed assessment headers: %s, %s", max_assessments, current_assessments)
+            return
+        self.max_assessments = max_value
+        self.current_assessments = current_value
+        self._updated = time.monotonic()
+        self._updates += 1
+
+    def update_from_info(self, info: InfoData) -> None:
+        """
+        Update the state from an info object.
+
+        :param info: Info object retrieved from the API
+        """
+        self.max_assessments = info.maxAssessments
+        self.current_assessments = info.currentAssessments
+        self.new_assessment_cool_off = info.newAssessmentCoolOff / 1000
+        self._updated = time.monotonic()
+        self._updates += 1
+
+    def assessment_started(self, updates: int | None = None) -> None:
+        """
+        Account for an assessment we started until the next response reports the real numbers.
+
+        :param updates: Number of updates before the assessment was started. If the state was updated since, the real numbers
+                        already include the assessment.
+        """
+        if updates is None or updates == self._updates:
+            self.current_assessments += 1
+
+    def assessment_finished(self, updates: int | None = None) -> None:
+        """
+        Account for an assessment that finished until the next response reports the real numbers.
+
+        :param updates: Number of updates after the assessment was started. If the state was updated since, the real numbers
+                        already leave out the assessment.
+        """
+        if updates is None or updates == self._updates:
+            self.current_assessments = max(self.current_assessments - 1, 0)
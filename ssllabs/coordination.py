@@ -0,0 +1,100 @@
+"""Coordination of assessment slots between processes."""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    acquired_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS starts (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    started_at REAL NOT NULL
+);
+"""
+
+
+class SlotLedger:
+    """
+    Share the assessment slots and the cool off between processes using a SQLite database.
+
+    SSL Labs grants its slots per client, not per process. Every assessment started by an Ssllabs instance using the ledger
+    holds a lease in the database until it is finished. A new assessment is only started, if fewer leases than allowed
+    assessments are held and the cool off since the last start of any process has passed. Leases of processes, that died
+    without releasing them, expire after the lease time. The database can be shared by all processes on the same machine or
+    on a network file system with working locks.
+    """
+
+    def __init__(self, path: str | PathLike[str], lease_time: float = 3600.0) -> None:
+        """
+        Initialize slot ledger.
+
+        :param path: Path to the database file. It is created, if it does not exist.
+        :param lease_time: Seconds after which a lease, that was not released, is given up
+        """
+        self.path = Path(path)
+        self.lease_time = lease_time
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+
+    def acquire(self, max_assessments: int, cool_off: float) -> tuple[int | None, float]:
+        """
+        Try to take a slot for a new assessment.
+
+        :param max_assessments: Number of assessments SSL Labs allows us to run concurrently
+        :param cool_off: Seconds to wait between starting two assessments, while another one is running
+        :return: The ID of the lease or None, if no slot is free, and the seconds to wait before trying again
+        """
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+            held = connection.execute("SELECT COUNT(*) FROM leases").fetchone()[0]
+            if held >= max_assessments:
+                LOGGER.debug("All %i slots are leased.", held)
+                return None, 1.0
+            row = connection.execute("SELECT started_at FROM starts").fetchone()
+            if held and row is not None and row[0] + cool_off > now:
+                return None, row[0] + cool_off - now
+            connection.execute("INSERT OR REPLACE INTO starts VALUES (0, ?)", (now,))
+            cursor = connection.execute(
+                "INSERT INTO leases (owner, acquired_at, expires_at) VALUES (?, ?, ?)",
+                (self.owner, now, now + self.lease_time),
+            )
+            return cursor.lastrowid, 0.0
+
+    def release(self, lease: int) -> None:
+        """
+        Give back the slot of a finished assessment.
+
+        :param lease: ID of the lease
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM leases WHERE id = ?", (lease,))
+
+    def __len__(self) -> int:
+        """Get the number of leased slots."""
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM leases WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection. Connections are not shared, so the ledger can be used from executor threads."""
+        return sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
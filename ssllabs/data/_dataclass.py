@@ -0,0 +1,100 @@
+"""Data class decorator creating compact instances."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+LAZY = "lazy"
+"""Metadata key of fields, that are decoded on first access"""
+
+
+class Raw:
+    """Raw JSON value of a lazy field, that was not decoded yet."""
+
+    __slots__ = ("value", "pool")
+
+    def __init__(self, value: Any, pool: Any = None) -> None:
+        """
+        Wrap a raw value.
+
+        :param value: Value as received from the API
+        :param pool: Intern pool to use, when the value is decoded
+        """
+        self.value = value
+        self.pool = pool
+
+
+class LazyField:
+    """Descriptor decoding the raw value of a field when it is read the first time."""
+
+    __slots__ = ("slot", "convert")
+
+    def __init__(self, slot: Any) -> None:
+        """
+        Initialize descriptor.
+
+        :param slot: Descriptor of the slot holding the value
+        """
+        self.slot = slot
+        self.convert: Callable[[Any, Any], Any] = _not_compiled
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """Get the value and decode it, if necessary."""
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if type(value) is Raw:
+            value = self.convert(value.value, value.pool)
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        """Set the value."""
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        """Delete the value."""
+        self.slot.__delete__(instance)
+
+
+def _not_compiled(*_: Any) -> Any:
+    """Stand in for the converter, that is set when the decoder of the data class is compiled."""
+    msg = "Raw values are only created by the decoder."
+    raise TypeError(msg)
+
+
+def slotted_dataclass(cls: type[T]) -> type[T]:
+    """
+    Turn a class into a data class with __slots__ instead of a __dict__ per instance.
+
+    Python 3.10 and newer support this natively. On older versions, the class is recreated with __slots__ the same way. Fields
+    with LAZY metadata get a LazyField descriptor on top of their slot.
+    """
+    slotted: Any
+    if sys.version_info >= (3, 10):
+        slotted = dataclasses.dataclass(slots=True)(cls)
+    else:
+        data_class: Any = dataclasses.dataclass(cls)
+        field_names = tuple(field.name for field in dataclasses.fields(data_class))
+        namespace = {
+            key: value for key, value in data_class.__dict__.items() if key not in (*field_names, "__dict__", "__weakref__")
+        }
+        namespace["__slots__"] = field_names
+        slotted = type(data_class)(data_class.__name__, data_class.__bases__, namespace)
+        slotted.__qualname__ = data_class.__qualname__
+
+    for field in dataclasses.fields(slotted):
+        if field.metadata.get(LAZY):
+            setattr(slotted, field.name, LazyField(slotted.__dict__[field.name]))
+    return slotted
+
+
+if TYPE_CHECKING:
+    # Let type checkers treat the models like data classes of the standard decorator
+    from dataclasses import dataclass
+else:
+    dataclass = slotted_dataclass
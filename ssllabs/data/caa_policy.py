@@ -1,8 +1,8 @@
 """CAA Policy."""
 
-from dataclasses import dataclass
 from typing import List
 
+from ._dataclass import dataclass
 from .caa_record import CaaRecordData
 
 
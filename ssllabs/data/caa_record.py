@@ -1,6 +1,6 @@
 """CAA Record."""
 
-from dataclasses import dataclass
+from ._dataclass import dataclass
 
 
 @dataclass
@@ -1,8 +1,8 @@
 """Cert."""
 
-from dataclasses import dataclass
 from typing import List, Optional
 
+from ._dataclass import dataclass
 from .caa_policy import CaaPolicyData
 
 
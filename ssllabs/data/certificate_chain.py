@@ -1,8 +1,8 @@
 """Certificate Chain."""
 
-from dataclasses import dataclass
 from typing import List
 
+from ._dataclass import dataclass
 from .trust_path import TrustPathData
 
 
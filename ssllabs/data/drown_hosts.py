@@ -1,6 +1,6 @@
 """Drown Hosts."""
 
-from dataclasses import dataclass
+from ._dataclass import dataclass
 
 
 @dataclass
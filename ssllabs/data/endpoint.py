@@ -1,8 +1,9 @@
 """Endpoint."""
 
-from dataclasses import dataclass
+from dataclasses import field
 from typing import Optional
 
+from ._dataclass import LAZY, dataclass
 from .endpoint_details import EndpointDetailsData
 
 
@@ -58,7 +59,7 @@ class EndpointData:
     delegation: int
     """Indicates domain name delegation with and without the www prefix"""
 
-    details: Optional[EndpointDetailsData]
+    details: Optional[EndpointDetailsData] = field(metadata={LAZY: True})
     """
     This field contains an EndpointDetails object. It's not present by default, but can be enabled by using the "all"
     parameter to the analyze API call.
@@ -1,8 +1,9 @@
 """Endpoint Details."""
 
-from dataclasses import dataclass
+from dataclasses import field
 from typing import List, Optional
 
+from ._dataclass import LAZY, dataclass
 from .certificate_chain import CertificateChainData
 from .drown_hosts import DrownHostsData
 from .hpkp_policy import HpkpPolicyData
@@ -30,13 +31,13 @@ class EndpointDetailsData:
     several HTTP invocations. Then, you should check that the hostStartTime value matches the startTime value of the host.
     """
 
-    certChains: List[CertificateChainData]
+    certChains: List[CertificateChainData] = field(metadata={LAZY: True})
     """Server Certificate chains"""
 
     protocols: List[ProtocolData]
     """Supported protocols"""
 
-    suites: Optional[List[ProtocolSuitesData]]
+    suites: Optional[List[ProtocolSuitesData]] = field(metadata={LAZY: True})
     """Supported cipher suites per protocol"""
 
     noSniSuites: Optional[ProtocolSuitesData]
@@ -129,7 +130,7 @@ class EndpointDetailsData:
     miscIntolerance: Optional[int]
     """Indicates various other types of intolerance"""
 
-    sims: Optional[SimDetailsData]
+    sims: Optional[SimDetailsData] = field(metadata={LAZY: True})
     """Instance of SimDetails."""
 
     heartbleed: Optional[bool]
@@ -1,8 +1,8 @@
 """Host."""
 
-from dataclasses import dataclass
 from typing import List, Optional
 
+from ._dataclass import dataclass
 from .cert import CertData
 from .endpoint import EndpointData
 
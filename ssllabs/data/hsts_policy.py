@@ -1,8 +1,9 @@
 """HSTS Policy."""
 
-from dataclasses import dataclass
 from typing import Dict, Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class HstsPolicyData:
@@ -1,8 +1,9 @@
 """HSTS Preload."""
 
-from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class HstsPreloadData:
@@ -1,8 +1,9 @@
 """HTTP Transaction."""
 
-from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class HttpTransactionData:
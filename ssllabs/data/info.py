@@ -1,8 +1,9 @@
 """Info."""
 
-from dataclasses import dataclass
 from typing import List
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class InfoData:
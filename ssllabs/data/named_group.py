@@ -1,6 +1,6 @@
 """NamedGroup."""
 
-from dataclasses import dataclass
+from ._dataclass import dataclass
 
 
 @dataclass
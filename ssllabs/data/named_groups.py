@@ -1,8 +1,8 @@
 """NamedGroup."""
 
-from dataclasses import dataclass
 from typing import List, Optional
 
+from ._dataclass import dataclass
 from .named_group import NamedGroupData
 
 
@@ -1,8 +1,9 @@
 """Protocol."""
 
-from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class ProtocolData:
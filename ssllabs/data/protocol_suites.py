@@ -1,8 +1,8 @@
 """Protocol suites."""
 
-from dataclasses import dataclass
 from typing import List, Optional
 
+from ._dataclass import dataclass
 from .suite import SuiteData
 
 
@@ -1,8 +1,9 @@
 """Simulation Client."""
 
-from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class SimClientData:
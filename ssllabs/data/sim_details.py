@@ -1,8 +1,8 @@
 """Simulation Objects."""
 
-from dataclasses import dataclass
 from typing import List
 
+from ._dataclass import dataclass
 from .simulation import SimulationData
 
 
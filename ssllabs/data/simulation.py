@@ -1,8 +1,8 @@
 """Simulation."""
 
-from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass import dataclass
 from .sim_client import SimClientData
 
 
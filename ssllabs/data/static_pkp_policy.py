@@ -1,8 +1,9 @@
 """SPKP Policy."""
 
-from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class StaticPkpPolicyData:
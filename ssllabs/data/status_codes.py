@@ -1,8 +1,9 @@
 """StatusCodes."""
 
-from dataclasses import dataclass
 from typing import Dict
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class StatusCodesData:
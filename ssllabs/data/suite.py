@@ -1,8 +1,9 @@
 """Suite."""
 
-from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class SuiteData:
@@ -1,8 +1,9 @@
 """Trust."""
 
-from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass import dataclass
+
 
 @dataclass
 class TrustData:
@@ -1,8 +1,8 @@
 """Trust Path."""
 
-from dataclasses import dataclass
 from typing import List, Optional
 
+from ._dataclass import dataclass
 from .trust import TrustData
 
 
@@ -0,0 +1,129 @@
+"""Fast construction of data classes from API responses."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any, Callable, List, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from dacite import MissingValueError
+
+from .data._dataclass import LazyField, Raw
+
+if TYPE_CHECKING:
+    from .intern import InternPool
+
+T = TypeVar("T")
+
+Decoder = Callable[..., Any]
+
+_DECODERS: dict[type, Decoder] = {}
+
+_lazy = False
+
+
+def get_lazy_decoding() -> bool:
+    """Check, if fields with LAZY metadata are decoded on first access."""
+    return _lazy
+
+
+def set_lazy_decoding(enabled: bool) -> None:  # noqa: FBT001
+    """
+    Decode endpoint details, certificate chains, cipher suites and simulations on first access instead of right away.
+
+    Until they are read, the raw JSON of these fields is kept, which takes about half again as much memory as the decoded
+    objects. Enable it, if most results are only checked for their grades and status and dropped afterwards.
+
+    :param enabled: True to decode lazily, False to decode all fields right away
+    """
+    global _lazy  # noqa: PLW0603
+    if enabled != _lazy:
+        _lazy = enabled
+        # Generate the decoders again on next use
+        _DECODERS.clear()
+
+
+def decode(data_class: type[T], data: dict[str, Any], pool: InternPool | None = None) -> T:
+    """
+    Create a data class instance from a dictionary.
+
+    The result equals the one of dacite.from_dict, but the constructor is generated only once per data class and values are
+    not type checked.
+
+    :param data_class: Data class to create
+    :param data: Dictionary as received from the API
+    :param pool: Pool to share identical certificates, cipher suites and simulation clients with other results
+    :raises MissingValueError: A value, that is not optional, is missing.
+    """
+    try:
+        function = _DECODERS[data_class]
+    except KeyError:
+        function = _compile(data_class)
+    return function(data, pool)
+
+
+def _compile(data_class: Any) -> Decoder:
+    """
+    Generate a function creating the data class from a dictionary.
+
+    If the data class is interned by the given pool, the pool calls the function again with intern set to False on a miss.
+    """
+    namespace: dict[str, Any] = {"cls": data_class, "MissingValueError": MissingValueError, "Raw": Raw}
+    hints = get_type_hints(data_class)
+    arguments = []
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        optional, hint = _unwrap_optional(hints[field.name])
+        descriptor = data_class.__dict__.get(field.name)
+        if _lazy and isinstance(descriptor, LazyField):
+            # Keep the raw value and let the descriptor decode it on first access
+            converter_namespace: dict[str, Any] = {}
+            converter = _converter(hint, "", converter_namespace)
+            exec(f"def convert(value, pool):\n    return {converter.format('value')}\n", converter_namespace)  # noqa: S102
+            descriptor.convert = converter_namespace["convert"]
+            converter = "Raw({}, pool)"
+        else:
+            converter = _converter(hint, f"_{index}", namespace)
+        arguments.append(_expression(field.name, converter, f"_{index}", optional=optional))
+    source = (
+        "def decode(data, pool=None, intern=True):\n"
+        "    if pool is not None and intern and cls in pool.keys:\n"
+        "        return pool.intern(cls, data, decode)\n"
+        "    get = data.get\n"
+        "    try:\n"
+        f"        return cls({', '.join(arguments)})\n"
+        "    except KeyError as ex:\n"
+        "        raise MissingValueError(ex.args[0]) from None\n"
+    )
+    exec(source, namespace)  # noqa: S102
+    function: Decoder = namespace["decode"]
+    function.__qualname__ = f"decode_{data_class.__name__}"
+    _DECODERS[data_class] = function
+    return function
+
+
+def _unwrap_optional(hint: Any) -> tuple[bool, Any]:
+    """Split Optional[X] into True and X. Missing optional fields default to None like in dacite."""
+    if get_origin(hint) is Union and type(None) in get_args(hint):
+        (hint,) = (arg for arg in get_args(hint) if arg is not type(None))
+        return True, hint
+    return False, hint
+
+
+def _expression(name: str, converter: str, variable: str, *, optional: bool) -> str:
+    """Generate the expression reading a single field."""
+    if not optional:
+        return converter.format(f"data[{name!r}]")
+    if converter == "{}":
+        return f"get({name!r})"
+    return f"(None if ({variable} := get({name!r})) is None else {converter.format(variable)})"
+
+
+def _converter(hint: Any, variable: str, namespace: dict[str, Any]) -> str:
+    """Generate a format string converting a raw value into the hinted type. Plain values are taken as they are."""
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        namespace[f"decode{variable}"] = _DECODERS.get(hint) or _compile(hint)
+        return f"decode{variable}({{}}, pool)"
+    if get_origin(hint) in (list, List) and get_args(hint):
+        item_converter = _converter(get_args(hint)[0], f"{variable}_", namespace)
+        if item_converter != "{}":
+            return f"[{item_converter.format('item')} for item in {{}}]"
+    return "{}"
@@ -0,0 +1,230 @@
+"""Progress events of running assessments."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Union
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .data.host import HostData
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StatusEvent:
+    """The status of an assessment moved."""
+
+    host: str
+    """Assessed host"""
+
+    status: str
+    """Assessment status; possible values: DNS, ERROR, IN_PROGRESS, and READY."""
+
+    status_message: str | None
+    """Status message in English"""
+
+
+@dataclass(frozen=True)
+class EndpointEvent:
+    """The progress of an endpoint changed."""
+
+    host: str
+    """Assessed host"""
+
+    ip_address: str
+    """Endpoint IP address"""
+
+    status_message: str
+    """Assessment status message of the endpoint"""
+
+    status_details: str | None
+    """Code of the running test"""
+
+    status_details_message: str | None
+    """Description of the running test"""
+
+    progress: int | None
+    """Assessment progress of the endpoint in percent"""
+
+    eta: int | None
+    """Estimated seconds until the assessment of the endpoint is finished"""
+
+    grade: str | None
+    """Grade of the endpoint, once it is finished"""
+
+
+Event = Union[StatusEvent, EndpointEvent]
+
+
+class Subscription:
+    """
+    Events of running assessments as async iterator.
+
+    Events are queued from the moment the subscription is created. If they are not consumed fast enough, the oldest ones
+    are dropped. Close the subscription to end the iteration.
+    """
+
+    def __init__(self, events: Events, host: str | None = None, maxsize: int = 1000) -> None:
+        """
+        Initialize subscription.
+
+        :param events: Source of the events
+        :param host: Host to receive events of. If omitted, events of all hosts are received.
+        :param maxsize: Maximum number of queued events
+        """
+        self.host = host
+        self.dropped = 0
+        self._closed = False
+        self._events = events
+        self._queue: asyncio.Queue[Event | None] = asyncio.Queue(maxsize)
+        events.subscribe(self._put)
+
+    def close(self) -> None:
+        """Stop receiving events. Queued events are still delivered."""
+        self._events.unsubscribe(self._put)
+        self._closed = True
+        if self._queue.empty():
+            # Wake up a waiting iteration
+            self._queue.put_nowait(None)
+
+    def __aiter__(self) -> Subscription:
+        """Iterate the events."""
+        return self
+
+    async def __anext__(self) -> Event:
+        """Wait for the next event."""
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __enter__(self) -> Subscription:  # noqa: PYI034
+        """Use the subscription as context manager closing it at the end."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the subscription."""
+        self.close()
+
+    def _put(self, event: Event) -> None:
+        """Queue an event, dropping the oldest one, if the queue is full."""
+        if self.host is not None and event.host != self.host:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+
+class Events:
+    """Distribute progress events of running assessments to callbacks and subscriptions."""
+
+    def __init__(self) -> None:
+        """Initialize events."""
+        self._callbacks: list[Callable[[Event], object]] = []
+
+    def subscribe(self, callback: Callable[[Event], object]) -> None:
+        """
+        Call a function with every event. Errors raised by the function are logged and do not affect assessments.
+
+        :param callback: Function to call
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Event], object]) -> None:
+        """
+        Stop calling a function with events.
+
+        :param callback: Function to stop calling
+        """
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def listen(self, host: str | None = None, maxsize: int = 1000) -> Subscription:
+        """
+        Receive events as async iterator.
+
+        :param host: Host to receive events of. If omitted, events of all hosts are received.
+        :param maxsize: Maximum number of queued events. If they are not consumed fast enough, the oldest ones are dropped.
+        """
+        return Subscription(self, host, maxsize)
+
+    @property
+    def listening(self) -> bool:
+        """True, if anybody listens to events."""
+        return bool(self._callbacks)
+
+    def publish(self, event: Event) -> None:
+        """
+        Pass an event to all callbacks and subscriptions.
+
+        :param event: Event to publish
+        """
+        for callback in list(self._callbacks):
+            _call(callback, event)
+
+
+def _call(callback: Callable[[Event], object], event: Event) -> None:
+    """Call a callback, logging its errors."""
+    try:
+        callback(event)
+    except Exception:
+        LOGGER.exception("Progress callback failed.")
+
+
+class ProgressTracker:
+    """Publish events for changes between consecutive results of an assessment."""
+
+    __slots__ = ("events", "_last", "_status", "_endpoints")
+
+    def __init__(self, events: Events) -> None:
+        """
+        Initialize tracker.
+
+        :param events: Events to publish changes to
+        """
+        self.events = events
+        self._last: HostData | None = None
+        self._status: StatusEvent | None = None
+        self._endpoints: dict[str, EndpointEvent] = {}
+
+    def update(self, result: HostData) -> None:
+        """
+        Publish the changes of a new result compared to the previous one.
+
+        :param result: Latest result of the assessment
+        """
+        if result is self._last or not self.events.listening:
+            # Polls, that did not change, return the previous result
+            return
+        self._last = result
+        status = StatusEvent(result.host, result.status, result.statusMessage)
+        if status != self._status:
+            self._status = status
+            self.events.publish(status)
+        for endpoint in result.endpoints or []:
+            event = EndpointEvent(
+                result.host,
+                endpoint.ipAddress,
+                endpoint.statusMessage,
+                endpoint.statusDetails,
+                endpoint.statusDetailsMessage,
+                endpoint.progress,
+                endpoint.eta,
+                endpoint.grade,
+            )
+            if event != self._endpoints.get(endpoint.ipAddress):
+                self._endpoints[endpoint.ipAddress] = event
+                self.events.publish(event)
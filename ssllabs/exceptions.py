@@ -3,6 +3,33 @@
 from __future__ import annotations
 
 
+class AssessmentError(Exception):
+    """The assessment of a host failed."""
+
+    def __init__(self, host: str, error: Exception) -> None:
+        """
+        Initialize error.
+
+        :param host: Host, whose assessment failed
+        :param error: Error the assessment failed with
+        """
+        super().__init__(f"Assessment of {host} failed: {error}")
+        self.host = host
+        self.error = error
+
+
+class DeadlineExceededError(Exception):
+    """The deadline or the timeout of an assessment passed."""
+
+    def __init__(self, message: str = "The deadline passed before the assessment could start.") -> None:
+        """
+        Initialize error.
+
+        :param message: Description of the deadline, that passed
+        """
+        super().__init__(message)
+
+
 class EndpointError(Exception):
     """The Endpoint API raised errors."""
 
@@ -14,14 +41,24 @@ class EndpointError(Exception):
 class SsllabsOverloadedError(Exception):
     """The service is overloaded."""
 
-    def __init__(self) -> None:
-        """Initialize error."""
+    def __init__(self, retry_after: float | None = None) -> None:
+        """
+        Initialize error.
+
+        :param retry_after: Seconds the service asked us to wait, if it did
+        """
         super().__init__("The ssllabs.com service is overloaded. You should sleep for several minutes then try again.")
+        self.retry_after = retry_after
 
 
 class SsllabsUnavailableError(Exception):
     """The service is not available."""
 
-    def __init__(self) -> None:
-        """Initialize error."""
+    def __init__(self, retry_after: float | None = None) -> None:
+        """
+        Initialize error.
+
+        :param retry_after: Seconds the service asked us to wait, if it did
+        """
         super().__init__("The ssllabs.com service is currently not available.")
+        self.retry_after = retry_after
@@ -0,0 +1,81 @@
+"""Sharing identical parts of results."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+from .data.cert import CertData
+from .data.sim_client import SimClientData
+from .data.suite import SuiteData
+
+T = TypeVar("T")
+
+KeyFunction = Callable[[Dict[str, Any]], Hashable]
+
+
+def _items(data: dict[str, Any]) -> Hashable:
+    """Use all values of a flat object as key."""
+    return tuple(data.items())
+
+
+def _nested_items(data: Any) -> Hashable:
+    """Use all values of an object including the values of nested objects and lists as key."""
+    if isinstance(data, dict):
+        return tuple((key, _nested_items(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return tuple(_nested_items(value) for value in data)
+    return data
+
+
+DEFAULT_KEYS: dict[type, KeyFunction] = {
+    CertData: _nested_items,
+    SimClientData: _items,
+    SuiteData: _items,
+}
+"""Interned data classes and how to identify identical instances"""
+
+
+class InternPool:
+    """
+    Share identical certificates, cipher suites and simulation clients between decoded results.
+
+    Scanning many hosts, the same intermediate certificates, cipher suites and simulated clients show up over and over again.
+    With a pool, they are decoded once and all results refer to the same instance. Interned instances are shared, so they
+    must not be modified.
+    """
+
+    def __init__(self, keys: dict[type, KeyFunction] | None = None) -> None:
+        """
+        Initialize intern pool.
+
+        :param keys: Data classes to intern and functions getting a key identifying identical instances from the raw data. By
+                     default, certificates, suites and simulation clients are identified by all their values.
+        """
+        self.keys = DEFAULT_KEYS if keys is None else keys
+        self._instances: dict[tuple[type, Hashable], Any] = {}
+
+    def intern(self, data_class: type[T], data: dict[str, Any], decode: Callable[..., T]) -> T:
+        """
+        Get the shared instance of the data or decode it, if it is seen for the first time.
+
+        :param data_class: Data class to create
+        :param data: Dictionary as received from the API
+        :param decode: Function creating the data class, if the pool does not know the data yet
+        """
+        key = (data_class, self.keys[data_class](data))
+        try:
+            return self._instances[key]
+        except KeyError:
+            instance = self._instances[key] = decode(data, self, False)  # noqa: FBT003
+            return instance
+        except TypeError:
+            # The key is not hashable, e.g. because the API sent a list where a value was expected
+            return decode(data, self, False)  # noqa: FBT003
+
+    def clear(self) -> None:
+        """Forget all shared instances."""
+        self._instances.clear()
+
+    def __len__(self) -> int:
+        """Get the number of shared instances."""
+        return len(self._instances)
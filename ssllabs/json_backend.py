@@ -0,0 +1,64 @@
+"""Exchangeable JSON parser for API responses."""
+
+from __future__ import annotations
+
+import json
+import logging
+from importlib import import_module
+from typing import Any, Callable, Union
+
+LOGGER = logging.getLogger(__name__)
+
+BACKENDS = ("orjson", "msgspec", "json")
+"""Supported backends in the order of preference"""
+
+Loads = Callable[[Union[bytes, str]], Any]
+
+_backend = "json"
+_loads: Loads = json.loads
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document with the current backend.
+
+    :param data: JSON document
+    """
+    return _loads(data)
+
+
+def get_json_backend() -> str:
+    """Get the name of the current backend."""
+    return _backend
+
+
+def set_json_backend(name: str | None = None) -> None:
+    """
+    Set the backend used to parse responses of all API calls.
+
+    :param name: Name of the backend. If omitted, the fastest installed backend is used.
+    :raises ValueError: The backend is not supported.
+    :raises ImportError: The backend is not installed.
+    """
+    global _backend, _loads  # noqa: PLW0603
+    if name is None:
+        for backend in BACKENDS:
+            try:
+                set_json_backend(backend)
+            except ImportError:
+                continue
+            return
+    if name == "orjson":
+        _loads = import_module("orjson").loads
+    elif name == "msgspec":
+        _loads = import_module("msgspec.json").decode
+    elif name == "json":
+        _loads = json.loads
+    else:
+        msg = f"Unsupported JSON backend: {name}"
+        raise ValueError(msg)
+    _backend = name
+    LOGGER.debug("Parsing JSON with %s.", name)
+
+
+set_json_backend()
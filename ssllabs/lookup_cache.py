@@ -0,0 +1,126 @@
+"""Cache of rarely changing lookups."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .decoder import decode
+from .json_backend import loads
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lookups (
+    key TEXT PRIMARY KEY,
+    stored_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+class LookupCache:
+    """
+    Cache the results of info, status_codes and root_certs for a while.
+
+    Every lookup has its own time to live. Root certificates are cached per trust store. Results are kept in memory and, if
+    a path is given, in a SQLite database, so they survive restarts and can be shared by multiple processes.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str] | None = None,
+        *,
+        info_ttl: float = 60.0,
+        status_codes_ttl: float = 86400.0,
+        root_certs_ttl: float = 86400.0,
+    ) -> None:
+        """
+        Initialize lookup cache.
+
+        :param path: Path to the database file. It is created, if it does not exist. If omitted, results are kept in memory
+                     only.
+        :param info_ttl: Seconds to reuse the engine and criteria version. The number of running assessments is tracked from
+                         the headers of every response anyway.
+        :param status_codes_ttl: Seconds to reuse the known status codes
+        :param root_certs_ttl: Seconds to reuse the root certificates of a trust store
+        """
+        self.path = None if path is None else Path(path)
+        self.ttls = {"info": info_ttl, "status_codes": status_codes_ttl, "root_certs": root_certs_ttl}
+        self._memory: dict[str, tuple[float, Any]] = {}
+        if self.path is not None:
+            with closing(self._connect()) as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+
+    def get(self, key: str, data_class: type | None = None) -> Any:
+        """
+        Get a cached result, that is not older than the time to live of its lookup.
+
+        :param key: Name of the lookup, e.g. info or status_codes, followed by a colon and its argument, if it has one
+        :param data_class: Data class to decode the stored result into. If omitted, the result is a string.
+        :return: The cached result or None, if there is no fresh result
+        """
+        min_stored_at = time.time() - self.ttls[key.split(":")[0]]
+        stored_at, value = self._memory.get(key, (0.0, None))
+        if stored_at >= min_stored_at:
+            return value
+        if self.path is None:
+            return None
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT stored_at, data FROM lookups WHERE key = ? AND stored_at >= ?",
+                (key, min_stored_at),
+            ).fetchone()
+        if row is None:
+            return None
+        LOGGER.debug("Using stored result of %s.", key)
+        value = row[1] if data_class is None else decode(data_class, loads(row[1]))
+        self._memory[key] = (row[0], value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Cache a result.
+
+        :param key: Name of the lookup followed by a colon and its argument, if it has one
+        :param value: String or data class instance to cache
+        """
+        now = time.time()
+        self._memory[key] = (now, value)
+        if self.path is None:
+            return
+        data = value if isinstance(value, str) else json.dumps(dataclasses.asdict(value), separators=(",", ":"))
+        with closing(self._connect()) as connection, connection:
+            connection.execute("INSERT OR REPLACE INTO lookups VALUES (?, ?, ?)", (key, now, data))
+
+    def invalidate(self, lookup: str | None = None) -> None:
+        """
+        Remove cached results.
+
+        :param lookup: Name of the lookup to remove the results of, e.g. root_certs for all trust stores or
+                       root_certs:1 for Mozilla only. If omitted, all results are removed.
+        """
+        keys = [key for key in self._memory if lookup is None or key == lookup or key.startswith(f"{lookup}:")]
+        for key in keys:
+            del self._memory[key]
+        if self.path is None:
+            return
+        with closing(self._connect()) as connection, connection:
+            if lookup is None:
+                connection.execute("DELETE FROM lookups")
+            else:
+                connection.execute("DELETE FROM lookups WHERE key = ? OR key GLOB ?", (lookup, f"{lookup}:*"))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection. Connections are not shared, so the cache can be used from executor threads."""
+        return sqlite3.connect(self.path or ":memory:", timeout=30.0, isolation_level=None)
@@ -0,0 +1,136 @@
+"""Central polling of running assessments."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class _Poll(Generic[R]):
+    """Running assessment waiting for its next poll."""
+
+    __slots__ = ("poll", "interval", "future")
+
+    def __init__(
+        self,
+        poll: Callable[[], Awaitable[R]],
+        interval: Callable[[R], float | None],
+        future: asyncio.Future[R],
+    ) -> None:
+        self.poll = poll
+        self.interval = interval
+        self.future = future
+
+
+class Poller:
+    """
+    Poll all running assessments from a single task.
+
+    Assessments are kept ordered by the time of their next poll. A single task sleeps until the next poll is due and spaces
+    the polls, so the request rate never exceeds the maximum rate, even if many polls are due at the same time. Assessments
+    nobody waits for anymore are dropped without polling them again.
+    """
+
+    def __init__(self, max_rate: float = 5.0) -> None:
+        """
+        Initialize poller.
+
+        :param max_rate: Maximum number of polls per second
+        """
+        if max_rate <= 0:
+            msg = "max_rate must be positive."
+            raise ValueError(msg)
+        self.max_rate = max_rate
+        self._queue: list[tuple[float, int, _Poll[Any]]] = []
+        self._counter = itertools.count()
+        self._task: asyncio.Future[None] | None = None
+        self._sleeper: asyncio.Future[None] | None = None
+        self._last_poll: float | None = None
+        self._polls: set[asyncio.Future[None]] = set()
+
+    def __len__(self) -> int:
+        """Get the number of assessments waiting for their next poll."""
+        return sum(not entry.future.done() for _, _, entry in self._queue)
+
+    async def wait(self, result: R, poll: Callable[[], Awaitable[R]], interval: Callable[[R], float | None]) -> R:
+        """
+        Poll until an assessment is finished.
+
+        :param result: Last known state of the assessment
+        :param poll: Function requesting the current state of the assessment
+        :param interval: Function getting the seconds to wait before the next poll from a state or None, if it is final
+        :return: The final state of the assessment
+        """
+        delay = interval(result)
+        if delay is None:
+            return result
+        entry = _Poll(poll, interval, asyncio.get_running_loop().create_future())
+        self._schedule(entry, delay)
+        return await entry.future
+
+    def _schedule(self, entry: _Poll[Any], delay: float) -> None:
+        """Schedule the next poll of an assessment."""
+        due = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._queue, (due, next(self._counter), entry))
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        elif self._queue[0][2] is entry and self._sleeper is not None:
+            # The new poll is due before the one the task is sleeping for
+            self._sleeper.cancel()
+
+    async def _run(self) -> None:
+        """Issue polls, when they are due, until no assessment is waiting anymore."""
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            due, _, entry = self._queue[0]
+            if entry.future.done():
+                heapq.heappop(self._queue)
+                continue
+            delay = due - loop.time()
+            if delay > 0:
+                sleeper = self._sleeper = asyncio.ensure_future(asyncio.sleep(delay))
+                try:
+                    await asyncio.wait({sleeper})
+                finally:
+                    sleeper.cancel()
+                    self._sleeper = None
+                if sleeper.cancelled():
+                    continue
+            _, _, entry = heapq.heappop(self._queue)
+            await self._throttle()
+            if not entry.future.done():
+                task = asyncio.ensure_future(self._poll(entry))
+                self._polls.add(task)
+                task.add_done_callback(self._polls.discard)
+
+    async def _throttle(self) -> None:
+        """Wait until the next poll may be sent without exceeding the maximum rate."""
+        loop = asyncio.get_running_loop()
+        if self._last_poll is not None:
+            delay = self._last_poll + 1 / self.max_rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        self._last_poll = loop.time()
+
+    async def _poll(self, entry: _Poll[Any]) -> None:
+        """Poll an assessment and either resolve its future or schedule the next poll."""
+        try:
+            result = await entry.poll()
+            delay = None if entry.future.done() else entry.interval(result)
+        except Exception as ex:  # noqa: BLE001
+            if not entry.future.done():
+                entry.future.set_exception(ex)
+            return
+        if entry.future.done():
+            LOGGER.debug("Dropping poll nobody waits for anymore.")
+        elif delay is None:
+            entry.future.set_result(result)
+        else:
+            self._schedule(entry, delay)
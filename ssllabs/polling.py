@@ -0,0 +1,61 @@
+"""Polling policies."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data.host import HostData
+
+COMPLETE = 100
+
+
+class PollingPolicy:
+    """
+    Decide how long to wait before checking the progress of an assessment again.
+
+    While the endpoints report a large ETA, polling slows down up to the maximum interval. Close to completion, polling speeds
+    up down to the minimum interval. Subclass and override interval, if you need a different strategy.
+
+    See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#protocol-usage
+    """
+
+    def __init__(self, min_interval: float = 5.0, max_interval: float = 60.0, eta_factor: float = 0.5) -> None:
+        """
+        Initialize polling policy.
+
+        :param min_interval: Minimum seconds to wait between two polls
+        :param max_interval: Maximum seconds to wait between two polls
+        :param eta_factor: Fraction of the remaining ETA to wait before polling again
+        """
+        if not 0 < min_interval <= max_interval:
+            msg = "Intervals must be positive and min_interval must not exceed max_interval."
+            raise ValueError(msg)
+        if eta_factor <= 0:
+            msg = "eta_factor must be positive."
+            raise ValueError(msg)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.eta_factor = eta_factor
+
+    def interval(self, host_object: HostData) -> float:
+        """
+        Get seconds to wait before polling the assessment again.
+
+        :param host_object: Latest state of the assessment
+        """
+        if host_object.status != "IN_PROGRESS" or not host_object.endpoints:
+            return self.min_interval
+
+        # Endpoints are assessed one after another, so the endpoint currently in progress reports the relevant ETA.
+        eta = next(
+            (
+                endpoint.eta
+                for endpoint in host_object.endpoints
+                if endpoint.progress is not None and 0 <= endpoint.progress < COMPLETE
+            ),
+            None,
+        )
+        if eta is None or eta <= 0:
+            return self.min_interval
+        return min(max(eta * self.eta_factor, self.min_interval), self.max_interval)
@@ -0,0 +1,79 @@
+"""Undecoded responses of the API."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .decoder import decode
+from .json_backend import loads
+
+if TYPE_CHECKING:
+    from .intern import InternPool
+
+T = TypeVar("T")
+
+_STATUS = re.compile(rb'"status"\s*:\s*"([A-Z_]+)"')
+
+
+def body_digest(content: bytes) -> tuple[int, bytes]:
+    """
+    Get the length and a digest of a response body to tell cheaply, if it changed.
+
+    :param content: Response body
+    """
+    return len(content), hashlib.blake2b(content, digest_size=16).digest()
+
+
+class RawResponse:
+    """
+    Response body of an API call, that is parsed only on demand.
+
+    Use it to forward responses without paying for building data classes. The status of an assessment can be read without
+    parsing the whole body.
+    """
+
+    __slots__ = ("content", "_json")
+
+    def __init__(self, content: bytes) -> None:
+        """
+        Wrap a response body.
+
+        :param content: JSON encoded response body
+        """
+        self.content = content
+        self._json: Any = None
+
+    @property
+    def status(self) -> str | None:
+        """Status of the assessment or None, if the response has no status."""
+        match = _STATUS.search(self.content)
+        if match and self.content.rfind(b"{", 0, match.start()) == self.content.find(b"{"):
+            # No nested object is opened before the match, so it is the status of the host.
+            return match.group(1).decode()
+        return self.json().get("status")
+
+    @property
+    def digest(self) -> tuple[int, bytes]:
+        """Length and digest of the response body, that differ if the body changed."""
+        return body_digest(self.content)
+
+    def json(self) -> Any:
+        """Parse the response body. The result is kept for further calls."""
+        if self._json is None:
+            self._json = loads(self.content)
+        return self._json
+
+    def decode(self, data_class: type[T], pool: InternPool | None = None) -> T:
+        """
+        Create a data class instance from the response body.
+
+        :param data_class: Data class to create
+        :param pool: Pool to share identical certificates, cipher suites and simulation clients with other results
+        """
+        return decode(data_class, self.json(), pool)
+
+    def __repr__(self) -> str:
+        """Show the size of the response body."""
+        return f"<RawResponse [{len(self.content)} bytes]>"
@@ -0,0 +1,256 @@
+"""Append-only log of archived assessment results."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Tuple
+
+from .archive import dump, load
+from .data.host import HostData
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from types import TracebackType
+
+Entries = List[Tuple[Tuple[str, int], Tuple[int, int, int]]]
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"SSLLOG\x01"
+"""Start of segment files, followed by the records"""
+
+INDEX_MAGIC = b"SSLIDX\x01"
+"""Start of index files of full segments, followed by the entries"""
+
+RECORD = struct.Struct(">IHq")
+"""Header of a record: length of the dumped result, length of the host and start time, followed by the host and the dump"""
+
+ENTRY = struct.Struct(">IIHq")
+"""Entry of an index file: offset and length of the dump, length of the host and start time, followed by the host"""
+
+
+class ResultLog:
+    """
+    Store finished results in append-only segment files and read them by host and start time.
+
+    Results are dumped with ssllabs.archive and appended to the latest segment. Once a segment exceeds the segment size, a new
+    one is started and an index file of the full segment is written. On opening the log, the index files and the latest
+    segment are read into a sorted index of (host, start time) to the position of the result, so looking up a result does not
+    scan the segments. Results are read through memory maps, so only the pages of the requested results are read from disk.
+
+    Only one process may append to a log at a time. A record, that was not written completely, e.g. because the process was
+    killed, is cut off when the log is opened again.
+    """
+
+    def __init__(self, path: str | PathLike[str], segment_size: int = 64 * 1024 * 1024) -> None:
+        """
+        Open a result log.
+
+        :param path: Directory of the segment files. It is created, if it does not exist.
+        :param segment_size: Size in bytes after which a new segment is started
+        """
+        self.path = Path(path)
+        self.segment_size = segment_size
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._maps: dict[int, mmap.mmap] = {}
+        self._writer: BinaryIO | None = None
+        segments = sorted(int(segment.stem) for segment in self.path.glob("*.seg"))
+        locations: dict[tuple[str, int], tuple[int, int, int]] = {}
+        for segment in segments[:-1]:
+            locations.update(self._read_index(segment))
+        self._segment = segments[-1] if segments else 0
+        if segments:
+            self._entries, self._size = self._scan(self._segment)
+        else:
+            self._entries, self._size = [], self._create(self._segment)
+        # Later records replace earlier ones with the same key
+        locations.update(self._entries)
+        self._keys = sorted(locations)
+        self._locations = [locations[key] for key in self._keys]
+
+    def append(self, result: HostData) -> None:
+        """
+        Append a result. A result with the same host and start time as a stored one replaces it in the index.
+
+        :param result: Result to store
+        """
+        host = result.host.encode()
+        data = dump(result)
+        if self._size > len(MAGIC) and self._size + RECORD.size + len(host) + len(data) > self.segment_size:
+            self._write_index(self._segment, self._entries)
+            self._close_writer()
+            self._segment += 1
+            self._entries, self._size = [], self._create(self._segment)
+        if self._writer is None:
+            self._writer = self._file(self._segment).open("ab", buffering=0)
+        self._writer.write(RECORD.pack(len(data), len(host), result.startTime) + host + data)
+        offset = self._size + RECORD.size + len(host)
+        self._size = offset + len(data)
+        key, location = (result.host, result.startTime), (self._segment, offset, len(data))
+        self._entries.append((key, location))
+        self._add(key, location)
+
+    def get(self, host: str, start_time: int) -> HostData | None:
+        """
+        Get the result of an assessment.
+
+        :param host: Assessed host
+        :param start_time: Start time of the assessment in milliseconds since 1970
+        """
+        index = bisect.bisect_left(self._keys, (host, start_time))
+        if index == len(self._keys) or self._keys[index] != (host, start_time):
+            return None
+        return self._load(index)
+
+    def latest(self, host: str) -> HostData | None:
+        """
+        Get the result of the latest assessment of a host.
+
+        :param host: Assessed host
+        """
+        index = bisect.bisect_left(self._keys, (host + "\0",)) - 1
+        if index < 0 or self._keys[index][0] != host:
+            return None
+        return self._load(index)
+
+    def history(self, host: str, since: int | None = None, until: int | None = None) -> Iterator[HostData]:
+        """
+        Iterate the results of a host from the oldest to the latest one.
+
+        :param host: Assessed host
+        :param since: Earliest start time in milliseconds since 1970
+        :param until: Start time in milliseconds since 1970 to stop before
+        """
+        start = bisect.bisect_left(self._keys, (host,) if since is None else (host, since))
+        end = bisect.bisect_left(self._keys, (host + "\0",) if until is None else (host, until))
+        for index in range(start, end):
+            yield self._load(index)
+
+    def start_times(self, host: str) -> list[int]:
+        """
+        Get the start times of all stored assessments of a host without reading them.
+
+        :param host: Assessed host
+        """
+        start = bisect.bisect_left(self._keys, (host,))
+        end = bisect.bisect_left(self._keys, (host + "\0",))
+        return [start_time for _, start_time in self._keys[start:end]]
+
+    def hosts(self) -> list[str]:
+        """Get all hosts with stored results."""
+        return list(dict.fromkeys(host for host, _ in self._keys))
+
+    def close(self) -> None:
+        """Close the segment files and memory maps. The log can still be used afterwards and opens them again."""
+        self._close_writer()
+        for segment_map in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+
+    def __len__(self) -> int:
+        """Get the number of stored results."""
+        return len(self._keys)
+
+    def __enter__(self) -> ResultLog:  # noqa: PYI034
+        """Use the log as context manager closing it at the end."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the log."""
+        self.close()
+
+    def _file(self, segment: int) -> Path:
+        """Get the path of a segment."""
+        return self.path / f"{segment:08d}.seg"
+
+    def _close_writer(self) -> None:
+        """Close the segment file appended to."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _add(self, key: tuple[str, int], location: tuple[int, int, int]) -> None:
+        """Add a result to the sorted index or replace the location of a result with the same key."""
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            self._locations[index] = location
+        else:
+            self._keys.insert(index, key)
+            self._locations.insert(index, location)
+
+    def _load(self, index: int) -> HostData:
+        """Load a result from the memory map of its segment without copying it."""
+        segment, offset, length = self._locations[index]
+        segment_map = self._maps.get(segment)
+        if segment_map is None or len(segment_map) < offset + length:
+            # The latest segment grows, so it is mapped again after appending
+            if segment_map is not None:
+                segment_map.close()
+            with self._file(segment).open("rb") as file:
+                segment_map = self._maps[segment] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        with memoryview(segment_map) as view, view[offset : offset + length] as record:
+            return load(HostData, record)
+
+    def _create(self, segment: int) -> int:
+        """Start a new segment and return its size."""
+        self._file(segment).write_bytes(MAGIC)
+        return len(MAGIC)
+
+    def _scan(self, segment: int) -> tuple[Entries, int]:
+        """Get the keys and locations of the records of a segment and the size of its complete records."""
+        data = self._file(segment).read_bytes()
+        if not data.startswith(MAGIC):
+            msg = f"{self._file(segment)} is not a segment of a result log."
+            raise ValueError(msg)
+        offset = len(MAGIC)
+        entries: Entries = []
+        while offset + RECORD.size <= len(data):
+            length, host_length, start_time = RECORD.unpack_from(data, offset)
+            start = offset + RECORD.size + host_length
+            if start + length > len(data):
+                break
+            entries.append(((data[offset + RECORD.size : start].decode(), start_time), (segment, start, length)))
+            offset = start + length
+        if offset < len(data):
+            LOGGER.warning("Cutting off an incomplete record at the end of %s.", self._file(segment))
+            with self._file(segment).open("r+b") as file:
+                file.truncate(offset)
+        return entries, offset
+
+    def _read_index(self, segment: int) -> Entries:
+        """Get the keys and locations of the records of a full segment from its index file, rebuilding it, if missing."""
+        path = self._file(segment).with_suffix(".idx")
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        if not data.startswith(INDEX_MAGIC):
+            entries, _ = self._scan(segment)
+            self._write_index(segment, entries)
+            return entries
+        offset = len(INDEX_MAGIC)
+        entries = []
+        while offset < len(data):
+            start, length, host_length, start_time = ENTRY.unpack_from(data, offset)
+            offset += ENTRY.size + host_length
+            entries.append(((data[offset - host_length : offset].decode(), start_time), (segment, start, length)))
+        return entries
+
+    def _write_index(self, segment: int, entries: Entries) -> None:
+        """Write the index file of a full segment."""
+        chunks = [INDEX_MAGIC]
+        for (host, start_time), (_, start, length) in entries:
+            encoded = host.encode()
+            chunks.append(ENTRY.pack(start, length, len(encoded), start_time) + encoded)
+        temporary = self._file(segment).with_suffix(".tmp")
+        temporary.write_bytes(b"".join(chunks))
+        temporary.replace(self._file(segment).with_suffix(".idx"))
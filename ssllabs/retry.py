@@ -0,0 +1,261 @@
+"""Retrying requests while SSL Labs is overloaded or unavailable."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Union
+
+from .exceptions import SsllabsOverloadedError, SsllabsUnavailableError
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+LOGGER = logging.getLogger(__name__)
+
+ServiceError = Union[SsllabsOverloadedError, SsllabsUnavailableError]
+
+
+@dataclass
+class RetryMetrics:
+    """Counters of a retry policy."""
+
+    retries: int = 0
+    """Number of requests, that were repeated"""
+
+    overloaded: int = 0
+    """Number of responses telling that the service is overloaded"""
+
+    unavailable: int = 0
+    """Number of responses or network errors telling that the service is not available"""
+
+    exhausted: int = 0
+    """Number of requests, that failed although they were retried"""
+
+
+@dataclass
+class CircuitMetrics:
+    """Counters of a circuit breaker."""
+
+    opened: int = 0
+    """Number of times the circuit was opened"""
+
+    open_time: float = 0.0
+    """Seconds all requests were paused"""
+
+
+class CircuitBreaker:
+    """
+    Pause all requests while SSL Labs is overloaded.
+
+    Once a request is answered with an overloaded status, the circuit opens and every request waits until the cool down is
+    over. Afterwards, only a single request is let through. Every successful request doubles the number of concurrent
+    requests, until the limit is reached and the circuit closes again. The cool down doubles, if the service is still
+    overloaded when requests are let through again.
+    """
+
+    def __init__(self, cool_down: float = 60.0, max_cool_down: float = 1800.0, ramp_up_limit: int = 16) -> None:
+        """
+        Initialize circuit breaker.
+
+        :param cool_down: Seconds to pause requests after the first overload
+        :param max_cool_down: Maximum seconds to pause requests after consecutive overloads
+        :param ramp_up_limit: Number of concurrent requests at which the circuit closes again
+        """
+        self.cool_down = cool_down
+        self.max_cool_down = max_cool_down
+        self.ramp_up_limit = ramp_up_limit
+        self.metrics = CircuitMetrics()
+        self._reopen_at = 0.0
+        self._limit: int | None = None
+        self._in_flight = 0
+        self._consecutive_trips = 0
+        self._generation = 0
+        self._waiters: list[asyncio.Future[None]] = []
+
+    @property
+    def state(self) -> str:
+        """State of the circuit: closed, open or half-open."""
+        if self._reopen_at > time.monotonic():
+            return "open"
+        return "closed" if self._limit is None else "half-open"
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            delay = self._reopen_at - time.monotonic()
+            if delay > 0:
+                generation = self._generation
+                await asyncio.sleep(delay)
+                if generation != self._generation:
+                    # The pause was extended while we were waiting
+                    continue
+            if self._limit is None or self._in_flight < self._limit:
+                break
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self._in_flight += 1
+
+    def release(self, *, success: bool) -> None:
+        """
+        Finish a request.
+
+        :param success: True, if the service answered the request without being overloaded
+        """
+        self._in_flight = max(self._in_flight - 1, 0)
+        if success and self._limit is not None and self.state == "half-open":
+            self._consecutive_trips = 0
+            self._limit *= 2
+            if self._limit >= self.ramp_up_limit:
+                LOGGER.info("SSL Labs recovered. Resuming all requests.")
+                self._limit = None
+        self._wake_up()
+
+    def trip(self, retry_after: float | None = None) -> None:
+        """
+        Open the circuit.
+
+        :param retry_after: Seconds the service asked us to wait
+        """
+        now = time.monotonic()
+        if self.state == "open":
+            # Further overloads of requests sent before the circuit opened must not escalate the cool down.
+            reopen_at = now + (retry_after or 0.0)
+            if reopen_at > self._reopen_at:
+                self.metrics.open_time += reopen_at - self._reopen_at
+                self._reopen_at = reopen_at
+                self._generation += 1
+            return
+        delay = min(self.cool_down * 2**self._consecutive_trips, self.max_cool_down)
+        reopen_at = now + max(delay, retry_after or 0.0)
+        self.metrics.open_time += reopen_at - now
+        self.metrics.opened += 1
+        self._consecutive_trips += 1
+        self._reopen_at = reopen_at
+        self._generation += 1
+        self._limit = 1
+        LOGGER.warning("SSL Labs is overloaded. Pausing all requests for %.0f seconds.", reopen_at - now)
+
+    def reset(self) -> None:
+        """Close the circuit immediately."""
+        self._reopen_at = 0.0
+        self._limit = None
+        self._consecutive_trips = 0
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Let waiting requests check again, if they may be sent."""
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(None)
+
+
+CIRCUIT_BREAKER = CircuitBreaker()
+"""Circuit breaker shared by all retry policies of the process"""
+
+
+class RetryPolicy:
+    """
+    Retry requests with full jitter exponential backoff.
+
+    If the service sends a Retry-After header, we wait at least as long as requested.
+
+    See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#error-response-status-codes
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        circuit_breaker: CircuitBreaker | None = CIRCUIT_BREAKER,
+    ) -> None:
+        """
+        Initialize retry policy.
+
+        :param max_retries: Maximum number of retries per request. Set to 0 to disable retries.
+        :param base_delay: Seconds to wait at most before the first retry
+        :param max_delay: Maximum seconds to wait before a retry
+        :param circuit_breaker: Circuit breaker to open while the service is overloaded. By default, one circuit breaker is
+                                shared by all retry policies of the process. Set to None to disable it.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.circuit_breaker = circuit_breaker
+        self.metrics = RetryMetrics()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self.circuit_breaker:
+            await self.circuit_breaker.acquire()
+
+    def succeeded(self) -> None:
+        """Account for a request, that was answered."""
+        if self.circuit_breaker:
+            self.circuit_breaker.release(success=True)
+
+    def aborted(self) -> None:
+        """Account for a request, that was cancelled or failed without telling anything about the state of the service."""
+        if self.circuit_breaker:
+            self.circuit_breaker.release(success=False)
+
+    def failed(self, error: ServiceError, attempt: int, *, retryable: bool = True) -> float | None:
+        """
+        Account for a request, that failed, and decide about retrying it.
+
+        :param error: Error the request failed with
+        :param attempt: Number of the failed attempt, starting at 0
+        :param retryable: False, if repeating the request might have unwanted side effects
+        :return: Seconds to wait before the next attempt or None, if the request shall not be retried
+        """
+        if isinstance(error, SsllabsOverloadedError):
+            self.metrics.overloaded += 1
+            if self.circuit_breaker:
+                self.circuit_breaker.trip(error.retry_after)
+        else:
+            self.metrics.unavailable += 1
+        if self.circuit_breaker:
+            self.circuit_breaker.release(success=False)
+        if not retryable or attempt >= self.max_retries:
+            if retryable and self.max_retries:
+                self.metrics.exhausted += 1
+            return None
+        self.metrics.retries += 1
+        return self.backoff(attempt, error.retry_after)
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Get seconds to wait before the next attempt.
+
+        :param attempt: Number of the failed attempt, starting at 0
+        :param retry_after: Seconds the service asked us to wait
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))  # noqa: S311
+        return max(delay, retry_after or 0.0)
+
+
+def retry_after(response: Response) -> float | None:
+    """
+    Get seconds to wait from the Retry-After header of a response.
+
+    :param response: Response of the service
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        LOGGER.debug("Ignoring malformed Retry-After header: %s", value)
+        return None
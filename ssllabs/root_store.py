@@ -0,0 +1,307 @@
+"""Parsed and indexed root certificates."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import re
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from .trust_store import TrustStore
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from .data.cert import CertData
+
+MAGIC = b"SSLRS\x01"
+"""Start of files written by RootStore.save, followed by the format version"""
+
+_PEM = re.compile(r"-----BEGIN CERTIFICATE-----(.*?)-----END CERTIFICATE-----", re.DOTALL)
+_SEPARATOR = re.compile(r"(?<!\\),\s+")
+
+# Short names of attribute types as used by RFC 2253
+_ATTRIBUTE_TYPES = {
+    "2.5.4.3": "CN",
+    "2.5.4.6": "C",
+    "2.5.4.7": "L",
+    "2.5.4.8": "ST",
+    "2.5.4.9": "STREET",
+    "2.5.4.10": "O",
+    "2.5.4.11": "OU",
+    "0.9.2342.19200300.100.1.1": "UID",
+    "0.9.2342.19200300.100.1.25": "DC",
+}
+
+_VERSION = 0xA0
+"""Tag of the explicitly tagged version, which is omitted in version 1 certificates"""
+
+# Decoders of ASN.1 string types by tag
+_STRINGS = {
+    0x0C: "utf-8",  # UTF8String
+    0x13: "ascii",  # PrintableString
+    0x14: "latin-1",  # TeletexString
+    0x16: "ascii",  # IA5String
+    0x1C: "utf-32-be",  # UniversalString
+    0x1E: "utf-16-be",  # BMPString
+}
+
+
+class RootCert:
+    """Root certificate with the values SSL Labs reports about certificates."""
+
+    __slots__ = ("der", "subject", "issuer", "sha256", "pin", "trust_stores")
+
+    def __init__(self, der: bytes, trust_stores: Iterable[TrustStore] = ()) -> None:
+        """
+        Parse a certificate.
+
+        :param der: DER encoded certificate
+        :param trust_stores: Trust stores containing the certificate
+        :raises ValueError: The certificate is malformed.
+        """
+        self.der = der
+        self.issuer, self.subject, spki = _parse(der)
+        self.sha256 = hashlib.sha256(der).hexdigest()
+        """Hex encoded SHA-256 hash of the certificate like CertData.sha256Hash"""
+        self.pin = base64.b64encode(hashlib.sha256(spki).digest()).decode()
+        """Base64 encoded SHA-256 hash of the public key like CertData.pinSha256"""
+        self.trust_stores = set(trust_stores)
+
+    def __repr__(self) -> str:
+        """Show the subject of the certificate."""
+        return f"<RootCert {self.subject}>"
+
+
+class RootStore:
+    """
+    Root certificates of one or more trust stores indexed for constant time lookups.
+
+    Certificates are indexed by subject, SHA-256 hash and SPKI pin in the formats SSL Labs uses in CertData, so the
+    issuerSubject, sha256Hash and pinSha256 values of results can be looked up directly. A certificate contained in several
+    trust stores is kept once and knows all of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty root store."""
+        self._by_sha256: dict[str, RootCert] = {}
+        self._by_subject: dict[str, list[RootCert]] = {}
+        self._by_pin: dict[str, list[RootCert]] = {}
+
+    @classmethod
+    def from_pem(cls: type[RootStore], bundle: str, trust_store: TrustStore | None = None) -> RootStore:
+        """
+        Parse the root certificates returned by Ssllabs.root_certs.
+
+        :param bundle: PEM encoded certificates. A single certificate may be base64 encoded without PEM headers.
+        :param trust_store: Trust store the certificates belong to
+        :raises ValueError: A certificate is malformed.
+        """
+        store = cls()
+        store.add_pem(bundle, trust_store)
+        return store
+
+    def add_pem(self, bundle: str, trust_store: TrustStore | None = None) -> None:
+        """
+        Add the root certificates of a trust store.
+
+        :param bundle: PEM encoded certificates. A single certificate may be base64 encoded without PEM headers.
+        :param trust_store: Trust store the certificates belong to
+        :raises ValueError: A certificate is malformed.
+        """
+        blocks = _PEM.findall(bundle) or [bundle]
+        for block in blocks:
+            try:
+                der = base64.b64decode("".join(block.split()), validate=True)
+            except binascii.Error as ex:
+                msg = "Malformed PEM block."
+                raise ValueError(msg) from ex
+            self.add(der, () if trust_store is None else (trust_store,))
+
+    def add(self, der: bytes, trust_stores: Iterable[TrustStore] = ()) -> RootCert:
+        """
+        Add a root certificate.
+
+        :param der: DER encoded certificate
+        :param trust_stores: Trust stores containing the certificate
+        :return: The added certificate or the already known one with the same hash
+        :raises ValueError: The certificate is malformed.
+        """
+        sha256 = hashlib.sha256(der).hexdigest()
+        cert = self._by_sha256.get(sha256)
+        if cert is None:
+            cert = self._by_sha256[sha256] = RootCert(der)
+            self._by_subject.setdefault(_normalize(cert.subject), []).append(cert)
+            self._by_pin.setdefault(cert.pin, []).append(cert)
+        cert.trust_stores.update(trust_stores)
+        return cert
+
+    def by_sha256(self, sha256: str) -> RootCert | None:
+        """
+        Look up a certificate by its hash.
+
+        :param sha256: Hex encoded SHA-256 hash of the certificate, e.g. CertData.sha256Hash
+        """
+        return self._by_sha256.get(sha256.lower())
+
+    def by_subject(self, subject: str) -> list[RootCert]:
+        """
+        Look up certificates by their subject. Several certificates, e.g. renewed ones, might share a subject.
+
+        :param subject: Subject in RFC 2253 format, e.g. CertData.issuerSubject. Spaces after separating commas are ignored.
+        """
+        return list(self._by_subject.get(_normalize(subject), ()))
+
+    def by_pin(self, pin: str) -> list[RootCert]:
+        """
+        Look up certificates by their public key. Several certificates might share a key.
+
+        :param pin: Base64 encoded SHA-256 hash of the public key, e.g. CertData.pinSha256
+        """
+        return list(self._by_pin.get(pin, ()))
+
+    def issuers(self, cert: CertData, trust_store: TrustStore | None = None) -> list[RootCert]:
+        """
+        Find the root certificates, that might have issued a certificate.
+
+        :param cert: Certificate of a result
+        :param trust_store: Trust store the root certificates have to belong to. If omitted, all trust stores are searched.
+        """
+        roots = self.by_subject(cert.issuerSubject)
+        return [root for root in roots if trust_store is None or trust_store in root.trust_stores]
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """
+        Write the certificates in a compact binary form.
+
+        :param path: Path to the file
+        """
+        chunks = [MAGIC]
+        for cert in self:
+            mask = sum(1 << trust_store.value for trust_store in cert.trust_stores)
+            chunks.append(struct.pack(">HI", mask, len(cert.der)))
+            chunks.append(cert.der)
+        Path(path).write_bytes(b"".join(chunks))
+
+    @classmethod
+    def load(cls: type[RootStore], path: str | PathLike[str]) -> RootStore:
+        """
+        Read certificates written by save.
+
+        :param path: Path to the file
+        :raises ValueError: The file was not written by save.
+        """
+        data = Path(path).read_bytes()
+        if not data.startswith(MAGIC):
+            msg = "Not a root store file."
+            raise ValueError(msg)
+        store = cls()
+        offset = len(MAGIC)
+        while offset < len(data):
+            try:
+                mask, length = struct.unpack_from(">HI", data, offset)
+            except struct.error as ex:
+                msg = "Truncated root store file."
+                raise ValueError(msg) from ex
+            offset += 6
+            store.add(data[offset : offset + length], (t for t in TrustStore if mask & 1 << t.value))
+            offset += length
+        return store
+
+    def __iter__(self) -> Iterator[RootCert]:
+        """Iterate the certificates."""
+        return iter(self._by_sha256.values())
+
+    def __len__(self) -> int:
+        """Get the number of certificates."""
+        return len(self._by_sha256)
+
+
+def _normalize(subject: str) -> str:
+    """Remove spaces after separating commas, which some tools add to RFC 2253 names."""
+    return _SEPARATOR.sub(",", subject)
+
+
+def _read(data: bytes, offset: int) -> tuple[int, int, int]:
+    """Read the header of a DER element. Return its tag and the start and end of its content."""
+    try:
+        tag = data[offset]
+        length = data[offset + 1]
+        start = offset + 2
+        if length & 0x80:
+            size = length & 0x7F
+            length = int.from_bytes(data[start : start + size], "big")
+            start += size
+    except IndexError:
+        length = -1
+        start = tag = 0
+    if length < 0 or start + length > len(data):
+        msg = "Malformed certificate."
+        raise ValueError(msg)
+    return tag, start, start + length
+
+
+def _parse(der: bytes) -> tuple[str, str, bytes]:
+    """Get the issuer, the subject and the DER encoded public key info of a certificate."""
+    _, start, _ = _read(der, 0)  # Certificate
+    _, offset, _ = _read(der, start)  # TBSCertificate
+    fields: list[tuple[int, int]] = []
+    while len(fields) < 7:  # noqa: PLR2004
+        tag, start, end = _read(der, offset)
+        if not fields and tag != _VERSION:
+            fields.append((0, 0))
+        fields.append((offset, end))
+        offset = end
+    # version, serialNumber, signature, issuer, validity, subject, subjectPublicKeyInfo
+    issuer, subject, spki = fields[3], fields[5], fields[6]
+    return _name(der, *issuer), _name(der, *subject), der[spki[0] : spki[1]]
+
+
+def _name(der: bytes, offset: int, end: int) -> str:
+    """Format a distinguished name like RFC 2253."""
+    _, offset, end = _read(der, offset)
+    rdns = []
+    while offset < end:
+        _, start, rdn_end = _read(der, offset)
+        attributes = []
+        while start < rdn_end:
+            _, attribute, attribute_end = _read(der, start)
+            _, oid_start, oid_end = _read(der, attribute)
+            oid = _oid(der[oid_start:oid_end])
+            attributes.append(f"{_ATTRIBUTE_TYPES.get(oid, oid)}={_value(der, oid_end, oid in _ATTRIBUTE_TYPES)}")
+            start = attribute_end
+        rdns.append("+".join(attributes))
+        offset = rdn_end
+    return ",".join(reversed(rdns))
+
+
+def _value(der: bytes, offset: int, known: bool) -> str:  # noqa: FBT001
+    """Format an attribute value like RFC 2253."""
+    tag, start, end = _read(der, offset)
+    if not known or tag not in _STRINGS:
+        return "#" + der[offset:end].hex()
+    value = der[start:end].decode(_STRINGS[tag], errors="replace")
+    value = re.sub(r'([,+"\\<>;])', r"\\\1", value)
+    if value.startswith(("#", " ")):
+        value = "\\" + value
+    if value.endswith(" "):
+        value = value[:-1] + "\\ "
+    return value
+
+
+def _oid(content: bytes) -> str:
+    """Format an object identifier."""
+    arcs = []
+    value = 0
+    for byte in content:
+        value = value << 7 | byte & 0x7F
+        if not byte & 0x80:
+            arcs.append(value)
+            value = 0
+    if not arcs:
+        return ""
+    first = min(arcs[0] // 40, 2)
+    return ".".join(str(arc) for arc in (first, arcs[0] - first * 40, *arcs[1:]))
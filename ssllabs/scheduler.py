@@ -0,0 +1,160 @@
+"""Scheduling of new assessments by priority and deadline."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+
+from .exceptions import DeadlineExceededError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Priority classes of assessments. Lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+@dataclass
+class QueueStats:
+    """Counters of a priority class."""
+
+    depth: int = 0
+    """Number of assessments waiting for their turn"""
+
+    granted: int = 0
+    """Number of assessments, that got their turn"""
+
+    expired: int = 0
+    """Number of assessments, whose deadline passed before they got their turn"""
+
+    total_wait: float = 0.0
+    """Seconds all granted assessments waited for their turn"""
+
+    max_wait: float = 0.0
+    """Longest time in seconds an assessment waited for its turn"""
+
+    @property
+    def mean_wait(self) -> float:
+        """Average seconds an assessment waited for its turn."""
+        return self.total_wait / self.granted if self.granted else 0.0
+
+
+class _Waiter:
+    """Assessment waiting for its turn."""
+
+    __slots__ = ("priority", "deadline", "enqueued", "order", "future", "timer")
+
+    def __init__(self, priority: Priority, deadline: float, order: int, future: asyncio.Future[None]) -> None:
+        self.priority = priority
+        self.deadline = deadline
+        self.enqueued = time.monotonic()
+        self.order = order
+        self.future = future
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class AssessmentScheduler:
+    """
+    Decide which assessment may start next.
+
+    Only one assessment at a time waits for a free slot and the cool off. When it started, the turn is handed to the
+    waiting assessment of the most urgent priority class, so interactive requests overtake batch work. Within a class,
+    assessments with the earliest deadline go first, then the oldest ones. To keep batch work from starving, a waiting
+    assessment is promoted by one class for every aging interval it waited. An assessment, whose deadline passes while it
+    waits, is given up with a DeadlineExceededError. A single scheduler can be shared between multiple Ssllabs instances.
+    """
+
+    def __init__(self, aging: float | None = 300.0) -> None:
+        """
+        Initialize scheduler.
+
+        :param aging: Seconds after which a waiting assessment is promoted to the next priority class. Set to None to
+                      strictly serve more urgent classes first.
+        """
+        self.aging = aging
+        self.stats = {priority: QueueStats() for priority in Priority}
+        self._busy = False
+        self._waiters: list[_Waiter] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: Priority = Priority.NORMAL, deadline: float | None = None) -> None:
+        """
+        Wait for the turn to start an assessment.
+
+        :param priority: Priority class of the assessment
+        :param deadline: Seconds within which the assessment has to get its turn
+        :raises DeadlineExceededError: The deadline passed before the assessment got its turn.
+        """
+        stats = self.stats[priority]
+        if not self._busy and not self._waiters:
+            self._busy = True
+            stats.granted += 1
+            return
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority,
+            math.inf if deadline is None else time.monotonic() + deadline,
+            next(self._counter),
+            loop.create_future(),
+        )
+        if deadline is not None:
+            waiter.timer = loop.call_later(deadline, self._expire, waiter)
+        self._waiters.append(waiter)
+        stats.depth += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                # The turn was handed to us right before we were cancelled
+                self.release()
+            else:
+                self._remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Hand the turn to the most urgent waiting assessment."""
+        if not self._waiters:
+            self._busy = False
+            return
+        now = time.monotonic()
+        waiter = min(self._waiters, key=lambda w: self._rank(w, now))
+        self._remove(waiter)
+        wait = now - waiter.enqueued
+        stats = self.stats[waiter.priority]
+        stats.granted += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        waiter.future.set_result(None)
+
+    def _rank(self, waiter: _Waiter, now: float) -> tuple[float, float, int]:
+        """Get the sort key of a waiting assessment. Smaller keys are served first."""
+        priority = float(waiter.priority)
+        if self.aging:
+            priority -= (now - waiter.enqueued) // self.aging
+        return priority, waiter.deadline, waiter.order
+
+    def _expire(self, waiter: _Waiter) -> None:
+        """Give up an assessment, whose deadline passed."""
+        if waiter.future.done():
+            return
+        self._remove(waiter)
+        self.stats[waiter.priority].expired += 1
+        LOGGER.debug("Deadline passed before an assessment of priority %s could start.", waiter.priority.name)
+        waiter.future.set_exception(DeadlineExceededError())
+
+    def _remove(self, waiter: _Waiter) -> None:
+        """Remove an assessment from the waiting ones."""
+        if waiter.timer is not None:
+            waiter.timer.cancel()
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            self.stats[waiter.priority].depth -= 1
@@ -3,43 +3,162 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
-from typing import TYPE_CHECKING
+from functools import partial
+from importlib.util import find_spec
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Literal,
+    TypeVar,
+    overload,
+)
 
-from .api import Analyze, Info, RootCertsRaw, StatusCodes
-from .exceptions import SsllabsUnavailableError
+from httpx import AsyncClient, Limits
+
+from .api import Analyze, Endpoint, Info, RootCertsRaw, StatusCodes
+from .capacity import AssessmentCapacity
+from .data.host import HostData
+from .data.info import InfoData
+from .data.status_codes import StatusCodesData
+from .events import Events, ProgressTracker
+from .exceptions import AssessmentError, DeadlineExceededError, SsllabsUnavailableError
+from .poller import Poller
+from .polling import PollingPolicy
+from .raw import RawResponse
+from .retry import RetryPolicy
+from .root_store import RootStore
+from .scheduler import AssessmentScheduler, Priority
 from .trust_store import TrustStore
 
 if TYPE_CHECKING:
-    from httpx import AsyncClient
+    from types import TracebackType
 
-    from .data.host import HostData
-    from .data.info import InfoData
-    from .data.status_codes import StatusCodesData
+    from .api._api import _Api
+    from .cache import ResultCache
+    from .coordination import SlotLedger
+    from .data.endpoint import EndpointData
+    from .intern import InternPool
+    from .lookup_cache import LookupCache
 
+    _ApiT = TypeVar("_ApiT", bound=_Api)
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_LIMITS = Limits(max_connections=30, max_keepalive_connections=30, keepalive_expiry=60.0)
+
 
 class Ssllabs:
     """High level methods to interact with the SSL Labs Assessment APIs."""
 
-    def __init__(self, client: AsyncClient | None = None) -> None:
-        """Initialize SSL Labs."""
+    def __init__(  # noqa: PLR0913
+        self,
+        client: AsyncClient | None = None,
+        *,
+        polling_policy: PollingPolicy | None = None,
+        poller: Poller | None = None,
+        capacity: AssessmentCapacity | None = None,
+        scheduler: AssessmentScheduler | None = None,
+        ledger: SlotLedger | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResultCache | None = None,
+        lookup_cache: LookupCache | None = None,
+        intern_pool: InternPool | None = None,
+        events: Events | None = None,
+        limits: Limits = DEFAULT_LIMITS,
+        http2: bool = True,
+    ) -> None:
+        """
+        Initialize SSL Labs.
+
+        :param client: HTTP client to use for all requests. If omitted and used as async context manager, an own pooled client
+                       is used. Otherwise, a new connection is established for every request.
+        :param polling_policy: Policy deciding how often running assessments are polled
+        :param poller: Poller polling all running assessments at a capped rate, which might be shared with other instances
+        :param capacity: Assessment capacity tracker, which might be shared with other instances
+        :param scheduler: Scheduler deciding which assessment starts next, which might be shared with other instances
+        :param ledger: Ledger sharing the assessment slots and the cool off with other processes
+        :param retry_policy: Policy to retry requests, while the service is overloaded or unavailable
+        :param cache: Local cache of finished results, which is used before asking SSL Labs for cached results
+        :param lookup_cache: Cache of the results of info, status_codes and root_certs
+        :param intern_pool: Pool to share identical certificates, cipher suites and simulation clients between results
+        :param events: Events to publish the progress of running assessments to, which might be shared with other instances
+        :param limits: Connection pool limits of the own client
+        :param http2: True, if the own client shall multiplex requests via HTTP/2. Requires the http2 extra to be installed.
+        """
         self._client = client
-        self._semaphore = asyncio.Semaphore(1)
+        self._own_client = False
+        self._limits = limits
+        self._http2 = http2
+        self._polling_policy = polling_policy or PollingPolicy()
+        self._poller = poller or Poller()
+        self._capacity = capacity or AssessmentCapacity()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._cache = cache
+        self._lookup_cache = lookup_cache
+        self._intern_pool = intern_pool
+        self._events = events or Events()
+        self._scheduler = scheduler or AssessmentScheduler()
+        self._ledger = ledger
+        self._last_start: float | None = None
+        self._in_flight: dict[tuple[Any, ...], asyncio.Future[HostData | RawResponse]] = {}
+        self._in_flight_waiters: dict[tuple[Any, ...], int] = {}
         LOGGER.info(
             "You will be sending assessment requests to remote SSL Labs servers and information will be shared with them.",
         )
         LOGGER.info("Please subject to the terms and conditions: https://www.ssllabs.com/about/terms.html")
 
+    async def __aenter__(self) -> Ssllabs:  # noqa: PYI034
+        """Open a pooled HTTP client, if no client was given."""
+        if self._client is None:
+            http2 = self._http2 and find_spec("h2") is not None
+            if self._http2 and not http2:
+                LOGGER.debug("HTTP/2 is not available. Install the http2 extra to use it.")
+            self._client = AsyncClient(http2=http2, limits=self._limits, timeout=30.0)
+            self._own_client = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the pooled HTTP client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, if it was opened by this instance."""
+        if self._own_client and self._client:
+            await self._client.aclose()
+            self._client = None
+            self._own_client = False
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Policy to retry requests. Its metrics and the metrics of its circuit breaker tell how often we had to wait."""
+        return self._retry_policy
+
+    @property
+    def events(self) -> Events:
+        """Progress events of running assessments. Subscribe a callback or listen to them as async iterator."""
+        return self._events
+
     async def availability(self) -> bool:
         """
         Check the availability of the SSL Labs servers.
 
         See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#error-response-status-codes
         """
-        i = Info(self._client)
+        i = self._api(Info, retry=False)
         try:
             await i.get()
         except SsllabsUnavailableError as ex:
@@ -49,6 +168,36 @@ class Ssllabs:
             LOGGER.info("SSL Labs servers are up and running.")
             return True
 
+    @overload
+    async def analyze(  # noqa: PLR0913
+        self,
+        host: str,
+        *,
+        publish: bool = ...,
+        ignore_mismatch: bool = ...,
+        from_cache: bool = ...,
+        max_age: int | None = ...,
+        priority: Priority = ...,
+        deadline: float | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[False] = ...,
+    ) -> HostData: ...
+
+    @overload
+    async def analyze(  # noqa: PLR0913
+        self,
+        host: str,
+        *,
+        publish: bool = ...,
+        ignore_mismatch: bool = ...,
+        from_cache: bool = ...,
+        max_age: int | None = ...,
+        priority: Priority = ...,
+        deadline: float | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[True],
+    ) -> RawResponse: ...
+
     async def analyze(  # noqa: PLR0913
         self,
         host: str,
@@ -57,7 +206,11 @@ class Ssllabs:
         ignore_mismatch: bool = False,
         from_cache: bool = False,
         max_age: int | None = None,
-    ) -> HostData:
+        priority: Priority = Priority.NORMAL,
+        deadline: float | None = None,
+        timeout: float | None = None,
+        raw: bool = False,
+    ) -> HostData | RawResponse:
         """
         Test a particular host with respect to the cool off and the maximum number of assessments.
 
@@ -66,41 +219,470 @@ class Ssllabs:
         :param ignore_mismatch: True if assessment shall proceed even when the server certificate doesn't match the hostname
         :param from_cache: True if cached results should be used instead of new assessments
         :param max_age: Maximum age cached data might have in hours
+        :param priority: Priority class deciding which assessment starts next, if several wait for a slot
+        :param deadline: Seconds within which the assessment has to start. If it passes, DeadlineExceededError is raised.
+        :param timeout: Seconds within which the assessment has to finish. If it passes, the assessment is not polled anymore
+                        and DeadlineExceededError is raised.
+        :param raw: True if the result shall be returned as RawResponse without decoding it
+
+        Concurrent calls for the same host with the same options share one assessment and get the same result. The priority
+        and deadline of the first call apply to the shared assessment, the timeout applies to every call on its own.
 
         See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#protocol-usage
         """
-        await self._semaphore.acquire()
-        LOGGER.info("Analyzing %s", host)
-        i = Info(self._client)
-        info = await i.get()
-        for message in info.messages:
-            LOGGER.info("%s", message)
+        params = self._start_params(publish=publish, ignore_mismatch=ignore_mismatch, from_cache=from_cache, max_age=max_age)
+        return await self._analyze(host, params, priority=priority, deadline=deadline, timeout=timeout, raw=raw)
+
+    async def analyze_endpoints(  # noqa: PLR0913
+        self,
+        host: str,
+        *,
+        ips: Collection[str] | None = None,
+        on_endpoint: Callable[[EndpointData], Any] | None = None,
+        publish: bool = False,
+        ignore_mismatch: bool = False,
+        from_cache: bool = False,
+        max_age: int | None = None,
+        priority: Priority = Priority.NORMAL,
+        deadline: float | None = None,
+        timeout: float | None = None,
+    ) -> HostData:
+        """
+        Test a particular host polling only summaries and fetch the details of its endpoints concurrently afterwards.
+
+        Instead of one large response with the details of all endpoints, the details of every endpoint are fetched on their
+        own as soon as the assessment is finished. Each endpoint is decoded and replaces its summary in the result as soon as
+        it arrives, so hosts with many endpoints deliver their first details earlier.
+
+        :param host: Host to test
+        :param ips: IP addresses of the endpoints to fetch details of. Other endpoints keep their summaries. If omitted, all
+                    endpoints are fetched.
+        :param on_endpoint: Function called with the details of every endpoint as soon as they arrive
+        :param publish: True if assessment results should be published on the public results boards
+        :param ignore_mismatch: True if assessment shall proceed even when the server certificate doesn't match the hostname
+        :param from_cache: True if cached results should be used instead of new assessments
+        :param max_age: Maximum age cached data might have in hours
+        :param priority: Priority class deciding which assessment starts next, if several wait for a slot
+        :param deadline: Seconds within which the assessment has to start. If it passes, DeadlineExceededError is raised.
+        :param timeout: Seconds within which the assessment has to finish. If it passes, the assessment is not polled anymore
+                        and DeadlineExceededError is raised.
+        :raises EndpointError: The details of an endpoint could not be fetched.
+
+        See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#retrieve-detailed-endpoint-information
+        """
+        params = self._start_params(publish=publish, ignore_mismatch=ignore_mismatch, from_cache=from_cache, max_age=max_age)
+        result: HostData = await self._analyze(
+            host,
+            params,
+            priority=priority,
+            deadline=deadline,
+            timeout=timeout,
+            details=False,
+        )
+        # Endpoints of cached results already come with their details
+        missing = [
+            index
+            for index, endpoint in enumerate(result.endpoints or [])
+            if endpoint.details is None and (ips is None or endpoint.ipAddress in ips)
+        ]
+        if not missing:
+            return result
+        # The summary must not be changed, as concurrent callers share it
+        result = dataclasses.replace(result, endpoints=list(result.endpoints or []))
+        await self._fetch_endpoints(result, missing, on_endpoint)
+        if self._cache is not None and ips is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._cache.put, result)
+        return result
+
+    def analyze_many(  # noqa: PLR0913
+        self,
+        hosts: Iterable[str],
+        *,
+        publish: bool = False,
+        ignore_mismatch: bool = False,
+        from_cache: bool = False,
+        max_age: int | None = None,
+        priority: Priority = Priority.NORMAL,
+        timeout: float | None = None,
+        return_exceptions: bool = True,
+    ) -> AsyncGenerator[HostData | AssessmentError, None]:
+        """
+        Test multiple hosts using all assessment slots SSL Labs grants to us.
+
+        New assessments are started as soon as a slot is free, spaced by the cool off. Results are yielded as soon as the
+        corresponding assessment is finished, so they usually arrive in a different order than the hosts were given. This is
+        a shortcut for stream with the default window.
+
+        :param hosts: Hosts to test
+        :param publish: True if assessment results should be published on the public results boards
+        :param ignore_mismatch: True if assessment shall proceed even when the server certificate doesn't match the hostname
+        :param from_cache: True if cached results should be used instead of new assessments
+        :param max_age: Maximum age cached data might have in hours
+        :param priority: Priority class deciding which assessment starts next, if several wait for a slot
+        :param timeout: Seconds within which the assessment of a host has to finish. If it passes, DeadlineExceededError is
+                        raised for the host.
+        :param return_exceptions: True if a failed assessment shall be yielded as AssessmentError, while the others go on. If
+                                  False, the first failure is raised and all other assessments are abandoned.
+
+        See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#access-rate-and-rate-limiting
+        """
+        return self.stream(
+            hosts,
+            publish=publish,
+            ignore_mismatch=ignore_mismatch,
+            from_cache=from_cache,
+            max_age=max_age,
+            priority=priority,
+            timeout=timeout,
+            return_exceptions=return_exceptions,
+        )
 
-        # Wait for a free slot, if all slots are in use
-        while info.currentAssessments >= info.maxAssessments:
-            LOGGER.warning("Already %i assessments running. Need to wait.", info.currentAssessments)
+    async def stream(  # noqa: PLR0913
+        self,
+        hosts: Iterable[str] | AsyncIterable[str],
+        *,
+        publish: bool = False,
+        ignore_mismatch: bool = False,
+        from_cache: bool = False,
+        max_age: int | None = None,
+        priority: Priority = Priority.NORMAL,
+        timeout: float | None = None,
+        return_exceptions: bool = True,
+        window: int | None = None,
+    ) -> AsyncGenerator[HostData | AssessmentError, None]:
+        """
+        Test hosts from a possibly endless source and yield each result as soon as its assessment is finished.
+
+        Hosts are taken from the source only when there is room in the window, so neither the hosts nor the results pile up
+        in memory. If the results are not consumed, no new assessments are started.
+
+        :param hosts: Hosts to test, e.g. a list or an async generator reading them from a file
+        :param publish: True if assessment results should be published on the public results boards
+        :param ignore_mismatch: True if assessment shall proceed even when the server certificate doesn't match the hostname
+        :param from_cache: True if cached results should be used instead of new assessments
+        :param max_age: Maximum age cached data might have in hours
+        :param priority: Priority class deciding which assessment starts next, if several wait for a slot
+        :param timeout: Seconds within which the assessment of a host has to finish. If it passes, DeadlineExceededError is
+                        raised for the host.
+        :param return_exceptions: True if a failed assessment shall be yielded as AssessmentError, while the others go on. If
+                                  False, the first failure is raised and all other assessments are abandoned.
+        :param window: Maximum number of hosts being assessed and of results waiting to be consumed. Defaults to the number
+                       of assessments SSL Labs allows us to run concurrently.
+        """
+        if window is None:
+            if self._capacity.stale:
+                await self._refresh_capacity()
+            window = self._capacity.max_assessments or 1
+        window = max(window, 1)
+        params = self._start_params(publish=publish, ignore_mismatch=ignore_mismatch, from_cache=from_cache, max_age=max_age)
+
+        host_iterator = _iterate(hosts)
+        lock = asyncio.Lock()
+        results: asyncio.Queue[HostData | AssessmentError | Exception | None] = asyncio.Queue(window)
+        analyze = partial(self._try_analyze, params=params, priority=priority, timeout=timeout)
+        workers = [asyncio.ensure_future(self._stream_worker(host_iterator, lock, analyze, results)) for _ in range(window)]
+        running = len(workers)
+        try:
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                elif isinstance(result, AssessmentError):
+                    if not return_exceptions:
+                        raise result.error
+                    yield result
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    yield result
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await host_iterator.aclose()
+
+    async def _stream_worker(
+        self,
+        hosts: AsyncIterator[str],
+        lock: asyncio.Lock,
+        analyze: Callable[[str], Awaitable[HostData | AssessmentError]],
+        results: asyncio.Queue[HostData | AssessmentError | Exception | None],
+    ) -> None:
+        """Assess hosts one after another and put the results into the queue. None marks the end of the hosts."""
+        while True:
+            try:
+                async with lock:
+                    host = await hosts.__anext__()
+            except StopAsyncIteration:
+                break
+            except Exception as ex:  # noqa: BLE001
+                # Reading the hosts failed, which is not the fault of a single assessment
+                await results.put(ex)
+                return
+            await results.put(await analyze(host))
+        await results.put(None)
+
+    async def _analyze(  # noqa: PLR0913
+        self,
+        host: str,
+        params: dict[str, Any],
+        *,
+        priority: Priority = Priority.NORMAL,
+        deadline: float | None = None,
+        timeout: float | None = None,
+        raw: bool = False,
+        details: bool = True,
+    ) -> Any:
+        """Start an assessment and wait for its result, sharing it with concurrent callers asking for the same."""
+        key = (host, raw, details, *params.items())
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = self._in_flight[key] = asyncio.ensure_future(
+                self._assess(host, params, priority=priority, deadline=deadline, raw=raw, details=details),
+            )
+            flight.add_done_callback(lambda done: self._in_flight.pop(key) if self._in_flight.get(key) is done else None)
+        else:
+            LOGGER.debug("Joining running assessment of %s.", host)
+        self._in_flight_waiters[key] = self._in_flight_waiters.get(key, 0) + 1
+        try:
+            if timeout is None:
+                return await asyncio.shield(flight)
+            return await asyncio.wait_for(asyncio.shield(flight), timeout)
+        except asyncio.TimeoutError:
+            if flight.done():
+                raise
+            msg = f"The assessment of {host} did not finish within {timeout} seconds."
+            raise DeadlineExceededError(msg) from None
+        finally:
+            self._in_flight_waiters[key] -= 1
+            if not self._in_flight_waiters[key]:
+                del self._in_flight_waiters[key]
+                # Nobody is interested in the result anymore
+                flight.cancel()
+
+    async def _assess(  # noqa: PLR0913
+        self,
+        host: str,
+        params: dict[str, Any],
+        *,
+        priority: Priority = Priority.NORMAL,
+        deadline: float | None = None,
+        raw: bool = False,
+        details: bool = True,
+    ) -> HostData | RawResponse:
+        """Start an assessment and wait for its result. Without details, only the summaries of the endpoints are polled."""
+        loop = asyncio.get_running_loop()
+        if self._cache is not None and params["fromCache"] == "on":
+            get: Callable[[], HostData | RawResponse | None]
+            if raw:
+                get = partial(self._cache.get_raw, host, max_age=params["maxAge"])
+            else:
+                get = partial(self._cache.get, host, max_age=params["maxAge"], pool=self._intern_pool)
+            cached = await loop.run_in_executor(None, get)
+            if cached:
+                return cached
+
+        a = self._api(Analyze)
+        result, lease = await self._start(a, host, params, priority=priority, deadline=deadline, raw=raw)
+        updates = self._capacity.updates
+        try:
+            result = await self._wait_until_ready(a, host, result, details=details)
+        finally:
+            self._capacity.assessment_finished(updates)
+            if lease is not None:
+                await self._release_lease(lease)
+        if self._cache is not None and details:
+            if isinstance(result, RawResponse):
+                await loop.run_in_executor(None, self._cache.put_raw, result)
+            else:
+                await loop.run_in_executor(None, self._cache.put, result)
+        return result
+
+    async def _fetch_endpoints(
+        self,
+        result: HostData,
+        indexes: list[int],
+        on_endpoint: Callable[[EndpointData], Any] | None,
+    ) -> None:
+        """Fetch the details of endpoints concurrently and replace their summaries as soon as they arrive."""
+        endpoints = result.endpoints or []
+        e = self._api(Endpoint)
+
+        async def fetch(index: int) -> tuple[int, EndpointData]:
+            return index, await e.get(result.host, endpoints[index].ipAddress)
+
+        tasks = [asyncio.ensure_future(fetch(index)) for index in indexes]
+        try:
+            for task in asyncio.as_completed(tasks):
+                index, details = await task
+                endpoints[index] = details
+                if on_endpoint is not None:
+                    on_endpoint(details)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _try_analyze(
+        self,
+        host: str,
+        params: dict[str, Any],
+        *,
+        priority: Priority,
+        timeout: float | None,
+    ) -> HostData | AssessmentError:
+        """Start an assessment and wait for its result, returning an error instead of raising it."""
+        try:
+            return await self._analyze(host, params, priority=priority, timeout=timeout)
+        except Exception as ex:  # noqa: BLE001
+            return AssessmentError(host, ex)
+
+    async def _start(  # noqa: PLR0913
+        self,
+        a: Analyze,
+        host: str,
+        params: dict[str, Any],
+        *,
+        priority: Priority,
+        deadline: float | None,
+        raw: bool,
+    ) -> tuple[HostData | RawResponse, int | None]:
+        """
+        Start an assessment with respect to its priority, the cool off and the maximum number of assessments.
+
+        :return: The first result and the lease of the slot in the ledger, if one is used
+        """
+        loop = asyncio.get_running_loop()
+        enqueued = loop.time()
+        await self._scheduler.acquire(priority, deadline)
+        try:
+            if deadline is None:
+                lease = await self._wait_for_slot()
+            else:
+                # The deadline also covers waiting for a free slot and the cool off after getting the turn
+                try:
+                    lease = await asyncio.wait_for(self._wait_for_slot(), max(deadline - (loop.time() - enqueued), 0))
+                except asyncio.TimeoutError:
+                    raise DeadlineExceededError from None
+            try:
+                LOGGER.info("Analyzing %s", host)
+                updates = self._capacity.updates
+                result = await (a.get_raw if raw else a.get)(host=host, **params)
+            except BaseException:
+                if lease is not None:
+                    await self._release_lease(lease)
+                raise
+            self._last_start = loop.time()
+            self._capacity.assessment_started(updates)
+        finally:
+            self._scheduler.release()
+        return result, lease
+
+    async def _wait_for_slot(self) -> int | None:
+        """Wait until a new assessment may be started and lease its slot in the ledger, if one is used."""
+        if self._capacity.stale:
+            await self._refresh_capacity()
+
+        # Wait for a free slot, if all slots are in use. Responses to other calls keep the capacity up to date.
+        while self._capacity.free_slots <= 0:
+            LOGGER.warning("Already %i assessments running. Need to wait.", self._capacity.current_assessments)
             await asyncio.sleep(1)
-            info = await i.get()
+            if self._capacity.stale:
+                await self._refresh_capacity()
 
         # If there is already an assessment running, wait the needed cool off until starting the next one
-        if info.currentAssessments != 0:
-            await asyncio.sleep(info.newAssessmentCoolOff / 1000)
-
-        a = Analyze(self._client)
-        host_object = await a.get(
-            host=host,
-            startNew="off" if from_cache else "on",
-            fromCache="on" if from_cache else "off",
-            publish="on" if publish else "off",
-            ignoreMismatch="on" if ignore_mismatch else "off",
-            maxAge=max_age,
-        )
-        self._semaphore.release()
-        while host_object.status not in ["READY", "ERROR"]:
-            LOGGER.debug("Assessment of %s not ready yet.", host)
-            await asyncio.sleep(10)
-            host_object = await a.get(host=host, all="done")
-        return host_object
+        if self._capacity.current_assessments != 0:
+            cool_off = self._capacity.new_assessment_cool_off
+            if self._last_start is not None:
+                cool_off += self._last_start - asyncio.get_running_loop().time()
+            if cool_off > 0:
+                await asyncio.sleep(cool_off)
+
+        if self._ledger is None:
+            return None
+        return await self._lease_slot(self._ledger)
+
+    async def _lease_slot(self, ledger: SlotLedger) -> int:
+        """Lease a slot in the ledger. Other processes might use the slots or have started an assessment just now."""
+        loop = asyncio.get_running_loop()
+        while True:
+            acquire = loop.run_in_executor(
+                None,
+                ledger.acquire,
+                self._capacity.max_assessments or 1,
+                self._capacity.new_assessment_cool_off,
+            )
+            try:
+                lease, delay = await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                # The executor leases the slot anyway, so give it back as soon as it is done
+                acquire.add_done_callback(self._release_abandoned_lease)
+                raise
+            if lease is not None:
+                return lease
+            LOGGER.debug("Waiting %.1f seconds for a slot used by another process.", delay)
+            await asyncio.sleep(delay)
+
+    async def _release_lease(self, lease: int) -> None:
+        """Give back a slot leased in the ledger."""
+        if self._ledger is not None:
+            # Make sure the slot is given back, even if the assessment is cancelled
+            await asyncio.shield(asyncio.get_running_loop().run_in_executor(None, self._ledger.release, lease))
+
+    def _release_abandoned_lease(self, acquire: asyncio.Future[tuple[int | None, float]]) -> None:
+        """Give back a slot leased in the ledger for an assessment, that was cancelled while waiting for it."""
+        if self._ledger is None or acquire.cancelled() or acquire.exception() is not None:
+            return
+        lease, _ = acquire.result()
+        if lease is not None:
+            asyncio.get_running_loop().run_in_executor(None, self._ledger.release, lease)
+
+    async def _refresh_capacity(self) -> None:
+        """Refresh the assessment capacity from the info endpoint."""
+        info = await self._api(Info).get()
+        for message in info.messages:
+            LOGGER.info("%s", message)
+        self._capacity.update_from_info(info)
+
+    async def _wait_until_ready(
+        self,
+        a: Analyze,
+        host: str,
+        result: HostData | RawResponse,
+        *,
+        details: bool = True,
+    ) -> HostData | RawResponse:
+        """Poll an assessment until it is finished."""
+        poll: Callable[[], Awaitable[HostData | RawResponse]]
+        kwargs = {"all": "done"} if details else {}
+        if isinstance(result, RawResponse):
+            poll = partial(a.get_raw, host=host, **kwargs)
+        else:
+            poll = partial(a.get, host=host, **kwargs)
+        return await self._poller.wait(result, poll, partial(self._interval, host, ProgressTracker(self._events)))
+
+    def _interval(self, host: str, tracker: ProgressTracker, result: HostData | RawResponse) -> float | None:
+        """Publish the progress and get seconds to wait before polling again or None, if the assessment is finished."""
+        finished = result.status in ["READY", "ERROR"]
+        if finished and not self._events.listening:
+            return None
+        # Raw responses are only decoded to publish the progress and to decide about the polling interval
+        host_object = result.decode(HostData, self._intern_pool) if isinstance(result, RawResponse) else result
+        tracker.update(host_object)
+        if finished:
+            return None
+        LOGGER.debug("Assessment of %s not ready yet.", host)
+        return self._polling_policy.interval(host_object)
+
+    @staticmethod
+    def _start_params(*, publish: bool, ignore_mismatch: bool, from_cache: bool, max_age: int | None) -> dict[str, Any]:
+        """Translate high level options into parameters of the analyze API call."""
+        return {
+            "startNew": "off" if from_cache else "on",
+            "fromCache": "on" if from_cache else "off",
+            "publish": "on" if publish else "off",
+            "ignoreMismatch": "on" if ignore_mismatch else "off",
+            "maxAge": max_age,
+        }
 
     async def info(self) -> InfoData:
         """
@@ -108,8 +690,14 @@ class Ssllabs:
 
         See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#info
         """
-        i = Info(self._client)
-        return await i.get()
+        cached = await self._cached("info", InfoData)
+        if cached is not None:
+            return cached
+        i = self._api(Info)
+        info = await i.get()
+        self._capacity.update_from_info(info)
+        await self._cache_lookup("info", info)
+        return info
 
     async def root_certs(self, trust_store: TrustStore = TrustStore.MOZILLA) -> str:
         """
@@ -119,8 +707,29 @@ class Ssllabs:
 
         See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#retrieve-root-certificates
         """
-        rcr = RootCertsRaw(self._client)
-        return await rcr.get(trustStore=trust_store)
+        key = f"root_certs:{trust_store.value}"
+        cached = await self._cached(key)
+        if cached is not None:
+            return cached
+        rcr = self._api(RootCertsRaw)
+        root_certs = await rcr.get(trustStore=trust_store)
+        await self._cache_lookup(key, root_certs)
+        return root_certs
+
+    async def root_store(self, trust_stores: Iterable[TrustStore] = tuple(TrustStore)) -> RootStore:
+        """
+        Retrieve root certificates of multiple trust stores and index them.
+
+        The trust stores are retrieved concurrently. Use a lookup cache to avoid retrieving them again.
+
+        :param trust_stores: Trust stores to retrieve. By default, all trust stores are retrieved.
+        """
+        trust_stores = list(trust_stores)
+        bundles = await asyncio.gather(*(self.root_certs(trust_store) for trust_store in trust_stores))
+        store = RootStore()
+        for trust_store, bundle in zip(trust_stores, bundles):
+            store.add_pem(bundle, trust_store)
+        return store
 
     async def status_codes(self) -> StatusCodesData:
         """
@@ -128,5 +737,46 @@ class Ssllabs:
 
         See also: https://github.com/ssllabs/ssllabs-scan/blob/master/ssllabs-api-docs-v3.md#retrieve-known-status-codes
         """
-        sc = StatusCodes(self._client)
-        return await sc.get()
+        cached = await self._cached("status_codes", StatusCodesData)
+        if cached is not None:
+            return cached
+        sc = self._api(StatusCodes)
+        status_codes = await sc.get()
+        await self._cache_lookup("status_codes", status_codes)
+        return status_codes
+
+    async def _cached(self, key: str, data_class: type | None = None) -> Any:
+        """Get the cached result of a lookup or None, if it has to be fetched."""
+        if self._lookup_cache is None:
+            return None
+        if self._lookup_cache.path is None:
+            return self._lookup_cache.get(key, data_class)
+        return await asyncio.get_running_loop().run_in_executor(None, self._lookup_cache.get, key, data_class)
+
+    async def _cache_lookup(self, key: str, value: Any) -> None:
+        """Cache the result of a lookup."""
+        if self._lookup_cache is None:
+            return
+        if self._lookup_cache.path is None:
+            self._lookup_cache.put(key, value)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self._lookup_cache.put, key, value)
+
+    def _api(self, api: type[_ApiT], *, retry: bool = True) -> _ApiT:
+        """Create an API object sharing the state of this instance."""
+        return api(
+            self._client,
+            capacity=self._capacity,
+            retry_policy=self._retry_policy if retry else None,
+            intern_pool=self._intern_pool,
+        )
+
+
+async def _iterate(hosts: Iterable[str] | AsyncIterable[str]) -> AsyncGenerator[str, None]:
+    """Iterate synchronous and asynchronous sources of hosts alike."""
+    if isinstance(hosts, AsyncIterable):
+        async for host in hosts:
+            yield host
+    else:
+        for host in hosts:
+            yield host
@@ -5,9 +5,11 @@ from json import loads
 from pathlib import Path
 from typing import Any
 
+FIXTURES = Path(__file__).parent / "test_data"
+
 
 @lru_cache
 def load_fixture(filename: str) -> Any:
     """Load a fixture."""
-    path = Path(__file__).parent / "test_data" / f"{filename}.json"
+    path = FIXTURES / f"{filename}.json"
     return loads(path.read_text())
@@ -0,0 +1,86 @@
+"""Test the binary form of data classes."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any, Iterator
+
+import pytest
+from dacite import MissingValueError
+
+from ssllabs.archive import FORMAT_VERSION, MAGIC, dump, load, schema_version
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.data.host import HostData
+from ssllabs.data.info import InfoData
+from ssllabs.data.status_codes import StatusCodesData
+from ssllabs.decoder import decode, get_lazy_decoding, set_lazy_decoding
+
+from . import load_fixture
+
+
+@pytest.fixture()
+def _lazy_decoding() -> Iterator[None]:
+    """Decode lazy fields on first access during the test."""
+    enabled = get_lazy_decoding()
+    set_lazy_decoding(enabled=True)
+    yield
+    set_lazy_decoding(enabled)
+
+
+@pytest.mark.usefixtures("_lazy_decoding")
+@pytest.mark.parametrize(
+    ("data_class", "fixture"),
+    [
+        (HostData, "analyze"),
+        (HostData, "analyze_running"),
+        (EndpointData, "endpoint"),
+        (InfoData, "info"),
+        (StatusCodesData, "status_codes"),
+    ],
+)
+def test_round_trip(data_class: type, fixture: str) -> None:
+    """Test loading a dump gives an equal instance, whether lazy fields were decoded or not."""
+    instance: Any = decode(data_class, load_fixture(fixture))
+    undecoded = dump(instance)
+    dataclasses.asdict(instance)
+    decoded = dump(instance)
+    assert load(data_class, undecoded) == instance
+    assert load(data_class, decoded) == instance
+    assert len(decoded) < len(json.dumps(load_fixture(fixture), separators=(",", ":")))
+
+
+def test_load_buffer() -> None:
+    """Test loading from a memoryview without copying it first."""
+    instance = decode(EndpointData, load_fixture("endpoint"))
+    assert load(EndpointData, memoryview(bytearray(dump(instance)))) == instance
+
+
+@pytest.mark.usefixtures("_lazy_decoding")
+def test_missing_value() -> None:
+    """Test dumping raw lazy fields checks for missing values like decoding them."""
+    data: dict[str, Any] = {**load_fixture("endpoint")}
+    data["details"] = {**data["details"]}
+    del data["details"]["hostStartTime"]
+    with pytest.raises(MissingValueError):
+        dump(decode(EndpointData, data))
+
+
+def test_schema_version() -> None:
+    """Test the schema version depends on the fields."""
+    assert schema_version(HostData) == schema_version(HostData)
+    assert schema_version(HostData) != schema_version(EndpointData)
+    assert len(schema_version(HostData)) == 8
+
+
+def test_load_invalid() -> None:
+    """Test rejecting data, that was not dumped from the same schema."""
+    data = dump(decode(HostData, load_fixture("analyze")))
+    with pytest.raises(ValueError, match="Not a dumped data class"):
+        load(HostData, b"{}")
+    with pytest.raises(ValueError, match="Unsupported format version"):
+        load(HostData, MAGIC + bytes((FORMAT_VERSION + 1,)) + data[len(MAGIC) + 1 :])
+    with pytest.raises(ValueError, match="current schema of EndpointData"):
+        load(EndpointData, data)
+    with pytest.raises(ValueError, match="Malformed dump"):
+        load(HostData, data[:-10])
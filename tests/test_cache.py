@@ -0,0 +1,116 @@
+"""Test caching assessment results."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from dacite import from_dict
+
+from ssllabs import Ssllabs
+from ssllabs.cache import ResultCache
+from ssllabs.data.host import HostData
+from ssllabs.data.info import InfoData
+from ssllabs.raw import RawResponse
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _host_data(host: str = "ssllabs.com", age: float = 0, expiry: float | None = None) -> HostData:
+    """Build a finished result, that is age hours old."""
+    now = time.time()
+    test_time = int((now - age * 3600) * 1000)
+    cache_expiry_time = None if expiry is None else int((now + expiry * 3600) * 1000)
+    return from_dict(
+        data_class=HostData,
+        data={**load_fixture("analyze"), "host": host, "testTime": test_time, "cacheExpiryTime": cache_expiry_time},
+    )
+
+
+def test_get(tmp_path: Path) -> None:
+    """Test getting cached results with respect to their age."""
+    cache = ResultCache(tmp_path / "cache.db")
+    host_data = _host_data(age=2)
+    cache.put(host_data)
+    assert cache.get("ssllabs.com") == host_data
+    assert cache.get("ssllabs.com", max_age=3) == host_data
+    assert cache.get("ssllabs.com", max_age=1) is None
+    assert cache.get("ssllabs.com", port=8443) is None
+    assert cache.get("www.ssllabs.com") is None
+
+
+def test_expiry(tmp_path: Path) -> None:
+    """Test ignoring expired results."""
+    cache = ResultCache(tmp_path / "cache.db")
+    cache.put(_host_data(expiry=-1))
+    assert cache.get("ssllabs.com") is None
+    cache.put(_host_data(expiry=1))
+    assert cache.get("ssllabs.com") is not None
+
+
+def test_eviction(tmp_path: Path) -> None:
+    """Test evicting results by size and age."""
+    cache = ResultCache(tmp_path / "cache.db", max_entries=2, max_age=1)
+    cache.put(_host_data("a.example"))
+    cache.put(_host_data("b.example"))
+    cache.get("a.example")
+    cache.put(_host_data("c.example"))
+    assert len(cache) == 2
+    assert cache.get("a.example") is not None
+    assert cache.get("b.example") is None
+    assert cache.get("old.example") is None
+    cache.put(_host_data("old.example", age=2))
+    assert cache.get("old.example") is None
+
+    cache.invalidate("a.example")
+    assert cache.get("a.example") is None
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_raw(tmp_path: Path) -> None:
+    """Test caching undecoded results."""
+    cache = ResultCache(tmp_path / "cache.db")
+    host_data = _host_data()
+    cache.put_raw(RawResponse(json.dumps(dataclasses.asdict(host_data)).encode()))
+    cache.put_raw(RawResponse(json.dumps({**load_fixture("analyze_running"), "host": "running.example"}).encode()))
+    assert cache.get("ssllabs.com") == host_data
+    response = cache.get_raw("ssllabs.com")
+    assert response
+    assert response.decode(HostData) == host_data
+    assert cache.get_raw("running.example") is None
+
+
+def test_shared_database(tmp_path: Path) -> None:
+    """Test sharing the database between multiple caches."""
+    ResultCache(tmp_path / "cache.db").put(_host_data())
+    assert ResultCache(tmp_path / "cache.db").get("ssllabs.com") is not None
+
+
+@pytest.mark.asyncio()
+async def test_analyze_from_cache(tmp_path: Path) -> None:
+    """Test answering analyze calls from the local cache."""
+    cache = ResultCache(tmp_path / "cache.db")
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        return_value=_host_data(age=2),
+    ) as analyze, patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs(cache=cache)
+        await ssllabs.analyze(host="ssllabs.com")
+        assert analyze.await_count == 1
+
+        await ssllabs.analyze(host="ssllabs.com", from_cache=True, max_age=3)
+        assert analyze.await_count == 1
+
+        await ssllabs.analyze(host="ssllabs.com", from_cache=True, max_age=1)
+        assert analyze.await_count == 2
@@ -0,0 +1,106 @@
+"""Test assessment capacity tracking."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from dacite import from_dict
+
+from ssllabs import AssessmentCapacity, Ssllabs
+from ssllabs.api._api import SSLLABS_URL
+from ssllabs.data.info import InfoData
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
+
+
+def test_update_from_headers() -> None:
+    """Test updating the capacity from response headers."""
+    capacity = AssessmentCapacity()
+    assert capacity.stale
+    assert capacity.free_slots == 0
+
+    capacity.update_from_headers({"X-Max-Assessments": "25", "X-Current-Assessments": "24"})
+    assert not capacity.stale
+    assert capacity.free_slots == 1
+
+    capacity.update_from_headers({"X-Max-Assessments": "20", "X-Current-Assessments": "invalid"})
+    assert capacity.max_assessments == 25
+    assert capacity.current_assessments == 24
+
+
+def test_update_from_info() -> None:
+    """Test updating the capacity from an info object."""
+    capacity = AssessmentCapacity(max_age=0)
+    capacity.update_from_info(from_dict(data_class=InfoData, data=load_fixture("info_running_assessments")))
+    assert capacity.stale
+    assert capacity.free_slots == 24
+    assert capacity.new_assessment_cool_off == 1.0
+
+    capacity.assessment_started()
+    assert capacity.free_slots == 23
+    capacity.assessment_finished()
+    capacity.assessment_finished()
+    capacity.assessment_finished()
+    assert capacity.current_assessments == 0
+
+
+def test_reported_assessments() -> None:
+    """Test counting started and finished assessments only, if no response reported the real numbers since."""
+    capacity = AssessmentCapacity()
+    capacity.update_from_headers({"X-Max-Assessments": "25", "X-Current-Assessments": "0"})
+    updates = capacity.updates
+    capacity.update_from_headers({"X-Max-Assessments": "25", "X-Current-Assessments": "1"})
+    capacity.assessment_started(updates)
+    assert capacity.current_assessments == 1
+    capacity.assessment_started(capacity.updates)
+    assert capacity.current_assessments == 2
+
+    updates = capacity.updates
+    capacity.assessment_finished(updates)
+    assert capacity.current_assessments == 1
+    capacity.update_from_headers({"X-Current-Assessments": "1"})
+    capacity.assessment_finished(updates)
+    assert capacity.current_assessments == 1
+
+
+@pytest.mark.asyncio()
+async def test_headers_count_own_assessments(httpx_mock: HTTPXMock) -> None:
+    """Test not counting an assessment twice, if the responses report it already."""
+    host = "ssllabs.com"
+    httpx_mock.add_response(json=load_fixture("info"), url=f"{SSLLABS_URL}info")
+    httpx_mock.add_response(
+        json=load_fixture("analyze_running"),
+        url=f"{SSLLABS_URL}analyze?host={host}&startNew=on&fromCache=off&publish=off&ignoreMismatch=off&maxAge=",
+        headers={"X-Max-Assessments": "25", "X-Current-Assessments": "2"},
+    )
+    httpx_mock.add_response(
+        json=load_fixture("analyze"),
+        url=f"{SSLLABS_URL}analyze?host={host}&all=done",
+        headers={"X-Max-Assessments": "25", "X-Current-Assessments": "1"},
+    )
+    capacity = AssessmentCapacity()
+    with patch("asyncio.sleep"):
+        await Ssllabs(capacity=capacity).analyze(host=host)
+    assert capacity.current_assessments == 1
+
+
+@pytest.mark.asyncio()
+async def test_headers_replace_info(httpx_mock: HTTPXMock) -> None:
+    """Test assessment headers keep the capacity up to date without querying the info endpoint again."""
+    httpx_mock.add_response(json=load_fixture("info"), url=f"{SSLLABS_URL}info")
+    for _ in range(2):
+        httpx_mock.add_response(
+            json=load_fixture("analyze"),
+            headers={"X-Max-Assessments": "25", "X-Current-Assessments": "0"},
+        )
+    capacity = AssessmentCapacity()
+    ssllabs = Ssllabs(capacity=capacity)
+    await ssllabs.analyze(host="ssllabs.com")
+    await ssllabs.analyze(host="www.ssllabs.com")
+    assert len(httpx_mock.get_requests(url=f"{SSLLABS_URL}info")) == 1
+    assert capacity.max_assessments == 25
@@ -0,0 +1,122 @@
+"""Test sharing assessment slots between processes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from dacite import from_dict
+
+from ssllabs import Ssllabs
+from ssllabs.coordination import SlotLedger
+from ssllabs.data.host import HostData
+from ssllabs.data.info import InfoData
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_slots(tmp_path: Path) -> None:
+    """Test sharing the slots between ledgers using the same database."""
+    first = SlotLedger(tmp_path / "slots.db")
+    second = SlotLedger(tmp_path / "slots.db")
+    lease, delay = first.acquire(2, 0.0)
+    assert lease is not None
+    assert delay == 0.0
+    assert second.acquire(2, 0.0)[0] is not None
+    assert second.acquire(2, 0.0) == (None, 1.0)
+    first.release(lease)
+    assert len(second) == 1
+    assert second.acquire(2, 0.0)[0] is not None
+
+
+def test_cool_off(tmp_path: Path) -> None:
+    """Test spacing new assessments of all processes while another one is running."""
+    first = SlotLedger(tmp_path / "slots.db")
+    second = SlotLedger(tmp_path / "slots.db")
+    lease, _ = first.acquire(25, 10.0)
+    assert lease is not None
+    none, delay = second.acquire(25, 10.0)
+    assert none is None
+    assert 9.0 < delay <= 10.0
+    first.release(lease)
+    # No assessment is running, so there is no need to cool off
+    assert second.acquire(25, 10.0)[0] is not None
+
+
+def test_expiry(tmp_path: Path) -> None:
+    """Test giving up leases of processes, that did not release them."""
+    crashed = SlotLedger(tmp_path / "slots.db", lease_time=0.0)
+    assert crashed.acquire(1, 0.0)[0] is not None
+    ledger = SlotLedger(tmp_path / "slots.db")
+    assert not len(ledger)
+    assert ledger.acquire(1, 0.0)[0] is not None
+
+
+@pytest.mark.asyncio()
+async def test_analyze(tmp_path: Path) -> None:
+    """Test waiting for slots leased by other processes."""
+    other = SlotLedger(tmp_path / "slots.db")
+    with patch("ssllabs.coordination.time.time", return_value=time.time() - 10):
+        # All slots were taken some time ago, so no cool off is needed
+        leases = [other.acquire(25, 0.0)[0] for _ in range(25)]
+    ledger = SlotLedger(tmp_path / "slots.db")
+
+    async def release(_: float) -> None:
+        lease = leases.pop()
+        assert lease is not None
+        other.release(lease)
+
+    with patch("asyncio.sleep", side_effect=release) as sleep, patch(
+        "ssllabs.api.analyze.Analyze.get",
+        return_value=from_dict(data_class=HostData, data=load_fixture("analyze")),
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs(ledger=ledger)
+        await ssllabs.analyze(host="ssllabs.com")
+    sleep.assert_awaited_once_with(1.0)
+    # The slot is given back, when the assessment is finished
+    assert len(ledger) == 24
+
+
+@pytest.mark.asyncio()
+async def test_analyze_cancel(tmp_path: Path) -> None:
+    """Test giving back a slot, that was leased while the assessment was cancelled."""
+    ledger = SlotLedger(tmp_path / "slots.db")
+    acquire = ledger.acquire
+    acquiring, proceed, acquired = threading.Event(), threading.Event(), threading.Event()
+
+    def slow_acquire(max_assessments: int, cool_off: float) -> tuple[int | None, float]:
+        acquiring.set()
+        proceed.wait(1)
+        try:
+            return acquire(max_assessments, cool_off)
+        finally:
+            acquired.set()
+
+    loop = asyncio.get_running_loop()
+    with patch.object(ledger, "acquire", side_effect=slow_acquire), patch("ssllabs.api.analyze.Analyze.get") as analyze, patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        task = asyncio.ensure_future(Ssllabs(ledger=ledger).analyze(host="ssllabs.com"))
+        await loop.run_in_executor(None, acquiring.wait, 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        proceed.set()
+        await loop.run_in_executor(None, acquired.wait, 1)
+        for _ in range(100):
+            if not len(ledger):
+                break
+            await asyncio.sleep(0.01)
+    analyze.assert_not_called()
+    assert not len(ledger)
@@ -0,0 +1,120 @@
+"""Test the data classes."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Iterator, List, Optional
+from unittest.mock import patch
+
+import pytest
+from dacite import MissingValueError, from_dict
+
+from ssllabs.data._dataclass import LAZY, LazyField, Raw, dataclass
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.decoder import decode, get_lazy_decoding, set_lazy_decoding
+
+from . import load_fixture
+
+
+@pytest.fixture()
+def _lazy_decoding() -> Iterator[None]:
+    """Decode lazy fields on first access during the test."""
+    enabled = get_lazy_decoding()
+    set_lazy_decoding(enabled=True)
+    yield
+    set_lazy_decoding(enabled)
+
+
+@dataclass
+class ItemData:
+    """Test item."""
+
+    name: str
+
+
+def test_slots() -> None:
+    """Test data class instances have no __dict__."""
+    endpoint = decode(EndpointData, load_fixture("endpoint"))
+    assert not hasattr(endpoint, "__dict__")
+    assert endpoint.details
+    assert not hasattr(endpoint.details, "__dict__")
+    with pytest.raises(AttributeError):
+        endpoint.unknown = True  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("version", [(3, 8), (3, 12)])
+def test_dataclass(version: tuple[int, int]) -> None:
+    """Test the decorator on all supported Python versions."""
+    with patch("ssllabs.data._dataclass.sys.version_info", version):
+
+        @dataclass
+        class TestData:
+            """Test data."""
+
+            name: str
+            value: int
+
+    data = TestData("test", 1)
+    assert data == TestData("test", 1)
+    assert dataclasses.astuple(data) == ("test", 1)
+    assert vars(TestData)["__slots__"] == ("name", "value")
+    assert TestData.__qualname__.endswith("TestData")
+    assert not hasattr(data, "__dict__")
+
+
+def test_not_lazy() -> None:
+    """Test details are decoded right away by default."""
+    endpoint = decode(EndpointData, load_fixture("endpoint"))
+    assert not get_lazy_decoding()
+    assert not isinstance(EndpointData.__dict__["details"].slot.__get__(endpoint), Raw)
+    assert endpoint == from_dict(data_class=EndpointData, data=load_fixture("endpoint"))
+
+
+@pytest.mark.usefixtures("_lazy_decoding")
+def test_lazy() -> None:
+    """Test details are decoded on first access."""
+    data = load_fixture("endpoint")
+    endpoint = decode(EndpointData, data)
+    descriptor = EndpointData.__dict__["details"]
+    assert isinstance(descriptor, LazyField)
+    assert isinstance(descriptor.slot.__get__(endpoint), Raw)
+    assert endpoint.grade == "B"
+
+    details = endpoint.details
+    assert details
+    assert details is endpoint.details
+    assert isinstance(type(details).__dict__["sims"].slot.__get__(details), Raw)
+    assert endpoint == from_dict(data_class=EndpointData, data=data)
+
+    endpoint.details = None
+    assert endpoint.details is None
+
+
+@pytest.mark.usefixtures("_lazy_decoding")
+def test_lazy_missing_value() -> None:
+    """Test missing values in lazy fields raise on first access."""
+    data = load_fixture("endpoint")
+    endpoint = decode(EndpointData, {**data, "details": {**data["details"], "certChains": [{}]}})
+    assert endpoint.details
+    with pytest.raises(MissingValueError):
+        _ = endpoint.details.certChains
+
+
+@pytest.mark.usefixtures("_lazy_decoding")
+@pytest.mark.parametrize("version", [(3, 8), (3, 12)])
+def test_lazy_dataclass(version: tuple[int, int]) -> None:
+    """Test lazy fields on all supported Python versions."""
+    with patch("ssllabs.data._dataclass.sys.version_info", version):
+
+        @dataclass
+        class TestData:
+            """Test data."""
+
+            # The decoder resolves the hint at runtime, where Python 3.8 does not support the new syntax
+            items: Optional[List[ItemData]] = dataclasses.field(metadata={LAZY: True})  # noqa: UP006, UP007
+
+    data = decode(TestData, {"items": [{"name": "test"}]})
+    assert isinstance(TestData.__dict__["items"].slot.__get__(data), Raw)
+    assert data.items == [ItemData("test")]
+    assert decode(TestData, {}).items is None
+    assert TestData([]).items == []
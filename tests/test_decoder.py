@@ -0,0 +1,48 @@
+"""Test the generated decoders."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from dacite import MissingValueError, from_dict
+
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.data.host import HostData
+from ssllabs.data.info import InfoData
+from ssllabs.data.status_codes import StatusCodesData
+from ssllabs.decoder import decode
+
+from . import load_fixture
+
+
+@pytest.mark.parametrize(
+    ("data_class", "fixture"),
+    [
+        (HostData, "analyze"),
+        (HostData, "analyze_running"),
+        (EndpointData, "endpoint"),
+        (InfoData, "info"),
+        (StatusCodesData, "status_codes"),
+    ],
+)
+def test_decode(data_class: type, fixture: str) -> None:
+    """Test decoding gives the same result as dacite."""
+    data = load_fixture(fixture)
+    assert decode(data_class, data) == from_dict(data_class=data_class, data=data)
+
+
+def test_decode_missing_optional() -> None:
+    """Test missing optional values become None."""
+    data: dict[str, Any] = {**load_fixture("analyze")}
+    del data["endpoints"]
+    assert decode(HostData, data).endpoints is None
+
+
+def test_decode_missing_value() -> None:
+    """Test missing values, that are not optional, raise like dacite."""
+    with pytest.raises(MissingValueError):
+        decode(EndpointData, load_fixture("endpoint_error"))
+    data = load_fixture("analyze")
+    with pytest.raises(MissingValueError):
+        decode(HostData, {**data, "endpoints": [{}]})
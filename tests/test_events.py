@@ -0,0 +1,94 @@
+"""Test progress events of running assessments."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from dacite import from_dict
+
+from ssllabs import Ssllabs
+from ssllabs.data.host import HostData
+from ssllabs.data.info import InfoData
+from ssllabs.events import EndpointEvent, Event, Events, ProgressTracker, StatusEvent
+
+from . import load_fixture
+
+
+def _result(status: str = "IN_PROGRESS", **endpoint: Any) -> HostData:
+    """Build a result with a single endpoint."""
+    data = load_fixture("analyze")
+    return from_dict(
+        data_class=HostData,
+        data={**data, "status": status, "endpoints": [{**data["endpoints"][0], **endpoint}]},
+    )
+
+
+def test_tracker() -> None:
+    """Test publishing only changes."""
+    events = Events()
+    published: list[Event] = []
+    tracker = ProgressTracker(events)
+    tracker.update(_result(progress=10))
+    assert not published
+
+    events.subscribe(published.append)
+    result = _result(progress=10)
+    tracker.update(result)
+    tracker.update(result)
+    tracker.update(_result(progress=10))
+    assert [type(event) for event in published] == [StatusEvent, EndpointEvent]
+
+    tracker.update(_result(progress=50, eta=30))
+    tracker.update(_result("READY", progress=100, eta=None))
+    assert published[2:] == [
+        EndpointEvent("ssllabs.com", "164.41.200.100", "Ready", None, None, 50, 30, "B"),
+        StatusEvent("ssllabs.com", "READY", None),
+        EndpointEvent("ssllabs.com", "164.41.200.100", "Ready", None, None, 100, None, "B"),
+    ]
+
+
+def test_callback_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test logging errors of callbacks without raising them."""
+    events = Events()
+    published: list[Event] = []
+    events.subscribe(lambda _: 1 / 0)
+    events.subscribe(published.append)
+    events.publish(StatusEvent("ssllabs.com", "DNS", None))
+    assert published
+    assert "Progress callback failed." in caplog.text
+
+    events.unsubscribe(published.append)
+    events.publish(StatusEvent("ssllabs.com", "READY", None))
+    assert len(published) == 1
+
+
+@pytest.mark.asyncio()
+async def test_subscription() -> None:
+    """Test listening to events as async iterator."""
+    events = Events()
+    with events.listen(host="ssllabs.com", maxsize=2) as subscription:
+        for status in ("DNS", "IN_PROGRESS", "READY"):
+            events.publish(StatusEvent("ssllabs.com", status, None))
+        events.publish(StatusEvent("example.com", "DNS", None))
+    assert not events.listening
+    assert [event.status async for event in subscription if isinstance(event, StatusEvent)] == ["IN_PROGRESS", "READY"]
+    assert subscription.dropped == 1
+
+
+@pytest.mark.asyncio()
+async def test_analyze() -> None:
+    """Test publishing the progress of an assessment."""
+    ssllabs = Ssllabs()
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=[_result("DNS", progress=-1), _result(progress=50), _result("READY", progress=100)],
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ), ssllabs.events.listen() as subscription:
+        await ssllabs.analyze(host="ssllabs.com")
+    events = [event async for event in subscription]
+    assert [event.status for event in events if isinstance(event, StatusEvent)] == ["DNS", "IN_PROGRESS", "READY"]
+    assert [event.progress for event in events if isinstance(event, EndpointEvent)] == [-1, 50, 100]
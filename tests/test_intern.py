@@ -0,0 +1,101 @@
+"""Test sharing identical parts of results."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from dacite import from_dict
+
+from ssllabs.api import Endpoint
+from ssllabs.data.cert import CertData
+from ssllabs.data.endpoint import EndpointData
+from ssllabs.data.suite import SuiteData
+from ssllabs.decoder import decode
+from ssllabs.intern import InternPool
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
+
+
+def _first_suite_and_client(endpoint: EndpointData) -> tuple[SuiteData, object]:
+    """Read a suite and a simulation client of an endpoint."""
+    assert endpoint.details
+    assert endpoint.details.suites
+    assert endpoint.details.sims
+    return endpoint.details.suites[0].list[0], endpoint.details.sims.results[0].client
+
+
+def _cert() -> dict[str, Any]:
+    """Build raw certificate data. The values do not matter, as the decoder does not check them."""
+    return {**{field.name: None for field in dataclasses.fields(CertData)}, "sha256Hash": "1234", "subject": "CN=ssllabs.com"}
+
+
+def test_intern() -> None:
+    """Test identical suites and simulation clients are shared."""
+    pool = InternPool()
+    data = load_fixture("endpoint")
+    first = decode(EndpointData, data, pool)
+    second = decode(EndpointData, data, pool)
+    assert first is not second
+    suite, client = _first_suite_and_client(first)
+    assert _first_suite_and_client(second) == (suite, client)
+    assert _first_suite_and_client(second)[0] is suite
+    assert _first_suite_and_client(second)[1] is client
+    assert first == from_dict(data_class=EndpointData, data=data)
+    assert len(pool)
+
+    pool.clear()
+    assert not len(pool)
+    assert _first_suite_and_client(decode(EndpointData, data, pool))[0] is not suite
+
+
+def test_intern_certificates() -> None:
+    """Test certificates are identified by all their values."""
+    pool = InternPool()
+    cert = {**_cert(), "altNames": ["ssllabs.com"], "caaPolicy": {"policyHostname": "ssllabs.com", "caaRecords": []}}
+    first = decode(CertData, cert, pool)
+    assert decode(CertData, {**cert, "altNames": ["ssllabs.com"]}, pool) is first
+    assert decode(CertData, {**cert, "sha256Hash": "changed"}, pool) is not first
+    assert decode(CertData, {**cert, "caaPolicy": None}, pool) is not first
+
+
+def test_intern_certificates_same_hash() -> None:
+    """Test certificates with the same hash, but different issues, are not shared."""
+    pool = InternPool()
+    cert = _cert()
+    first = decode(CertData, {**cert, "issues": 0}, pool)
+    second = decode(CertData, {**cert, "issues": 64}, pool)
+    assert first is not second
+    assert second.issues == 64
+
+
+def test_intern_custom_keys() -> None:
+    """Test interning only the given data classes."""
+    pool = InternPool(keys={SuiteData: lambda data: data["id"]})
+    endpoint = decode(EndpointData, load_fixture("endpoint"), pool)
+    suite, client = _first_suite_and_client(endpoint)
+    other_suite, other_client = _first_suite_and_client(decode(EndpointData, load_fixture("endpoint"), pool))
+    assert other_suite is suite
+    assert other_client is not client
+
+
+def test_intern_unhashable() -> None:
+    """Test unexpected data is decoded without sharing it."""
+    pool = InternPool()
+    suite = {**load_fixture("endpoint")["details"]["suites"][0]["list"][0], "name": ["unexpected"]}
+    assert decode(SuiteData, suite, pool) is not decode(SuiteData, suite, pool)
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_intern_pool(httpx_mock: HTTPXMock) -> None:
+    """Test API calls decode with the given pool."""
+    httpx_mock.add_response(json=load_fixture("endpoint"))
+    httpx_mock.add_response(json=load_fixture("endpoint"))
+    endpoint = Endpoint(intern_pool=InternPool())
+    first = await endpoint.get("ssllabs.com", "164.41.200.100")
+    second = await endpoint.get("ssllabs.com", "164.41.200.100")
+    assert _first_suite_and_client(first)[0] is _first_suite_and_client(second)[0]
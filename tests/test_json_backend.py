@@ -0,0 +1,48 @@
+"""Test exchangeable JSON backends."""
+
+from __future__ import annotations
+
+import sys
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from ssllabs import json_backend
+from ssllabs.json_backend import get_json_backend, loads, set_json_backend
+
+from . import FIXTURES, load_fixture
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend() -> Iterator[None]:
+    """Restore the backend chosen on import."""
+    backend = get_json_backend()
+    yield
+    set_json_backend(backend)
+
+
+@pytest.mark.parametrize("backend", json_backend.BACKENDS)
+def test_backend(backend: str) -> None:
+    """Test all backends parse the fixtures alike."""
+    if backend != "json":
+        pytest.importorskip(backend)
+    set_json_backend(backend)
+    assert get_json_backend() == backend
+    for path in FIXTURES.glob("*.json"):
+        assert loads(path.read_bytes()) == load_fixture(path.stem)
+
+
+def test_fallback() -> None:
+    """Test falling back to the standard library, if no faster backend is installed."""
+    with patch.dict(sys.modules, {"orjson": None, "msgspec": None, "msgspec.json": None}):
+        set_json_backend()
+        assert get_json_backend() == "json"
+        with pytest.raises(ImportError):
+            set_json_backend("orjson")
+
+
+def test_unsupported_backend() -> None:
+    """Test rejecting unknown backends."""
+    with pytest.raises(ValueError, match="Unsupported JSON backend: yaml"):
+        set_json_backend("yaml")
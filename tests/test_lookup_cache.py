@@ -0,0 +1,80 @@
+"""Test caching rarely changing lookups."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from dacite import from_dict
+
+from ssllabs import Ssllabs, TrustStore
+from ssllabs.data.info import InfoData
+from ssllabs.data.status_codes import StatusCodesData
+from ssllabs.lookup_cache import LookupCache
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpx import HTTPXMock
+
+
+def test_ttl() -> None:
+    """Test using results only within their time to live."""
+    cache = LookupCache(info_ttl=60.0, root_certs_ttl=3600.0)
+    info = from_dict(data_class=InfoData, data=load_fixture("info"))
+    cache.put("info", info)
+    cache.put("root_certs:1", "certs")
+    assert cache.get("info") is info
+    with patch("ssllabs.lookup_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("info") is None
+        assert cache.get("root_certs:1") == "certs"
+
+
+def test_persistence(tmp_path: Path) -> None:
+    """Test keeping results across restarts."""
+    status_codes = from_dict(data_class=StatusCodesData, data=load_fixture("status_codes"))
+    LookupCache(tmp_path / "lookups.db").put("status_codes", status_codes)
+    LookupCache(tmp_path / "lookups.db").put("root_certs:1", "certs")
+    cache = LookupCache(tmp_path / "lookups.db")
+    assert cache.get("status_codes", StatusCodesData) == status_codes
+    assert cache.get("root_certs:1") == "certs"
+    assert cache.get("info", InfoData) is None
+
+
+@pytest.mark.parametrize("path", [None, "lookups.db"])
+def test_invalidate(tmp_path: Path, path: str | None) -> None:
+    """Test removing cached results."""
+    cache = LookupCache(None if path is None else tmp_path / path)
+    for key in ("root_certs:1", "root_certs:2", "status_codes"):
+        cache.put(key, "value")
+    cache.invalidate("root_certs:1")
+    assert [cache.get(key) for key in ("root_certs:1", "root_certs:2", "status_codes")] == [None, "value", "value"]
+    cache.invalidate("root_certs")
+    assert [cache.get(key) for key in ("root_certs:1", "root_certs:2", "status_codes")] == [None, None, "value"]
+    cache.invalidate()
+    assert cache.get("status_codes") is None
+
+
+@pytest.mark.asyncio()
+async def test_lookups(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    """Test answering lookups from the cache."""
+    httpx_mock.add_response(json=load_fixture("info"))
+    httpx_mock.add_response(json=load_fixture("status_codes"))
+    httpx_mock.add_response(text="mozilla")
+    httpx_mock.add_response(text="windows")
+    ssllabs = Ssllabs(lookup_cache=LookupCache(tmp_path / "lookups.db"))
+    for _ in range(2):
+        assert (await ssllabs.info()).maxAssessments == 25
+        assert dataclasses.asdict(await ssllabs.status_codes()) == load_fixture("status_codes")
+        assert await ssllabs.root_certs() == "mozilla"
+        assert await ssllabs.root_certs(TrustStore.WINDOWS) == "windows"
+    assert len(httpx_mock.get_requests()) == 4
+
+    ssllabs = Ssllabs(lookup_cache=LookupCache(tmp_path / "lookups.db"))
+    assert await ssllabs.root_certs(TrustStore.WINDOWS) == "windows"
+    assert len(httpx_mock.get_requests()) == 4
@@ -0,0 +1,104 @@
+"""Test polling all running assessments from a single task."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ssllabs.poller import Poller
+
+
+def _finished_after(polls: int) -> AsyncMock:
+    """Mock a poll, that reports the assessment finished with the given poll."""
+    return AsyncMock(side_effect=range(1, polls + 1))
+
+
+def _interval(delay: float, final: int) -> Callable[[int], float | None]:
+    """Wait the given delay until the final state is reached."""
+    return lambda state: None if state >= final else delay
+
+
+@pytest.mark.asyncio()
+async def test_wait() -> None:
+    """Test polling until the assessment is finished."""
+    poller = Poller()
+    poll = _finished_after(3)
+    with patch("asyncio.sleep"):
+        assert await poller.wait(0, poll, _interval(10.0, 3)) == 3
+    assert poll.await_count == 3
+    assert not len(poller)
+
+
+@pytest.mark.asyncio()
+async def test_wait_finished() -> None:
+    """Test not polling finished assessments."""
+    poll = AsyncMock()
+    assert await Poller().wait(1, poll, _interval(10.0, 1)) == 1
+    poll.assert_not_awaited()
+
+
+@pytest.mark.asyncio()
+async def test_max_rate() -> None:
+    """Test spacing polls, that are due at the same time."""
+    real_sleep = asyncio.sleep
+    sleeps: list[float] = []
+
+    async def record(delay: float) -> None:
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    poller = Poller(max_rate=2.0)
+    with patch("asyncio.sleep", side_effect=record):
+        results = await asyncio.gather(*(poller.wait(0, _finished_after(1), _interval(1.0, 1)) for _ in range(5)))
+    assert results == [1] * 5
+    # The first poll is sent right away, all further ones are spaced by half a second
+    assert len([delay for delay in sleeps if 0.4 < delay <= 0.5]) == 4
+
+
+@pytest.mark.asyncio()
+async def test_earlier_poll() -> None:
+    """Test waking up for a poll, that is due earlier than the one the poller is sleeping for."""
+    poller = Poller(max_rate=1000.0)
+    finished: list[str] = []
+
+    async def wait(name: str, delay: float) -> None:
+        await poller.wait(0, _finished_after(1), _interval(delay, 1))
+        finished.append(name)
+
+    late = asyncio.ensure_future(wait("late", 0.5))
+    await asyncio.sleep(0.01)
+    await wait("early", 0.01)
+    assert finished == ["early"]
+    await late
+    assert finished == ["early", "late"]
+
+
+@pytest.mark.asyncio()
+async def test_abandoned() -> None:
+    """Test dropping assessments nobody waits for anymore."""
+    poller = Poller()
+    poll = AsyncMock(return_value=0)
+    waiter = asyncio.ensure_future(poller.wait(0, poll, _interval(0.01, 1)))
+    await asyncio.sleep(0)
+    assert len(poller) == 1
+    waiter.cancel()
+    await asyncio.sleep(0.05)
+    assert not len(poller)
+    poll.assert_not_awaited()
+
+
+@pytest.mark.asyncio()
+async def test_error() -> None:
+    """Test raising errors of polls."""
+    poller = Poller()
+    with patch("asyncio.sleep"), pytest.raises(OSError, match="unreachable"):
+        await poller.wait(0, AsyncMock(side_effect=OSError("unreachable")), _interval(10.0, 1))
+
+
+def test_invalid_rate() -> None:
+    """Test rejecting invalid rates."""
+    with pytest.raises(ValueError, match="max_rate must be positive"):
+        Poller(max_rate=0)
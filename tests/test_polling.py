@@ -0,0 +1,55 @@
+"""Test polling policies."""
+
+from __future__ import annotations
+
+import pytest
+from dacite import from_dict
+
+from ssllabs import PollingPolicy
+from ssllabs.data.host import HostData
+
+from . import load_fixture
+
+
+def _host_data(status: str, eta: int | None, progress: int | None = 50) -> HostData:
+    """Build host data with a single endpoint in the given state."""
+    data = load_fixture("analyze")
+    endpoint = {**data["endpoints"][0], "eta": eta, "progress": progress}
+    return from_dict(data_class=HostData, data={**data, "status": status, "endpoints": [endpoint]})
+
+
+@pytest.mark.parametrize(
+    ("status", "eta", "expected"),
+    [
+        ("DNS", None, 5.0),
+        ("IN_PROGRESS", None, 5.0),
+        ("IN_PROGRESS", -1, 5.0),
+        ("IN_PROGRESS", 4, 5.0),
+        ("IN_PROGRESS", 40, 20.0),
+        ("IN_PROGRESS", 600, 60.0),
+    ],
+)
+def test_interval(status: str, eta: int | None, expected: float) -> None:
+    """Test polling intervals follow the ETA of the endpoints."""
+    policy = PollingPolicy()
+    assert policy.interval(_host_data(status, eta)) == expected
+
+
+def test_interval_finished_endpoint() -> None:
+    """Test ETAs of finished endpoints are ignored."""
+    policy = PollingPolicy(min_interval=1.0, max_interval=10.0)
+    assert policy.interval(_host_data("IN_PROGRESS", 60, progress=100)) == 1.0
+
+
+def test_interval_pending_endpoint() -> None:
+    """Test ETAs of endpoints, that did not start yet, are ignored."""
+    policy = PollingPolicy(min_interval=1.0, max_interval=100.0)
+    assert policy.interval(_host_data("IN_PROGRESS", 60, progress=-1)) == 1.0
+
+
+def test_invalid_intervals() -> None:
+    """Test rejecting invalid intervals."""
+    with pytest.raises(ValueError, match="Intervals must be positive"):
+        PollingPolicy(min_interval=10.0, max_interval=5.0)
+    with pytest.raises(ValueError, match="eta_factor must be positive"):
+        PollingPolicy(eta_factor=0)
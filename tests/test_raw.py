@@ -0,0 +1,43 @@
+"""Test undecoded responses."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ssllabs.data.host import HostData
+from ssllabs.decoder import decode
+from ssllabs.raw import RawResponse
+
+from . import load_fixture
+
+
+@pytest.mark.parametrize(("fixture", "status"), [("analyze", "READY"), ("analyze_running", "RUNNING"), ("info", None)])
+def test_status(fixture: str, status: str | None) -> None:
+    """Test reading the status of an assessment."""
+    response = RawResponse(json.dumps(load_fixture(fixture)).encode())
+    assert response.status == status
+
+
+def test_status_nested() -> None:
+    """Test a status of a nested object is not taken for the status of the host."""
+    response = RawResponse(b'{"endpoints": [{"status": "READY"}], "status": "DNS"}')
+    assert response.status == "DNS"
+    response = RawResponse(b'{"endpoints": [{"status": "READY"}]}')
+    assert response.status is None
+
+
+def test_decode() -> None:
+    """Test decoding the response on demand."""
+    response = RawResponse(json.dumps(load_fixture("analyze")).encode())
+    assert response.json() is response.json()
+    assert response.decode(HostData) == decode(HostData, load_fixture("analyze"))
+    assert repr(response) == f"<RawResponse [{len(response.content)} bytes]>"
+
+
+def test_digest() -> None:
+    """Test telling changed responses apart."""
+    running = RawResponse(json.dumps(load_fixture("analyze_running")).encode())
+    assert running.digest == RawResponse(json.dumps(load_fixture("analyze_running")).encode()).digest
+    assert running.digest != RawResponse(json.dumps(load_fixture("analyze")).encode()).digest
@@ -0,0 +1,92 @@
+"""Test the append-only log of results."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ssllabs.archive import dump
+from ssllabs.data.host import HostData
+from ssllabs.decoder import decode
+from ssllabs.result_log import ResultLog
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _result(host: str, start_time: int) -> HostData:
+    """Create a result of a host."""
+    return dataclasses.replace(decode(HostData, load_fixture("analyze")), host=host, startTime=start_time)
+
+
+def test_lookups(tmp_path: Path) -> None:
+    """Test looking up results by host and start time."""
+    with ResultLog(tmp_path) as log:
+        for start_time in (3, 1, 2):
+            log.append(_result("example.com", start_time))
+        log.append(_result("example.com.de", 5))
+        log.append(_result("example", 9))
+
+        assert len(log) == 5
+        assert log.hosts() == ["example", "example.com", "example.com.de"]
+        assert log.start_times("example.com") == [1, 2, 3]
+        assert log.get("example.com", 2) == _result("example.com", 2)
+        assert log.get("example.com", 4) is None
+        assert log.latest("example.com") == _result("example.com", 3)
+        assert log.latest("example.org") is None
+        assert [result.startTime for result in log.history("example.com")] == [1, 2, 3]
+        assert [result.startTime for result in log.history("example.com", since=2, until=3)] == [2]
+
+        log.append(dataclasses.replace(_result("example.com", 2), statusMessage="Replaced"))
+        assert len(log) == 5
+        result = log.get("example.com", 2)
+        assert result is not None
+        assert result.statusMessage == "Replaced"
+
+
+def test_segments(tmp_path: Path) -> None:
+    """Test starting new segments and reopening the log from the index files."""
+    # Room for one record per segment
+    size = len(dump(_result("example.com", 0))) * 3 // 2
+    with ResultLog(tmp_path, segment_size=size) as log:
+        for start_time in range(5):
+            log.append(_result("example.com", start_time))
+        log.append(dataclasses.replace(_result("example.com", 0), statusMessage="Replaced"))
+        assert log.get("example.com", 4) == _result("example.com", 4)
+
+    assert len(list(tmp_path.glob("*.seg"))) == 6
+    assert len(list(tmp_path.glob("*.idx"))) == 5
+    (tmp_path / "00000001.idx").unlink()
+
+    with ResultLog(tmp_path, segment_size=size) as log:
+        assert log.start_times("example.com") == [0, 1, 2, 3, 4]
+        assert log.get("example.com", 3) == _result("example.com", 3)
+        result = log.get("example.com", 0)
+        assert result is not None
+        assert result.statusMessage == "Replaced"
+    assert (tmp_path / "00000001.idx").exists()
+
+
+def test_incomplete_record(tmp_path: Path) -> None:
+    """Test cutting off a record, that was not written completely."""
+    with ResultLog(tmp_path) as log:
+        log.append(_result("example.com", 1))
+        log.append(_result("example.com", 2))
+    segment = tmp_path / "00000000.seg"
+    segment.write_bytes(segment.read_bytes()[:-10])
+
+    with ResultLog(tmp_path) as log:
+        assert log.start_times("example.com") == [1]
+        log.append(_result("example.com", 3))
+        assert log.latest("example.com") == _result("example.com", 3)
+
+
+def test_not_a_segment(tmp_path: Path) -> None:
+    """Test refusing to open other files."""
+    (tmp_path / "00000000.seg").write_bytes(b"other")
+    with pytest.raises(ValueError, match="not a segment"):
+        ResultLog(tmp_path)
@@ -0,0 +1,168 @@
+"""Test retrying requests."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from httpx import ConnectError, HTTPStatusError, ReadTimeout, Request, Response
+
+from ssllabs import CircuitBreaker, RetryPolicy, SsllabsOverloadedError, SsllabsUnavailableError
+from ssllabs.api import Analyze, Info
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("status_code", [HTTPStatus.TOO_MANY_REQUESTS, 529])
+async def test_retry_overloaded(status_code: int, httpx_mock: HTTPXMock) -> None:
+    """Test pausing all requests and retrying, if the service is overloaded."""
+    httpx_mock.add_response(status_code=status_code, headers={"Retry-After": "120"})
+    httpx_mock.add_response(json=load_fixture("info"))
+    breaker = CircuitBreaker()
+    policy = RetryPolicy(circuit_breaker=breaker)
+    with patch("asyncio.sleep") as sleep:
+        info = await Info(retry_policy=policy).get()
+    assert dataclasses.asdict(info) == load_fixture("info")
+    assert policy.metrics.retries == 1
+    assert policy.metrics.overloaded == 1
+    assert breaker.metrics.opened == 1
+    assert breaker.metrics.open_time == pytest.approx(120, abs=1)
+    assert all(call.args[0] >= 119 for call in sleep.await_args_list)
+
+
+@pytest.mark.asyncio()
+async def test_retry_unavailable(httpx_mock: HTTPXMock) -> None:
+    """Test giving up, if the service stays unavailable."""
+    for _ in range(3):
+        httpx_mock.add_response(status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+    breaker = CircuitBreaker()
+    policy = RetryPolicy(max_retries=2, circuit_breaker=breaker)
+    with patch("asyncio.sleep") as sleep, pytest.raises(SsllabsUnavailableError):
+        await Info(retry_policy=policy).get()
+    assert sleep.await_count == 2
+    assert policy.metrics.retries == 2
+    assert policy.metrics.unavailable == 3
+    assert policy.metrics.exhausted == 1
+    assert breaker.state == "closed"
+
+
+@pytest.mark.parametrize("attempt", range(10))
+def test_backoff(attempt: int) -> None:
+    """Test full jitter exponential backoff."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=60.0)
+    assert 0 <= policy.backoff(attempt) <= min(2**attempt, 60.0)
+    assert policy.backoff(attempt, retry_after=90.0) == 90.0
+
+
+@pytest.mark.asyncio()
+async def test_circuit_breaker_ramp_up() -> None:
+    """Test resuming requests gradually after an overload."""
+    breaker = CircuitBreaker(cool_down=10.0, ramp_up_limit=4)
+    breaker.trip()
+    assert breaker.state == "open"
+    with patch("asyncio.sleep") as sleep:
+        await breaker.acquire()
+    sleep.assert_awaited_once()
+    breaker.release(success=False)
+    breaker.reset()
+    breaker.trip()
+    breaker._reopen_at = 0.0  # noqa: SLF001
+    assert breaker.state == "half-open"
+    await breaker.acquire()
+    breaker.release(success=True)
+    await breaker.acquire()
+    await breaker.acquire()
+    breaker.release(success=True)
+    breaker.release(success=True)
+    assert breaker.state == "closed"
+    assert breaker.metrics.opened == 2
+
+
+@pytest.mark.asyncio()
+async def test_circuit_breaker_burst(httpx_mock: HTTPXMock) -> None:
+    """Test a burst of overloaded responses to concurrent requests pausing all requests only once."""
+    for _ in range(6):
+        httpx_mock.add_response(status_code=HTTPStatus.TOO_MANY_REQUESTS)
+    breaker = CircuitBreaker(cool_down=60.0)
+    for _ in range(6):
+        breaker.trip()
+    assert breaker.metrics.opened == 1
+    assert breaker.metrics.open_time == pytest.approx(60, abs=1)
+
+    breaker = CircuitBreaker(cool_down=60.0)
+    policy = RetryPolicy(max_retries=0, circuit_breaker=breaker)
+    with patch("asyncio.sleep"):
+        results = await asyncio.gather(*[Info(retry_policy=policy).get() for _ in range(6)], return_exceptions=True)
+    assert all(isinstance(result, SsllabsOverloadedError) for result in results)
+    assert breaker.metrics.opened == 1
+    assert breaker.metrics.open_time == pytest.approx(60, abs=1)
+
+
+@pytest.mark.asyncio()
+async def test_circuit_breaker_release_on_client_error(httpx_mock: HTTPXMock) -> None:
+    """Test a rejected request letting further requests through a half-open circuit."""
+    httpx_mock.add_response(status_code=HTTPStatus.BAD_REQUEST)
+    httpx_mock.add_response(json=load_fixture("info"))
+    breaker = CircuitBreaker()
+    breaker.trip()
+    breaker._reopen_at = 0.0  # noqa: SLF001
+    policy = RetryPolicy(circuit_breaker=breaker)
+    with pytest.raises(HTTPStatusError):
+        await Info(retry_policy=policy).get()
+    await asyncio.wait_for(Info(retry_policy=policy).get(), timeout=1)
+    assert policy.metrics.retries == 0
+
+
+@pytest.mark.asyncio()
+async def test_circuit_breaker_release_on_cancel(httpx_mock: HTTPXMock) -> None:
+    """Test a cancelled request letting further requests through a half-open circuit."""
+    sent = asyncio.Event()
+
+    async def hang(_: Request) -> Response:
+        sent.set()
+        await asyncio.Event().wait()
+        return Response(HTTPStatus.OK)
+
+    httpx_mock.add_callback(hang)
+    httpx_mock.add_response(json=load_fixture("info"))
+    breaker = CircuitBreaker()
+    breaker.trip()
+    breaker._reopen_at = 0.0  # noqa: SLF001
+    policy = RetryPolicy(circuit_breaker=breaker)
+    task = asyncio.create_task(Info(retry_policy=policy).get())
+    await sent.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.wait_for(Info(retry_policy=policy).get(), timeout=1)
+    assert breaker.state == "half-open"
+
+
+@pytest.mark.asyncio()
+async def test_no_retry_of_started_assessment(httpx_mock: HTTPXMock) -> None:
+    """Test not repeating a request starting an assessment, if it might have reached the service."""
+    httpx_mock.add_exception(ReadTimeout(message="test"))
+    policy = RetryPolicy(circuit_breaker=None)
+    with patch("asyncio.sleep") as sleep, pytest.raises(SsllabsUnavailableError):
+        await Analyze(retry_policy=policy).get(host="ssllabs.com", startNew="on")
+    sleep.assert_not_awaited()
+    assert policy.metrics.retries == 0
+
+
+@pytest.mark.asyncio()
+async def test_retry_of_unsent_assessment(httpx_mock: HTTPXMock) -> None:
+    """Test repeating a request starting an assessment, if it did not reach the service."""
+    httpx_mock.add_exception(ConnectError(message="test"))
+    httpx_mock.add_response(json=load_fixture("analyze"))
+    policy = RetryPolicy(circuit_breaker=None)
+    with patch("asyncio.sleep"):
+        await Analyze(retry_policy=policy).get(host="ssllabs.com", startNew="on")
+    assert policy.metrics.retries == 1
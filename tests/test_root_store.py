@@ -0,0 +1,99 @@
+"""Test parsing and indexing root certificates."""
+
+from __future__ import annotations
+
+import base64
+import textwrap
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from ssllabs import Ssllabs, TrustStore
+from ssllabs.root_store import RootStore
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpx import HTTPXMock
+
+SUBJECT = (
+    "CN=thawte Primary Root CA - G3,OU=(c) 2008 thawte\\, Inc. - For authorized use only,"
+    "OU=Certification Services Division,O=thawte\\, Inc.,C=US"
+)
+SHA256 = "4b03f45807ad70f21bfc2cae71c9fde4604c064cf5ffb686bae5dbaad7fdd34c"
+PIN = "GQbGEk27Q4V40A4GbVBUxsN/D6YCjAVUXgmU7drshik="
+
+
+def _pem() -> str:
+    """Wrap the certificate of the fixture into a PEM block."""
+    body = "\n".join(textwrap.wrap(load_fixture("root_certs")["rootCerts"], 64))
+    return f"-----BEGIN CERTIFICATE-----\n{body}\n-----END CERTIFICATE-----\n"
+
+
+def test_parse() -> None:
+    """Test getting the values SSL Labs reports about certificates."""
+    store = RootStore.from_pem(load_fixture("root_certs")["rootCerts"], TrustStore.MOZILLA)
+    (cert,) = store
+    assert cert.subject == SUBJECT
+    assert cert.issuer == SUBJECT
+    assert cert.sha256 == SHA256
+    assert cert.pin == PIN
+    assert cert.trust_stores == {TrustStore.MOZILLA}
+
+
+def test_lookups() -> None:
+    """Test looking up certificates of multiple trust stores."""
+    store = RootStore.from_pem(_pem() * 2, TrustStore.MOZILLA)
+    store.add_pem(_pem(), TrustStore.WINDOWS)
+    assert len(store) == 1
+    cert = store.by_sha256(SHA256.upper())
+    assert cert is not None
+    assert cert.trust_stores == {TrustStore.MOZILLA, TrustStore.WINDOWS}
+    assert store.by_subject(SUBJECT.replace(",", ", ").replace("\\, ", "\\,")) == [cert]
+    assert store.by_pin(PIN) == [cert]
+    assert store.by_sha256("00") is None
+    assert not store.by_subject("CN=Unknown")
+
+    issued: Any = SimpleNamespace(issuerSubject=SUBJECT)
+    assert store.issuers(issued) == [cert]
+    assert store.issuers(issued, TrustStore.WINDOWS) == [cert]
+    assert not store.issuers(issued, TrustStore.JAVA)
+
+
+def test_save(tmp_path: Path) -> None:
+    """Test writing and reading the compact form."""
+    store = RootStore.from_pem(_pem(), TrustStore.MOZILLA)
+    store.add_pem(_pem(), TrustStore.ANDROID)
+    store.save(tmp_path / "roots.bin")
+    loaded = RootStore.load(tmp_path / "roots.bin")
+    (cert,) = loaded
+    assert cert.der == base64.b64decode(load_fixture("root_certs")["rootCerts"])
+    assert cert.trust_stores == {TrustStore.MOZILLA, TrustStore.ANDROID}
+    assert loaded.by_pin(PIN) == [cert]
+
+    (tmp_path / "other.bin").write_bytes(b"other")
+    with pytest.raises(ValueError, match="Not a root store file"):
+        RootStore.load(tmp_path / "other.bin")
+    (tmp_path / "truncated.bin").write_bytes((tmp_path / "roots.bin").read_bytes()[:8])
+    with pytest.raises(ValueError, match="Truncated"):
+        RootStore.load(tmp_path / "truncated.bin")
+
+
+@pytest.mark.parametrize("bundle", ["not base64!", base64.b64encode(b"\x30\x82\xff\xff").decode()])
+def test_malformed(bundle: str) -> None:
+    """Test rejecting malformed certificates."""
+    with pytest.raises(ValueError, match="Malformed"):
+        RootStore.from_pem(bundle)
+
+
+@pytest.mark.asyncio()
+async def test_root_store(httpx_mock: HTTPXMock) -> None:
+    """Test retrieving and indexing multiple trust stores."""
+    httpx_mock.add_response(text=_pem())
+    httpx_mock.add_response(text=_pem())
+    store = await Ssllabs().root_store([TrustStore.MOZILLA, TrustStore.MACOS])
+    (cert,) = store
+    assert cert.trust_stores == {TrustStore.MOZILLA, TrustStore.MACOS}
@@ -0,0 +1,110 @@
+"""Test scheduling of new assessments."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ssllabs.exceptions import DeadlineExceededError
+from ssllabs.scheduler import AssessmentScheduler, Priority
+
+
+async def _order(scheduler: AssessmentScheduler, *waiters: tuple[str, Priority, float | None]) -> list[str]:
+    """Queue waiters behind the current turn and return the order in which they get their turn."""
+    started: list[str] = []
+
+    async def wait(name: str, priority: Priority, deadline: float | None) -> None:
+        await scheduler.acquire(priority, deadline)
+        started.append(name)
+        scheduler.release()
+
+    tasks = [asyncio.ensure_future(wait(*waiter)) for waiter in waiters]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    return started
+
+
+@pytest.mark.asyncio()
+async def test_priority() -> None:
+    """Test serving more urgent classes first."""
+    scheduler = AssessmentScheduler()
+    await scheduler.acquire(Priority.BATCH)
+    order = await _order(
+        scheduler,
+        ("batch", Priority.BATCH, None),
+        ("normal", Priority.NORMAL, None),
+        ("interactive", Priority.INTERACTIVE, None),
+    )
+    assert order == ["interactive", "normal", "batch"]
+    assert scheduler.stats[Priority.BATCH].granted == 2
+    assert scheduler.stats[Priority.INTERACTIVE].granted == 1
+    assert not any(stats.depth for stats in scheduler.stats.values())
+
+
+@pytest.mark.asyncio()
+async def test_deadline_order() -> None:
+    """Test serving the earliest deadline first within a class."""
+    scheduler = AssessmentScheduler()
+    await scheduler.acquire()
+    order = await _order(
+        scheduler,
+        ("none", Priority.NORMAL, None),
+        ("late", Priority.NORMAL, 60.0),
+        ("early", Priority.NORMAL, 30.0),
+    )
+    assert order == ["early", "late", "none"]
+
+
+@pytest.mark.asyncio()
+async def test_aging() -> None:
+    """Test promoting assessments, that waited long."""
+    scheduler = AssessmentScheduler(aging=10.0)
+    await scheduler.acquire()
+    with patch("ssllabs.scheduler.time.monotonic", return_value=0.0):
+        batch = asyncio.ensure_future(scheduler.acquire(Priority.BATCH))
+        await asyncio.sleep(0)
+    with patch("ssllabs.scheduler.time.monotonic", return_value=25.0):
+        normal = asyncio.ensure_future(scheduler.acquire(Priority.NORMAL))
+        await asyncio.sleep(0)
+        scheduler.release()
+    await batch
+    assert not normal.done()
+    assert scheduler.stats[Priority.BATCH].max_wait == 25.0
+    assert scheduler.stats[Priority.BATCH].mean_wait == 25.0
+    scheduler.release()
+    await normal
+
+
+@pytest.mark.asyncio()
+async def test_deadline_exceeded() -> None:
+    """Test giving up assessments, whose deadline passed."""
+    scheduler = AssessmentScheduler()
+    await scheduler.acquire()
+    with pytest.raises(DeadlineExceededError):
+        await scheduler.acquire(Priority.INTERACTIVE, 0.01)
+    assert scheduler.stats[Priority.INTERACTIVE].expired == 1
+    assert scheduler.stats[Priority.INTERACTIVE].depth == 0
+
+
+@pytest.mark.asyncio()
+async def test_cancel() -> None:
+    """Test removing cancelled assessments and passing on turns handed to them."""
+    scheduler = AssessmentScheduler()
+    await scheduler.acquire()
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    assert scheduler.stats[Priority.NORMAL].depth == 1
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert scheduler.stats[Priority.NORMAL].depth == 0
+
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    scheduler.release()
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    # The turn was passed on, so the next assessment may start right away
+    await asyncio.wait_for(scheduler.acquire(), 1)
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterator
 from unittest.mock import patch
 
 import pytest
 from dacite import from_dict
 from httpx import AsyncClient, ConnectTimeout, HTTPStatusError, ReadError, ReadTimeout, TransportError
 
-from ssllabs import EndpointError, Ssllabs, SsllabsOverloadedError
+from ssllabs import (
+    AssessmentCapacity,
+    AssessmentError,
+    AssessmentScheduler,
+    DeadlineExceededError,
+    EndpointError,
+    Poller,
+    Priority,
+    RetryPolicy,
+    Ssllabs,
+    SsllabsOverloadedError,
+)
 from ssllabs.api import Endpoint
 from ssllabs.api._api import SSLLABS_URL
+from ssllabs.data.endpoint import EndpointData
 from ssllabs.data.host import HostData
 from ssllabs.data.info import InfoData
+from ssllabs.decoder import decode
+from ssllabs.raw import RawResponse
 
 from . import load_fixture
 
@@ -45,7 +60,7 @@ async def test_unavailable(exception: type[TransportError], httpx_mock: HTTPXMoc
 async def test_overloaded(status_code: int, httpx_mock: HTTPXMock) -> None:
     """Test API being overloaded."""
     httpx_mock.add_response(status_code=status_code)
-    ssllabs = Ssllabs()
+    ssllabs = Ssllabs(retry_policy=RetryPolicy(max_retries=0, circuit_breaker=None))
     with pytest.raises(SsllabsOverloadedError):
         await ssllabs.analyze(host="ssllabs.com")
 
@@ -116,6 +131,44 @@ async def test_analyze_not_ready_yet(httpx_mock: HTTPXMock) -> None:
         await ssllabs.analyze(host=host)
 
 
+@pytest.mark.asyncio()
+async def test_analyze_unchanged_polls(httpx_mock: HTTPXMock) -> None:
+    """Test reusing the previous result, if a poll returns the same response again."""
+    host = "ssllabs.com"
+    httpx_mock.add_response(json=load_fixture("info"), url=f"{SSLLABS_URL}info")
+    httpx_mock.add_response(
+        json=load_fixture("analyze_running"),
+        url=f"{SSLLABS_URL}analyze?host={host}&startNew=on&fromCache=off&publish=off&ignoreMismatch=off&maxAge=",
+    )
+    for fixture in ("analyze_running", "analyze_running", "analyze"):
+        httpx_mock.add_response(json=load_fixture(fixture), url=f"{SSLLABS_URL}analyze?host={host}&all=done")
+
+    with patch("asyncio.sleep"), patch("ssllabs.api.analyze.decode", side_effect=decode) as decoder:
+        result = await Ssllabs().analyze(host=host)
+    assert result.status == "READY"
+    # The first poll returns the same response as the start of the assessment and the second poll the same as the first
+    assert decoder.call_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_analyze_raw(httpx_mock: HTTPXMock) -> None:
+    """Test analyzing a host without decoding the result."""
+    host = "ssllabs.com"
+    httpx_mock.add_response(json=load_fixture("info"), url=f"{SSLLABS_URL}info")
+    httpx_mock.add_response(
+        json=load_fixture("analyze_running"),
+        url=f"{SSLLABS_URL}analyze?host={host}&startNew=on&fromCache=off&publish=off&ignoreMismatch=off&maxAge=",
+    )
+    httpx_mock.add_response(json=load_fixture("analyze"), url=f"{SSLLABS_URL}analyze?host={host}&all=done")
+
+    with patch("asyncio.sleep"):
+        ssllabs = Ssllabs()
+        response = await ssllabs.analyze(host=host, raw=True)
+    assert isinstance(response, RawResponse)
+    assert response.status == "READY"
+    assert response.json() == load_fixture("analyze")
+
+
 @pytest.mark.asyncio()
 async def test_analyze_max_assessments() -> None:
     """Test maximum assessments reached."""
@@ -129,7 +182,7 @@ async def test_analyze_max_assessments() -> None:
             from_dict(data_class=InfoData, data=load_fixture("info")),
         ],
     ):
-        ssllabs = Ssllabs()
+        ssllabs = Ssllabs(capacity=AssessmentCapacity(max_age=0))
         await ssllabs.analyze(host="ssllabs.com")
         sleep.assert_awaited_once()
 
@@ -149,6 +202,292 @@ async def test_analyze_running_assessments() -> None:
         sleep.assert_awaited_once()
 
 
+@pytest.mark.asyncio()
+async def test_analyze_priority() -> None:
+    """Test starting interactive assessments before batch work and giving up assessments past their deadline."""
+    started: list[str] = []
+
+    def analyze(host: str, **_: str) -> HostData:
+        started.append(host)
+        return from_dict(data_class=HostData, data=load_fixture("analyze"))
+
+    with patch("ssllabs.api.analyze.Analyze.get", side_effect=analyze), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        scheduler = AssessmentScheduler()
+        ssllabs = Ssllabs(scheduler=scheduler)
+        await scheduler.acquire()
+        results = asyncio.gather(
+            ssllabs.analyze(host="batch.ssllabs.com", priority=Priority.BATCH),
+            ssllabs.analyze(host="interactive.ssllabs.com", priority=Priority.INTERACTIVE),
+            ssllabs.analyze(host="late.ssllabs.com", priority=Priority.INTERACTIVE, deadline=0.01),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0.05)
+        scheduler.release()
+        *_, late = await results
+    assert started == ["interactive.ssllabs.com", "batch.ssllabs.com"]
+    assert isinstance(late, DeadlineExceededError)
+    assert scheduler.stats[Priority.INTERACTIVE].expired == 1
+
+
+@pytest.mark.asyncio()
+async def test_analyze_deadline_waiting_for_slot() -> None:
+    """Test giving up an assessment, whose deadline passes while waiting for a free slot after getting its turn."""
+    with patch("ssllabs.api.analyze.Analyze.get") as analyze, patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info_max_assessments")),
+    ):
+        scheduler = AssessmentScheduler()
+        ssllabs = Ssllabs(scheduler=scheduler)
+        with pytest.raises(DeadlineExceededError):
+            await asyncio.wait_for(ssllabs.analyze(host="ssllabs.com", deadline=0.01), 1)
+    analyze.assert_not_called()
+    await asyncio.wait_for(scheduler.acquire(), 1)
+
+
+@pytest.mark.asyncio()
+async def test_analyze_error_releases_slot() -> None:
+    """Test starting further assessments after the start of an assessment failed."""
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        return_value=from_dict(data_class=HostData, data=load_fixture("analyze")),
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        side_effect=[OSError, from_dict(data_class=InfoData, data=load_fixture("info"))],
+    ):
+        ssllabs = Ssllabs()
+        with pytest.raises(OSError):  # noqa: PT011
+            await ssllabs.analyze(host="ssllabs.com")
+        await asyncio.wait_for(ssllabs.analyze(host="ssllabs.com"), 1)
+
+
+@pytest.mark.asyncio()
+async def test_analyze_cancel_releases_slot() -> None:
+    """Test starting further assessments after a starting assessment was cancelled."""
+    hanging = asyncio.Event()
+
+    async def analyze(host: str, **_: str) -> HostData:
+        if host == "hanging.ssllabs.com":
+            await hanging.wait()
+        return from_dict(data_class=HostData, data=load_fixture("analyze"))
+
+    with patch("ssllabs.api.analyze.Analyze.get", side_effect=analyze), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs()
+        task = asyncio.ensure_future(ssllabs.analyze(host="hanging.ssllabs.com"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.wait_for(ssllabs.analyze(host="ssllabs.com"), 1)
+
+
+@pytest.mark.asyncio()
+async def test_analyze_timeout() -> None:
+    """Test giving up assessments, that do not finish in time, and not polling them anymore."""
+    poller = Poller()
+    with patch(
+        "ssllabs.api.analyze.Analyze.get",
+        return_value=from_dict(data_class=HostData, data=load_fixture("analyze_running")),
+    ) as analyze, patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs(poller=poller)
+        with pytest.raises(DeadlineExceededError, match="did not finish within"):
+            await ssllabs.analyze(host="ssllabs.com", timeout=0.01)
+        await asyncio.sleep(0)
+    assert not len(poller)
+    analyze.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_analyze_endpoints() -> None:
+    """Test polling summaries and fetching the details of endpoints concurrently."""
+    summary = load_fixture("analyze")
+    summary = {**summary, "endpoints": [{**summary["endpoints"][0], "ipAddress": ip} for ip in ("10.0.0.1", "10.0.0.2")]}
+    arrived: list[str] = []
+    second_arrived = asyncio.Event()
+
+    def on_endpoint(endpoint: EndpointData) -> None:
+        arrived.append(endpoint.ipAddress)
+        second_arrived.set()
+
+    async def endpoint(_: str, s: str) -> EndpointData:
+        # The first endpoint takes longer, so the second one arrives first
+        if s == "10.0.0.1":
+            await second_arrived.wait()
+        return from_dict(data_class=EndpointData, data={**load_fixture("endpoint"), "ipAddress": s})
+
+    with patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=[
+            from_dict(data_class=HostData, data=load_fixture("analyze_running")),
+            from_dict(data_class=HostData, data=summary),
+            from_dict(data_class=HostData, data=summary),
+        ],
+    ) as analyze, patch("ssllabs.api.endpoint.Endpoint.get", side_effect=endpoint), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ), patch(
+        "ssllabs.poller.asyncio.sleep",
+    ):
+        ssllabs = Ssllabs()
+        result = await ssllabs.analyze_endpoints("ssllabs.com", on_endpoint=on_endpoint)
+        assert all("all" not in call.kwargs for call in analyze.await_args_list)
+        assert arrived == ["10.0.0.2", "10.0.0.1"]
+        assert result.endpoints
+        assert [endpoint.details is not None for endpoint in result.endpoints] == [True, True]
+
+        result = await ssllabs.analyze_endpoints("ssllabs.com", ips=["10.0.0.2"])
+        assert result.endpoints
+        assert [endpoint.details is not None for endpoint in result.endpoints] == [False, True]
+
+
+@pytest.mark.asyncio()
+async def test_analyze_coalescing() -> None:
+    """Test concurrent calls for the same host sharing one assessment."""
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=lambda **_: from_dict(data_class=HostData, data=load_fixture("analyze")),
+    ) as analyze, patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs()
+        first, second, cached = await asyncio.gather(
+            ssllabs.analyze(host="ssllabs.com"),
+            ssllabs.analyze(host="ssllabs.com"),
+            ssllabs.analyze(host="ssllabs.com", from_cache=True),
+        )
+    assert first is second
+    assert first is not cached
+    assert analyze.await_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_analyze_many() -> None:
+    """Test analyzing multiple hosts concurrently."""
+    hosts = ["ssllabs.com", "www.ssllabs.com", "example.com"]
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=lambda host, **_: from_dict(data_class=HostData, data={**load_fixture("analyze"), "host": host}),
+    ) as analyze, patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ) as info:
+        ssllabs = Ssllabs()
+        results = [host_data async for host_data in ssllabs.analyze_many(hosts)]
+    assert sorted(host_data.host for host_data in results) == sorted(hosts)
+    assert analyze.await_count == len(hosts)
+    info.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_analyze_many_error() -> None:
+    """Test errors of a single assessment when analyzing multiple hosts."""
+    hosts = ["ssllabs.com", "www.ssllabs.com"]
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=SsllabsOverloadedError,
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs()
+        results = [result async for result in ssllabs.analyze_many(hosts)]
+        assert all(isinstance(result, AssessmentError) for result in results)
+        assert sorted(result.host for result in results if isinstance(result, AssessmentError)) == sorted(hosts)
+
+        with pytest.raises(SsllabsOverloadedError):
+            _ = [result async for result in ssllabs.analyze_many(hosts, return_exceptions=False)]
+
+
+@pytest.mark.asyncio()
+async def test_analyze_many_close() -> None:
+    """Test abandoning running assessments, if no more results are wanted."""
+    real_sleep = asyncio.sleep
+
+    async def yield_control(*_: float) -> None:
+        await real_sleep(0)
+
+    def analyze(host: str, **_: str) -> HostData:
+        fixture = "analyze" if host == "ssllabs.com" else "analyze_running"
+        return from_dict(data_class=HostData, data={**load_fixture(fixture), "host": host})
+
+    capacity = AssessmentCapacity()
+    with patch("asyncio.sleep", side_effect=yield_control), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=analyze,
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs(capacity=capacity)
+        results = ssllabs.analyze_many(["www.ssllabs.com", "ssllabs.com", "example.com"])
+        host_data = await results.__anext__()
+        await results.aclose()
+    assert isinstance(host_data, HostData)
+    assert host_data.host == "ssllabs.com"
+    assert capacity.current_assessments == 0
+
+
+@pytest.mark.asyncio()
+async def test_stream() -> None:
+    """Test streaming results of hosts read from an async source with bounded memory."""
+    real_sleep = asyncio.sleep
+    read = []
+
+    async def yield_control(*_: float) -> None:
+        await real_sleep(0)
+
+    async def read_hosts() -> AsyncIterator[str]:
+        for number in range(100):
+            read.append(number)
+            yield f"{number}.example"
+
+    with patch("asyncio.sleep", side_effect=yield_control), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        side_effect=lambda host, **_: from_dict(data_class=HostData, data={**load_fixture("analyze"), "host": host}),
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs()
+        results = ssllabs.stream(read_hosts(), window=3)
+        await results.__anext__()
+        for _ in range(10):
+            await real_sleep(0)
+        # Three hosts being assessed, three results waiting in the queue and the one consumed
+        assert len(read) <= 7
+        remaining = [host_data async for host_data in results]
+    assert len(remaining) == 99
+    assert len(read) == 100
+
+
+@pytest.mark.asyncio()
+async def test_stream_source_error() -> None:
+    """Test errors reading the hosts are raised."""
+
+    async def read_hosts() -> AsyncIterator[str]:
+        yield "ssllabs.com"
+        raise OSError
+
+    with patch("asyncio.sleep"), patch(
+        "ssllabs.api.analyze.Analyze.get",
+        return_value=from_dict(data_class=HostData, data=load_fixture("analyze")),
+    ), patch(
+        "ssllabs.api.info.Info.get",
+        return_value=from_dict(data_class=InfoData, data=load_fixture("info")),
+    ):
+        ssllabs = Ssllabs()
+        with pytest.raises(OSError):  # noqa: PT011
+            _ = [host_data async for host_data in ssllabs.stream(read_hosts(), window=1)]
+
+
 @pytest.mark.asyncio()
 async def test_info(httpx_mock: HTTPXMock) -> None:
     """Test getting information from SSL Labs."""
@@ -168,6 +507,28 @@ async def test_info_with_client(httpx_mock: HTTPXMock) -> None:
     assert dataclasses.asdict(info) == load_fixture("info")
 
 
+@pytest.mark.asyncio()
+async def test_pooled_client(httpx_mock: HTTPXMock) -> None:
+    """Test sharing a pooled client between all requests."""
+    httpx_mock.add_response(json=load_fixture("info"))
+    httpx_mock.add_response(json=load_fixture("status_codes"))
+    with patch("ssllabs.api._api.AsyncClient") as client_per_request:
+        async with Ssllabs() as ssllabs:
+            await ssllabs.info()
+            await ssllabs.status_codes()
+    client_per_request.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_pooled_client_own_client(httpx_mock: HTTPXMock) -> None:
+    """Test not closing an own client."""
+    httpx_mock.add_response(json=load_fixture("info"))
+    async with AsyncClient() as client:
+        async with Ssllabs(client=client) as ssllabs:
+            await ssllabs.info()
+        assert not client.is_closed
+
+
 @pytest.mark.asyncio()
 async def test_root_certs(httpx_mock: HTTPXMock) -> None:
     """Test getting root certificates."""
@@ -195,6 +556,18 @@ async def test_endpoint(httpx_mock: HTTPXMock) -> None:
     assert dataclasses.asdict(endpoint_data) == load_fixture("endpoint")
 
 
+@pytest.mark.asyncio()
+async def test_endpoint_raw(httpx_mock: HTTPXMock) -> None:
+    """Test endpoint details without decoding them."""
+    httpx_mock.add_response(json=load_fixture("endpoint"))
+    httpx_mock.add_response(json=load_fixture("endpoint_error"))
+    endpoint = Endpoint()
+    response = await endpoint.get_raw("ssllabs.com", "164.41.200.100")
+    assert response.json() == load_fixture("endpoint")
+    with pytest.raises(EndpointError):
+        await endpoint.get_raw("ssllabs.com", "164.41.200.100")
+
+
 @pytest.mark.asyncio()
 async def test_endpoint_without_assessment(httpx_mock: HTTPXMock) -> None:
     """Test endpoint details without preceding assessment."""